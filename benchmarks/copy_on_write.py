@@ -0,0 +1,66 @@
+"""Compare memory and time of copying and copy-on-write rounding.
+
+The payloads are mostly strings, with few numbers that change, so the
+copy_on_write engine can share most containers with the original.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/copy_on_write.py
+"""
+
+import random
+import string
+import timeit
+import tracemalloc
+
+import rounder as r
+
+
+def word():
+    return "".join(random.choices(string.ascii_lowercase, k=8))
+
+
+def documents(n=20_000, numbers=0.1):
+    # a fraction of the documents have a number to round
+    return [
+        {
+            "id": word(),
+            "title": word(),
+            "tags": [word() for _ in range(5)],
+            "author": {"name": word(), "email": word()},
+            "history": [{"event": word(), "by": word()} for _ in range(3)],
+            "score": random.random() if random.random() < numbers else None,
+        }
+        for _ in range(n)
+    ]
+
+
+def retained(rounder, obj):
+    # memory allocated by rounding that stays alive with the result
+    tracemalloc.start()
+    result = rounder(obj)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def measure(name, obj, number=3):
+    print(f"{name}:")
+    for engine in ("recursive", "copy_on_write"):
+        rounder = r.Rounder(round, 2, use_copy=True, engine=engine)
+        seconds = min(
+            timeit.repeat(lambda: rounder(obj), number=number, repeat=3)
+        )
+        size = retained(rounder, obj)
+        print(
+            f"    {engine:>14}: {seconds / number:.4f} s, "
+            f"{size / 2**20:7.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    measure("strings only", documents(numbers=0))
+    measure("numbers in 10% of documents", documents(numbers=0.1))
+    measure("numbers in all documents", documents(numbers=1))
@@ -0,0 +1,44 @@
+"""Measure rounding of Decimals, e.g., in financial ledgers.
+
+Compares round_object() and signif_object() with the plain Python loops
+they replace. Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/decimals.py
+"""
+
+import random
+import time
+from decimal import Decimal
+
+import rounder as r
+
+
+def ledger(n=1_000_000):
+    return [
+        {"amount": Decimal(random.randint(-10**9, 10**9)) / 10_000}
+        for _ in range(n)
+    ]
+
+
+def measure(name, function, obj):
+    start = time.perf_counter()
+    function(obj)
+    print(f"{name:>36}: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    obj = ledger()
+    print(f"{len(obj):,} Decimals:")
+    measure(
+        "loop with round()",
+        lambda obj: [{"amount": round(x["amount"], 2)} for x in obj],
+        obj,
+    )
+    measure("round_object()", lambda obj: r.round_object(obj, 2, True), obj)
+    measure(
+        "round_object(rounding=ROUND_HALF_UP)",
+        lambda obj: r.round_object(obj, 2, True, rounding="ROUND_HALF_UP"),
+        obj,
+    )
+    measure("signif_object()", lambda obj: r.signif_object(obj, 4, True), obj)
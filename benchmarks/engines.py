@@ -0,0 +1,60 @@
+"""Compare the recursive and iterative engines of rounder.Rounder.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/engines.py
+"""
+
+import random
+import timeit
+
+import rounder as r
+
+
+def wide(n=100_000):
+    return [
+        {"a": random.random(), "b": [random.random(), random.random()]}
+        for _ in range(n)
+    ]
+
+
+def deep(depth=300, width=1000):
+    # many chains of nested lists, just within the recursion limit
+    chains = []
+    for _ in range(width):
+        chain = node = []
+        for _ in range(depth):
+            node.append(random.random())
+            node.append([])
+            node = node[-1]
+        chains.append(chain)
+    return chains
+
+
+def very_deep(depth=100_000):
+    chain = node = []
+    for _ in range(depth):
+        node.append(random.random())
+        node.append([])
+        node = node[-1]
+    return chain
+
+
+def measure(name, obj, number=3):
+    print(f"{name}:")
+    for engine in r.rounder.ENGINES:
+        rounder = r.Rounder(round, 2, use_copy=True, engine=engine)
+        seconds = min(
+            timeit.repeat(lambda: rounder(obj), number=number, repeat=3)
+        )
+        print(f"    {engine:>10}: {seconds / number:.4f} s")
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    measure("wide (100k dicts with lists)", wide())
+    measure("deep (1000 chains of 300 nested lists)", deep())
+    measure("flat (1M floats)", [random.random() for _ in range(10**6)])
+    # the recursive engine reaches the recursion limit here, and falls
+    # back to the iterative one
+    measure("very deep (one chain of 100k nested lists)", very_deep())
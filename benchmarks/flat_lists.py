@@ -0,0 +1,94 @@
+"""Measure the fast path for flat lists of floats and ints.
+
+Lists that hold floats and ints only are rounded in one pass of map(),
+while other lists have each item dispatched to its handler. To compare
+the two, each list is rounded as it is and with None appended, which
+makes it go through the generic path. Both backends are measured: the
+compiled one (if rounder._speedups has been built) and pure Python.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/flat_lists.py --sizes 1000 10000000
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import Callable, Dict, List
+
+import rounder as r
+import rounder.rounder as rounder_module
+
+
+def floats(size: int) -> list:
+    return [random.uniform(-1000, 1000) for _ in range(size)]
+
+
+def ints(size: int) -> list:
+    return [random.randint(-(10**6), 10**6) for _ in range(size)]
+
+
+def mixed(size: int) -> list:
+    return [x if i % 2 else round(x) for i, x in enumerate(floats(size))]
+
+
+CASES: Dict[str, Callable[[int], list]] = {
+    "floats": floats,
+    "ints": ints,
+    "floats and ints": mixed,
+}
+
+FUNCTIONS: Dict[str, Callable[[], r.Rounder]] = {
+    "round": lambda: r.Rounder(round, 2, use_copy=True),
+    "floor": lambda: r.Rounder(math.floor, use_copy=True),
+    "signif": lambda: r.Rounder(r.signif, 3, use_copy=True),
+    "map": lambda: r.Rounder(lambda x: 2 * x, use_copy=True),
+}
+
+
+def measure(rounder: r.Rounder, obj: list, repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rounder(obj)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes: List[int], repeat: int) -> None:
+    backends = {"python": None}
+    if rounder_module._speedups is not None:
+        backends["compiled"] = rounder_module._speedups
+    print(
+        f"{'':>8} {'function':>8} {'case':>15} {'size':>9}"
+        f" {'fast path':>10} {'generic':>10} {'ratio':>6}"
+    )
+    for backend, speedups in backends.items():
+        rounder_module._speedups = speedups
+        for function, make_rounder in FUNCTIONS.items():
+            rounder = make_rounder()
+            for case, make_list in CASES.items():
+                for size in sizes:
+                    random.seed(0)
+                    obj = make_list(size)
+                    fast = measure(rounder, obj, repeat)
+                    generic = measure(rounder, obj + [None], repeat)
+                    print(
+                        f"{backend:>8} {function:>8} {case:>15} {size:>9}"
+                        f" {fast:>10.5f} {generic:>10.5f}"
+                        f" {generic / fast:>6.2f}"
+                    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10**3, 10**4, 10**5, 10**6, 10**7],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat)
@@ -0,0 +1,47 @@
+"""Measure how parallel_round_object() scales with the number of workers.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/parallel.py
+"""
+
+import os
+import random
+import time
+
+import rounder as r
+from rounder.parallel import parallel_round_object
+
+
+def records(n=1_000_000):
+    return [
+        {
+            "id": i,
+            "price": random.uniform(0, 1000),
+            "rates": [random.random() for _ in range(5)],
+        }
+        for i in range(n)
+    ]
+
+
+def measure(obj, use_copy=True):
+    start = time.perf_counter()
+    r.round_object(obj, 2, use_copy=True)
+    serial = time.perf_counter() - start
+    print(f"    serial: {serial:.2f} s")
+    workers = 1
+    while workers <= 2 * (os.cpu_count() or 1):
+        start = time.perf_counter()
+        parallel_round_object(obj, 2, use_copy, workers=workers)
+        seconds = time.perf_counter() - start
+        print(
+            f"    {workers:>2} workers: {seconds:.2f} s "
+            f"({serial / seconds:.2f}x)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"1M records on {os.cpu_count()} CPUs:")
+    measure(records())
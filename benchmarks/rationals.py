@@ -0,0 +1,58 @@
+"""Measure rounding of Fractions with big numerators and denominators.
+
+Exact results of symbolic computations, here partial sums of the harmonic
+series, are rounded with round_object(), signif_object() and
+floor_object(), and compared with what rounder did before it rounded
+Fractions with integer arithmetic: calling round() and math.floor() for
+each Fraction, and going through floats for significant digits. Run
+from the repository root:
+
+    PYTHONPATH=. python benchmarks/rationals.py
+"""
+
+import math
+import time
+from fractions import Fraction
+
+import rounder as r
+
+
+def harmonic_numbers(n=3_000):
+    numbers = []
+    total = Fraction(0)
+    for k in range(1, n + 1):
+        total += Fraction(1, k)
+        numbers.append(total)
+    return numbers
+
+
+def float_signif(x, digits):
+    # signif() of Fractions before, through floats
+    d = math.ceil(math.log10(abs(x)))
+    magnitude = math.pow(10, digits - d)
+    return Fraction(round(x * magnitude) / magnitude)
+
+
+def measure(name, function, obj):
+    best = math.inf
+    for _ in range(3):
+        start = time.perf_counter()
+        function(obj)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:>32}: {best:.4f} s")
+
+
+if __name__ == "__main__":
+    obj = harmonic_numbers()
+    digits = len(str(obj[-1].numerator))
+    print(f"{len(obj):,} Fractions, up to {digits:,} digits long:")
+    measure("round() for each", lambda o: [round(x, 6) for x in o], obj)
+    measure("round_object()", lambda o: r.round_object(o, 6, True), obj)
+    measure("math.floor() for each", lambda o: [math.floor(x) for x in o], obj)
+    measure("floor_object()", lambda o: r.floor_object(o, True), obj)
+    measure(
+        "signif() through floats",
+        lambda o: [float_signif(x, 6) for x in o],
+        obj,
+    )
+    measure("signif_object()", lambda o: r.signif_object(o, 6, True), obj)
@@ -0,0 +1,125 @@
+"""Measure converters compiled for records of a fixed shape.
+
+rounder.compile() generates a converter for records shaped like an
+example; it is compared with round_object() and with a Rounder created
+once, for a stream of records of each shape, and with round_records(),
+which rounds the whole list of flat records column by column (and hands
+nested ones to round_object(), in a single call). Both backends of
+Rounder are measured: the compiled one (if rounder._speedups has been
+built) and pure Python.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/records.py --size 100000
+"""
+
+import argparse
+import dataclasses
+import math
+import random
+import time
+from collections import namedtuple
+from copy import deepcopy
+from typing import Any, Callable, Dict, List
+
+import rounder as r
+import rounder.rounder as rounder_module
+
+Point = namedtuple("Point", "lat lon")
+
+
+@dataclasses.dataclass
+class Item:
+    name: str
+    price: float
+    quantity: int
+
+
+def flat(i: int) -> dict:
+    return {
+        "id": i,
+        "name": f"record {i}",
+        "price": random.uniform(0, 100),
+        "tax": random.uniform(0, 10),
+        "discount": None,
+        "score": random.random(),
+    }
+
+
+def nested(i: int) -> dict:
+    return {
+        "id": i,
+        "location": Point(random.uniform(-90, 90), random.uniform(0, 180)),
+        "items": [
+            Item("a", random.uniform(0, 100), 2),
+            Item("b", random.uniform(0, 100), 1),
+        ],
+        "totals": {"net": random.uniform(0, 100), "gross": 12.5},
+    }
+
+
+CASES: Dict[str, Callable[[int], Any]] = {"flat": flat, "nested": nested}
+
+
+def measure(convert: Callable, records: List[Any], repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        data = deepcopy(records)
+        start = time.perf_counter()
+        for record in data:
+            convert(record)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_list(convert: Callable, records: List[Any], repeat: int) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        data = deepcopy(records)
+        start = time.perf_counter()
+        convert(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(size: int, repeat: int) -> None:
+    backends = {"python": None}
+    if rounder_module._speedups is not None:
+        backends["compiled"] = rounder_module._speedups
+    print(
+        f"{'':>8} {'case':>7} {'use_copy':>8} {'compile':>9}"
+        f" {'Rounder':>9} {'round_object':>12} {'round_records':>13}"
+    )
+    for backend, speedups in backends.items():
+        rounder_module._speedups = speedups
+        r.cache_clear()
+        for case, make_record in CASES.items():
+            random.seed(0)
+            records = [make_record(i) for i in range(size)]
+            for use_copy in (False, True):
+                converters = [
+                    r.compile(records[0], 2, use_copy),
+                    r.Rounder(round, 2, use_copy),
+                    lambda obj: r.round_object(obj, 2, use_copy),
+                ]
+                times = [measure(c, records, repeat) for c in converters]
+                times.append(
+                    measure_list(
+                        lambda obj: r.round_records(obj, 2, use_copy),
+                        records,
+                        repeat,
+                    )
+                )
+                print(
+                    f"{backend:>8} {case:>7} {use_copy!s:>8}"
+                    f" {times[0]:>9.4f} {times[1]:>9.4f} {times[2]:>12.4f}"
+                    f" {times[3]:>13.4f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.size, args.repeat)
@@ -0,0 +1,226 @@
+"""Benchmark the rounder functions for many types of objects and sizes.
+
+Each function (round_object, signif_object, floor_object, ceil_object and
+map_object) is timed for each case (a type of object) and size, with
+use_copy both True and False. Every measurement uses a freshly built
+object, and the best of a few repetitions is kept.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/run.py --output results.json
+
+Results are written as JSON, so that those of two versions can be
+compared:
+
+    PYTHONPATH=. python benchmarks/run.py --compare results.json
+"""
+
+import argparse
+import array
+import datetime
+import json
+import platform
+import random
+import sys
+import time
+from collections import deque, namedtuple
+from typing import Any, Callable, Dict, List, Optional
+
+import rounder as r
+
+
+Point = namedtuple("Point", "x y z")
+
+
+class Record:
+    def __init__(self, x, y, label):
+        self.x = x
+        self.y = y
+        self.label = label
+
+
+def flat_list(size: int) -> list:
+    return [random.uniform(-1000, 1000) for _ in range(size)]
+
+
+def float_array(size: int) -> array.array:
+    return array.array("d", flat_list(size))
+
+
+def nested_dicts(size: int) -> dict:
+    # about size numbers, in dicts nested three levels deep
+    return {
+        f"group {i}": {
+            f"item {j}": {"price": random.random(), "amount": j}
+            for j in range(10)
+        }
+        for i in range(max(size // 20, 1))
+    }
+
+
+def deque_of_floats(size: int) -> deque:
+    return deque(flat_list(size))
+
+
+def namedtuples(size: int) -> list:
+    return [Point(*flat_list(3)) for _ in range(max(size // 3, 1))]
+
+
+def instances(size: int) -> list:
+    return [
+        Record(random.random(), [random.random()], "label")
+        for _ in range(max(size // 2, 1))
+    ]
+
+
+def deep_tree(size: int, depth: int = 200) -> list:
+    # chains of lists nested depth levels deep, with size numbers in all
+    chains = []
+    for _ in range(max(size // depth, 1)):
+        chain = node = []
+        for _ in range(depth):
+            node.append(random.random())
+            node.append([])
+            node = node[-1]
+        chains.append(chain)
+    return chains
+
+
+CASES: Dict[str, Callable[[int], Any]] = {
+    "flat list": flat_list,
+    "array.array": float_array,
+    "nested dicts": nested_dicts,
+    "deque": deque_of_floats,
+    "namedtuples": namedtuples,
+    "instances": instances,
+    "deep tree": deep_tree,
+}
+
+
+def double(x):
+    return 2 * x
+
+
+FUNCTIONS: Dict[str, Callable[[Any, bool], Any]] = {
+    "round_object": lambda obj, use_copy: r.round_object(obj, 2, use_copy),
+    "signif_object": lambda obj, use_copy: r.signif_object(obj, 3, use_copy),
+    "floor_object": lambda obj, use_copy: r.floor_object(obj, use_copy),
+    "ceil_object": lambda obj, use_copy: r.ceil_object(obj, use_copy),
+    "map_object": lambda obj, use_copy: r.map_object(double, obj, use_copy),
+}
+
+
+def measure(
+    function: Callable, case: Callable, size: int, use_copy: bool, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        obj = case(size)
+        start = time.perf_counter()
+        function(obj, use_copy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(
+    functions: List[str], cases: List[str], sizes: List[int], repeat: int
+) -> List[Dict[str, Any]]:
+    results = []
+    for function in functions:
+        for case in cases:
+            for size in sizes:
+                for use_copy in (False, True):
+                    random.seed(0)
+                    seconds = measure(
+                        FUNCTIONS[function],
+                        CASES[case],
+                        size,
+                        use_copy,
+                        repeat,
+                    )
+                    results.append(
+                        {
+                            "function": function,
+                            "case": case,
+                            "size": size,
+                            "use_copy": use_copy,
+                            "seconds": seconds,
+                        }
+                    )
+                    print(
+                        f"{function:>14} {case:>13} {size:>8} "
+                        f"use_copy={use_copy!s:<5} {seconds:.6f} s",
+                        file=sys.stderr,
+                    )
+    return results
+
+
+def key(result: Dict[str, Any]) -> tuple:
+    return (
+        result["function"],
+        result["case"],
+        result["size"],
+        result["use_copy"],
+    )
+
+
+def compare(results: List[Dict[str, Any]], baseline_file: str) -> None:
+    with open(baseline_file, encoding="utf-8") as file:
+        baseline = {key(b): b["seconds"] for b in json.load(file)["results"]}
+    print(f"\nCompared with {baseline_file} (ratio > 1 means slower now):")
+    for result in results:
+        before = baseline.get(key(result))
+        if before:
+            function, case, size, use_copy = key(result)
+            print(
+                f"{function:>14} {case:>13} {size:>8} "
+                f"use_copy={use_copy!s:<5} {result['seconds'] / before:.2f}"
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="numbers of numbers in an object (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--functions",
+        nargs="+",
+        choices=list(FUNCTIONS),
+        default=list(FUNCTIONS),
+    )
+    parser.add_argument(
+        "--cases", nargs="+", choices=list(CASES), default=list(CASES)
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="measurements per result; the best one is kept",
+    )
+    parser.add_argument("--output", help="JSON file to write results to")
+    parser.add_argument(
+        "--compare", help="JSON file with earlier results to compare with"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.functions, args.cases, args.sizes, args.repeat)
+    report = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
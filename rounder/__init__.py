@@ -1,9 +1,48 @@
 from .rounder import (
     map_object,
     round_object,
+    round_object_async,
     floor_object,
     ceil_object,
     signif_object,
     signif,
-    map_object_clean
+    signif_many,
+    map_object_clean,
+    Rounder,
+    cache_info,
+    cache_clear,
+    set_cache_maxsize,
+    register_type,
+    RoundingStats,
+    collect_stats,
+    round_by_policy,
+    RoundingPolicy,
+    Signif,
+    compile,
+    round_records,
 )
+
+# compile() is left out, so that "from rounder import *" does not shadow
+# the built-in compile(); use it as rounder.compile()
+__all__ = [
+    "map_object",
+    "round_object",
+    "round_object_async",
+    "floor_object",
+    "ceil_object",
+    "signif_object",
+    "signif",
+    "signif_many",
+    "map_object_clean",
+    "Rounder",
+    "cache_info",
+    "cache_clear",
+    "set_cache_maxsize",
+    "register_type",
+    "RoundingStats",
+    "collect_stats",
+    "round_by_policy",
+    "RoundingPolicy",
+    "Signif",
+    "round_records",
+]
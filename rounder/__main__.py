@@ -0,0 +1,69 @@
+"""Command-line interface: round numbers in a JSON or NDJSON file.
+
+Usage: python -m rounder [-d DIGITS] [-m METHOD] [--ndjson] [src] [dst]
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .stream import METHODS, round_json
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m rounder",
+        description=(
+            "Round numbers in a JSON or NDJSON document, reading it "
+            "incrementally so that its size is not limited by memory."
+        ),
+    )
+    parser.add_argument(
+        "src", nargs="?", default="-", help="input file (default: stdin)"
+    )
+    parser.add_argument(
+        "dst", nargs="?", default="-", help="output file (default: stdout)"
+    )
+    parser.add_argument(
+        "-d",
+        "--digits",
+        type=int,
+        help=(
+            "number of decimal (or significant) digits "
+            "(default: 0, or 3 for signif)"
+        ),
+    )
+    parser.add_argument(
+        "-m",
+        "--method",
+        choices=list(METHODS),
+        default="round",
+        help="rounding method (default: round)",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="treat the input as newline-delimited JSON",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="number of processes for NDJSON input (0: one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        round_json(
+            sys.stdin if args.src == "-" else args.src,
+            sys.stdout if args.dst == "-" else args.dst,
+            digits=args.digits,
+            method=args.method,
+            ndjson=args.ndjson,
+            workers=args.workers,
+        )
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+/* Compiled counterpart of the convert() function of the recursive engine.
+ *
+ * A Converter is called as converter(obj, memo), like convert(): it
+ * rounds floats and ints, converts lists, tuples, sets, frozensets and
+ * dicts itself, and passes other objects to their handlers, found in the
+ * dispatch table of the Rounder. The handlers of these containers are
+ * given to the Converter, so that a type whose handler has been replaced
+ * (with rounder.register_type()) is left to its new handler. The results
+ * are the same as those of the pure-Python code in rounder.py, which is
+ * used when this module is not available.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stddef.h>
+
+#if PY_VERSION_HEX < 0x03090000
+#define Py_TPFLAGS_HAVE_VECTORCALL _Py_TPFLAGS_HAVE_VECTORCALL
+#define PyObject_Vectorcall _PyObject_Vectorcall
+#endif
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *func;
+    PyObject *digits;          /* NULL if func takes the number only */
+    PyObject *many_kernel;     /* NULL if there is none */
+    PyObject *dispatch_table;
+    PyObject *convert_rest;
+    PyObject *convert_list;
+    PyObject *convert_collection;
+    PyObject *convert_dict;
+    int use_copy;
+    vectorcallfunc vectorcall;
+} Converter;
+
+static PyObject *convert(Converter *self, PyObject *obj, PyObject *memo);
+
+static PyObject *
+call_handler(PyObject *handler, PyObject *obj, PyObject *memo)
+{
+    PyObject *args[2] = {obj, memo};
+    return PyObject_Vectorcall(handler, args, 2, NULL);
+}
+
+static PyObject *
+round_number(Converter *self, PyObject *x)
+{
+    PyObject *args[2] = {x, self->digits};
+    return PyObject_Vectorcall(
+        self->func, args, self->digits == NULL ? 1 : 2, NULL);
+}
+
+/* memo maps id(obj) to (obj, result); returns a new reference to the
+   result, or NULL, with an exception set only if the lookup failed */
+static PyObject *
+memo_get(PyObject *memo, PyObject *key)
+{
+    PyObject *pair = PyDict_GetItemWithError(memo, key);
+    if (pair == NULL) {
+        return NULL;
+    }
+    if (PyTuple_CheckExact(pair) && PyTuple_GET_SIZE(pair) == 2) {
+        PyObject *result = PyTuple_GET_ITEM(pair, 1);
+        Py_INCREF(result);
+        return result;
+    }
+    return PySequence_GetItem(pair, 1);
+}
+
+static int
+memo_set(PyObject *memo, PyObject *key, PyObject *obj, PyObject *result)
+{
+    PyObject *pair = PyTuple_Pack(2, obj, result);
+    if (pair == NULL) {
+        return -1;
+    }
+    int status = PyDict_SetItem(memo, key, pair);
+    Py_DECREF(pair);
+    return status;
+}
+
+static int
+all_floats(PyObject *list)
+{
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+        if (!PyFloat_CheckExact(PyList_GET_ITEM(list, i))) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+/* converted items of a list, like convert_items() */
+static PyObject *
+convert_items(Converter *self, PyObject *obj, PyObject *memo)
+{
+    if (self->many_kernel != NULL && all_floats(obj)) {
+        PyObject *args[2] = {obj, self->digits};
+        return PyObject_Vectorcall(
+            self->many_kernel, args, self->digits == NULL ? 1 : 2, NULL);
+    }
+    PyObject *values = PyList_New(0);
+    if (values == NULL) {
+        return NULL;
+    }
+    /* the list can change while its items are converted */
+    for (Py_ssize_t i = 0; i < PyList_GET_SIZE(obj); i++) {
+        PyObject *item = PyList_GET_ITEM(obj, i);
+        Py_INCREF(item);
+        PyObject *value = convert(self, item, memo);
+        Py_DECREF(item);
+        if (value == NULL || PyList_Append(values, value) < 0) {
+            Py_XDECREF(value);
+            Py_DECREF(values);
+            return NULL;
+        }
+        Py_DECREF(value);
+    }
+    return values;
+}
+
+static PyObject *
+convert_list(Converter *self, PyObject *obj, PyObject *memo, PyObject *key)
+{
+    PyObject *return_obj;
+    if (self->use_copy) {
+        return_obj = PyList_New(0);
+        if (return_obj == NULL) {
+            return NULL;
+        }
+    }
+    else {
+        return_obj = obj;
+        Py_INCREF(return_obj);
+    }
+    if (memo_set(memo, key, obj, return_obj) < 0) {
+        Py_DECREF(return_obj);
+        return NULL;
+    }
+    PyObject *values = convert_items(self, obj, memo);
+    if (values == NULL) {
+        Py_DECREF(return_obj);
+        return NULL;
+    }
+    int status = PyList_SetSlice(return_obj, 0, PY_SSIZE_T_MAX, values);
+    Py_DECREF(values);
+    if (status < 0) {
+        Py_DECREF(return_obj);
+        return NULL;
+    }
+    return return_obj;
+}
+
+/* tuples, sets and frozensets, like convert_tuple_set_frozenset() */
+static PyObject *
+convert_collection(
+    Converter *self, PyObject *obj, PyObject *memo, PyObject *key)
+{
+    PyObject *values = PyList_New(0);
+    if (values == NULL) {
+        return NULL;
+    }
+    PyObject *iterator = PyObject_GetIter(obj);
+    if (iterator == NULL) {
+        Py_DECREF(values);
+        return NULL;
+    }
+    PyObject *item;
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        PyObject *value = convert(self, item, memo);
+        Py_DECREF(item);
+        if (value == NULL || PyList_Append(values, value) < 0) {
+            Py_XDECREF(value);
+            break;
+        }
+        Py_DECREF(value);
+    }
+    Py_DECREF(iterator);
+    if (PyErr_Occurred()) {
+        Py_DECREF(values);
+        return NULL;
+    }
+
+    /* created already, through a reference cycle */
+    PyObject *return_obj = memo_get(memo, key);
+    if (return_obj != NULL || PyErr_Occurred()) {
+        Py_DECREF(values);
+        return return_obj;
+    }
+    if (PyTuple_CheckExact(obj)) {
+        return_obj = PyList_AsTuple(values);
+    }
+    else if (PySet_CheckExact(obj)) {
+        return_obj = PySet_New(values);
+    }
+    else {
+        return_obj = PyFrozenSet_New(values);
+    }
+    Py_DECREF(values);
+    if (return_obj != NULL && memo_set(memo, key, obj, return_obj) < 0) {
+        Py_CLEAR(return_obj);
+    }
+    return return_obj;
+}
+
+static PyObject *
+convert_dict(Converter *self, PyObject *obj, PyObject *memo, PyObject *key)
+{
+    PyObject *return_obj;
+    if (self->use_copy) {
+        return_obj = PyDict_New();
+        if (return_obj == NULL) {
+            return NULL;
+        }
+    }
+    else {
+        return_obj = obj;
+        Py_INCREF(return_obj);
+    }
+    if (memo_set(memo, key, obj, return_obj) < 0) {
+        Py_DECREF(return_obj);
+        return NULL;
+    }
+    Py_ssize_t size = PyDict_GET_SIZE(obj);
+    Py_ssize_t pos = 0;
+    PyObject *k, *v;
+    while (PyDict_Next(obj, &pos, &k, &v)) {
+        Py_INCREF(k);
+        Py_INCREF(v);
+        PyObject *value = convert(self, v, memo);
+        Py_DECREF(v);
+        int status = value == NULL ? -1 : PyDict_SetItem(return_obj, k, value);
+        Py_DECREF(k);
+        Py_XDECREF(value);
+        if (status < 0) {
+            Py_DECREF(return_obj);
+            return NULL;
+        }
+        if (PyDict_GET_SIZE(obj) != size) {
+            PyErr_SetString(
+                PyExc_RuntimeError, "dictionary changed size during iteration");
+            Py_DECREF(return_obj);
+            return NULL;
+        }
+    }
+    return return_obj;
+}
+
+typedef PyObject *(*container_converter)(
+    Converter *, PyObject *, PyObject *, PyObject *);
+
+static PyObject *
+convert_container(
+    Converter *self, PyObject *obj, PyObject *memo,
+    container_converter converter)
+{
+    PyObject *key = PyLong_FromVoidPtr(obj);
+    if (key == NULL) {
+        return NULL;
+    }
+    PyObject *return_obj = memo_get(memo, key);
+    if (return_obj == NULL && !PyErr_Occurred()) {
+        if (Py_EnterRecursiveCall(" while rounding an object") == 0) {
+            return_obj = converter(self, obj, memo, key);
+            Py_LeaveRecursiveCall();
+        }
+    }
+    Py_DECREF(key);
+    return return_obj;
+}
+
+static PyObject *
+convert(Converter *self, PyObject *obj, PyObject *memo)
+{
+    PyTypeObject *type = Py_TYPE(obj);
+    if (type == &PyFloat_Type || type == &PyLong_Type) {
+        return round_number(self, obj);
+    }
+    PyObject *handler = PyDict_GetItemWithError(
+        self->dispatch_table, (PyObject *)type);
+    if (handler == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        return call_handler(self->convert_rest, obj, memo);
+    }
+    if (handler == self->convert_list && type == &PyList_Type) {
+        return convert_container(self, obj, memo, convert_list);
+    }
+    if (handler == self->convert_dict && type == &PyDict_Type) {
+        return convert_container(self, obj, memo, convert_dict);
+    }
+    if (handler == self->convert_collection && (
+            type == &PyTuple_Type || type == &PySet_Type
+            || type == &PyFrozenSet_Type)) {
+        return convert_container(self, obj, memo, convert_collection);
+    }
+    /* the dispatch table can change while the handler runs */
+    Py_INCREF(handler);
+    PyObject *result = call_handler(handler, obj, memo);
+    Py_DECREF(handler);
+    return result;
+}
+
+static PyObject *
+Converter_vectorcall(
+    PyObject *self, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    if (kwnames != NULL && PyTuple_GET_SIZE(kwnames) > 0) {
+        PyErr_SetString(
+            PyExc_TypeError, "Converter takes no keyword arguments");
+        return NULL;
+    }
+    if (nargs != 2) {
+        PyErr_Format(
+            PyExc_TypeError, "Converter takes 2 arguments (%zd given)",
+            nargs);
+        return NULL;
+    }
+    if (!PyDict_Check(args[1])) {
+        PyErr_SetString(PyExc_TypeError, "memo must be a dict");
+        return NULL;
+    }
+    return convert((Converter *)self, args[0], args[1]);
+}
+
+static PyObject *
+Converter_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {
+        "func", "digits", "use_copy", "many_kernel", "dispatch_table",
+        "convert_rest", "convert_list", "convert_collection",
+        "convert_dict", NULL};
+    PyObject *func, *digits, *many_kernel, *dispatch_table, *convert_rest;
+    PyObject *list_handler, *collection_handler, *dict_handler;
+    int use_copy;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwargs, "OO!pOO!OOOO:Converter", kwlist, &func,
+            &PyTuple_Type, &digits, &use_copy, &many_kernel,
+            &PyDict_Type, &dispatch_table, &convert_rest, &list_handler,
+            &collection_handler, &dict_handler)) {
+        return NULL;
+    }
+    if (PyTuple_GET_SIZE(digits) > 1) {
+        PyErr_SetString(PyExc_ValueError, "digits must have at most 1 item");
+        return NULL;
+    }
+    Converter *self = (Converter *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    Py_INCREF(func);
+    self->func = func;
+    if (PyTuple_GET_SIZE(digits) == 1) {
+        self->digits = PyTuple_GET_ITEM(digits, 0);
+        Py_INCREF(self->digits);
+    }
+    if (many_kernel != Py_None) {
+        Py_INCREF(many_kernel);
+        self->many_kernel = many_kernel;
+    }
+    Py_INCREF(dispatch_table);
+    self->dispatch_table = dispatch_table;
+    Py_INCREF(convert_rest);
+    self->convert_rest = convert_rest;
+    Py_INCREF(list_handler);
+    self->convert_list = list_handler;
+    Py_INCREF(collection_handler);
+    self->convert_collection = collection_handler;
+    Py_INCREF(dict_handler);
+    self->convert_dict = dict_handler;
+    self->use_copy = use_copy;
+    self->vectorcall = Converter_vectorcall;
+    return (PyObject *)self;
+}
+
+/* A Converter and the closures of its Rounder refer to each other. */
+static int
+Converter_traverse(Converter *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->func);
+    Py_VISIT(self->digits);
+    Py_VISIT(self->many_kernel);
+    Py_VISIT(self->dispatch_table);
+    Py_VISIT(self->convert_rest);
+    Py_VISIT(self->convert_list);
+    Py_VISIT(self->convert_collection);
+    Py_VISIT(self->convert_dict);
+    return 0;
+}
+
+static int
+Converter_clear(Converter *self)
+{
+    Py_CLEAR(self->func);
+    Py_CLEAR(self->digits);
+    Py_CLEAR(self->many_kernel);
+    Py_CLEAR(self->dispatch_table);
+    Py_CLEAR(self->convert_rest);
+    Py_CLEAR(self->convert_list);
+    Py_CLEAR(self->convert_collection);
+    Py_CLEAR(self->convert_dict);
+    return 0;
+}
+
+static void
+Converter_dealloc(Converter *self)
+{
+    PyObject_GC_UnTrack(self);
+    Converter_clear(self);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyTypeObject ConverterType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "rounder._speedups.Converter",
+    .tp_doc = PyDoc_STR(
+        "Converter(func, digits, use_copy, many_kernel, dispatch_table, "
+        "convert_rest, convert_list, convert_collection, convert_dict)\n\n"
+        "Compiled convert(obj, memo) of the recursive engine."),
+    .tp_basicsize = sizeof(Converter),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC
+                | Py_TPFLAGS_HAVE_VECTORCALL,
+    .tp_new = Converter_new,
+    .tp_traverse = (traverseproc)Converter_traverse,
+    .tp_clear = (inquiry)Converter_clear,
+    .tp_dealloc = (destructor)Converter_dealloc,
+    .tp_vectorcall_offset = offsetof(Converter, vectorcall),
+    .tp_call = PyVectorcall_Call,
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "rounder._speedups",
+    .m_doc = PyDoc_STR("Compiled core of the recursive engine of rounder."),
+    .m_size = -1,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    if (PyType_Ready(&ConverterType) < 0) {
+        return NULL;
+    }
+    PyObject *module = PyModule_Create(&speedups_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&ConverterType);
+    if (PyModule_AddObject(
+            module, "Converter", (PyObject *)&ConverterType) < 0) {
+        Py_DECREF(&ConverterType);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,429 @@
+"""JSON encoding with numbers rounded while they are encoded.
+
+dumps(), dump() and RoundingJSONEncoder give the same output as
+json.dumps() of the object rounded with round_object() (digits) or
+signif_object() (signif), but the rounded copy of the object is never
+created: each number is rounded right before it is written. Unlike
+round_object(), they do not round numbers to 0 digits by default: if
+neither digits nor signif is given, numbers are written as they are.
+
+>>> dumps({"a": [1.2345, 12345], "b": (0.0012345, "1.2345")}, digits=2)
+'{"a": [1.23, 12345], "b": [0.0, "1.2345"]}'
+>>> dumps({"a": [1.2345, 12345], "b": (0.0012345, "1.2345")}, signif=3)
+'{"a": [1.23, 12300], "b": [0.00123, "1.2345"]}'
+
+As in rounder.stream, booleans are kept as JSON's true and false, while
+round_object() would turn them into 1 and 0. Keys of dicts are never
+rounded, like in round_object(). A number that cannot be rounded (like
+NaN, to significant digits) is written as it is, while signif_object()
+would return the whole object unrounded.
+
+Objects that json cannot encode, but rounder can round, are encoded,
+too: deques, array.arrays, sets and frozensets, ranges and iterators as
+JSON arrays, mappings and class instances (their attributes, from
+__dict__ and __slots__) as JSON objects, and Decimals as exact JSON
+numbers:
+
+>>> import collections, decimal
+>>> Point = collections.namedtuple("Point", "x y")
+>>> dumps([Point(1.2345, 2), collections.deque([decimal.Decimal("3.456")])],
+...       digits=1)
+'[[1.2, 2], [3.5]]'
+"""
+
+import array
+import builtins
+import io
+import json
+from collections import deque
+from collections.abc import Iterator, Mapping
+from decimal import Decimal
+from fractions import Fraction
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import IO, Any, Callable, Dict, Optional, Type
+
+from .rounder import _frozen_fields, _get_rounder, _slot_names, signif
+
+INFINITY = float("inf")
+
+
+def _get_round_number(
+    digits: Optional[int], signif_digits: Optional[int]
+) -> Callable[[Any], Any]:
+    if digits is not None and signif_digits is not None:
+        raise ValueError("digits and signif cannot be given together")
+    if digits is None and signif_digits is None:
+        return lambda x: x
+    func: Callable[[Any, int], Any]
+    if signif_digits is not None:
+        func, n = signif, signif_digits
+    else:
+        assert digits is not None
+        func, n = builtins.round, digits
+    # the same Rounder as round_object() and signif_object() use, for
+    # numbers other than floats and ints (e.g., Decimals)
+    rounder = _get_rounder(func, [n], False)
+
+    def round_number(x):
+        if type(x) in (float, int):
+            try:
+                return func(x, n)
+            except (ValueError, OverflowError):  # e.g., signif of NaN
+                return x
+        return rounder(x)
+
+    return round_number
+
+
+def _attributes(obj: Any) -> Optional[Dict[str, Any]]:
+    # The attributes that round_object() rounds, or None if it keeps
+    # the object as it is.
+    cls = type(obj)
+    slots = _slot_names(cls)
+    has_dict = hasattr(obj, "__dict__")
+    if (
+        slots
+        and cls.__setattr__ is not object.__setattr__
+        and _frozen_fields(cls) is None
+    ):
+        slots = ()
+        if not has_dict:
+            return None
+    if not slots and not has_dict:
+        return None
+    attributes = {
+        name: getattr(obj, name) for name in slots if hasattr(obj, name)
+    }
+    if has_dict:
+        attributes.update(vars(obj))
+    return attributes
+
+
+class RoundingJSONEncoder(json.JSONEncoder):
+    """JSONEncoder rounding numbers, like round_object() or signif_object().
+
+    Takes the same arguments as json.JSONEncoder, and:
+
+    Args:
+        digits (int, optional): number of decimal digits to round
+            numbers to, as round_object() does. Defaults to None.
+        signif (int, optional): number of significant digits to round
+            numbers to, as signif_object() does. Defaults to None.
+
+    At most one of digits and signif can be given; if neither is,
+    numbers are not rounded.
+
+    >>> RoundingJSONEncoder(signif=2, indent=1).encode({"x": [1.2345]})
+    '{\\n "x": [\\n  1.2\\n ]\\n}'
+    >>> json.dumps([1.2345], cls=RoundingJSONEncoder, digits=1)
+    '[1.2]'
+    """
+
+    def __init__(
+        self,
+        *,
+        digits: Optional[int] = None,
+        signif: Optional[int] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.digits = digits
+        self.signif = signif
+        self._round_number = _get_round_number(digits, signif)
+        self._user_default = default
+
+    def default(self, o: Any) -> Any:
+        """Convert an object that json cannot encode.
+
+        Containers that rounder works with are converted to lists or
+        dicts. Other objects are passed to the default function given to
+        the encoder, if any; otherwise, class instances are converted to
+        dicts of their attributes, and other objects are rejected with
+        TypeError.
+        """
+        if isinstance(o, (deque, array.array, set, frozenset, range)):
+            return list(o)
+        if isinstance(o, Iterator) and not isinstance(o, io.IOBase):
+            return list(o)
+        if isinstance(o, Mapping):
+            return dict(o)
+        if self._user_default is not None:
+            return self._user_default(o)
+        attributes = _attributes(o)
+        if attributes is not None:
+            return attributes
+        return super().default(o)
+
+    def iterencode(self, o: Any, _one_shot: bool = False) -> Any:
+        """Encode the given object, yielding its JSON text in chunks."""
+        if self.check_circular:
+            markers: Optional[dict] = {}
+        else:
+            markers = None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        return _make_iterencode(
+            markers,
+            self.default,
+            _encoder,
+            self.indent,
+            self._round_number,
+            self.allow_nan,
+            self.key_separator,
+            self.item_separator,
+            self.sort_keys,
+            self.skipkeys,
+        )(o, 0)
+
+
+def _make_iterencode(
+    markers,
+    _default,
+    _encoder,
+    _indent,
+    _round_number,
+    _allow_nan,
+    _key_separator,
+    _item_separator,
+    _sort_keys,
+    _skipkeys,
+):
+    # Modelled on the pure-Python encoder of json.encoder, with numbers
+    # rounded (but not dict keys), and Decimals written as they are.
+    if _indent is not None and not isinstance(_indent, str):
+        _indent = " " * _indent
+
+    def _floatstr(o):
+        if o != o:
+            text = "NaN"
+        elif o == INFINITY:
+            text = "Infinity"
+        elif o == -INFINITY:
+            text = "-Infinity"
+        else:
+            return float.__repr__(o)
+        if not _allow_nan:
+            raise ValueError(
+                "Out of range float values are not JSON compliant: "
+                + repr(o)
+            )
+        return text
+
+    def _numberstr(o):
+        value = _round_number(o)
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return _floatstr(value)
+        if isinstance(value, Decimal):
+            if value.is_finite():
+                return str(value)
+            return _floatstr(float(value))
+        if isinstance(value, Fraction):
+            return _floatstr(float(value))
+        raise TypeError(
+            f"Object of type {type(o).__name__} is not JSON serializable"
+        )
+
+    def _is_number(o):
+        return isinstance(o, (int, float, Decimal, Fraction))
+
+    def _keystr(key):
+        if isinstance(key, str):
+            return key
+        if isinstance(key, float):
+            return _floatstr(key)
+        if key is True:
+            return "true"
+        if key is False:
+            return "false"
+        if key is None:
+            return "null"
+        if isinstance(key, int):
+            return int.__repr__(key)
+        if _skipkeys:
+            return None
+        raise TypeError(
+            "keys must be str, int, float, bool or None, "
+            f"not {key.__class__.__name__}"
+        )
+
+    def _enter(o):
+        if markers is not None:
+            markerid = id(o)
+            if markerid in markers:
+                raise ValueError("Circular reference detected")
+            markers[markerid] = o
+            return markerid
+        return None
+
+    def _iterencode_list(lst, _current_indent_level):
+        if not lst:
+            yield "[]"
+            return
+        markerid = _enter(lst)
+        buf = "["
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = "\n" + _indent * _current_indent_level
+            separator = _item_separator + newline_indent
+            buf += newline_indent
+        else:
+            newline_indent = None
+            separator = _item_separator
+        first = True
+        for value in lst:
+            if first:
+                first = False
+            else:
+                buf = separator
+            if isinstance(value, str):
+                yield buf + _encoder(value)
+            elif value is None:
+                yield buf + "null"
+            elif value is True:
+                yield buf + "true"
+            elif value is False:
+                yield buf + "false"
+            elif _is_number(value):
+                yield buf + _numberstr(value)
+            else:
+                yield buf
+                yield from _iterencode(value, _current_indent_level)
+        if newline_indent is not None:
+            _current_indent_level -= 1
+            yield "\n" + _indent * _current_indent_level
+        yield "]"
+        if markerid is not None:
+            del markers[markerid]
+
+    def _iterencode_dict(dct, _current_indent_level):
+        if not dct:
+            yield "{}"
+            return
+        markerid = _enter(dct)
+        yield "{"
+        if _indent is not None:
+            _current_indent_level += 1
+            newline_indent = "\n" + _indent * _current_indent_level
+            item_separator = _item_separator + newline_indent
+            yield newline_indent
+        else:
+            newline_indent = None
+            item_separator = _item_separator
+        first = True
+        items = sorted(dct.items()) if _sort_keys else dct.items()
+        for key, value in items:
+            key = _keystr(key)
+            if key is None:
+                continue
+            if first:
+                first = False
+            else:
+                yield item_separator
+            yield _encoder(key)
+            yield _key_separator
+            if isinstance(value, str):
+                yield _encoder(value)
+            elif value is None:
+                yield "null"
+            elif value is True:
+                yield "true"
+            elif value is False:
+                yield "false"
+            elif _is_number(value):
+                yield _numberstr(value)
+            else:
+                yield from _iterencode(value, _current_indent_level)
+        if newline_indent is not None:
+            _current_indent_level -= 1
+            yield "\n" + _indent * _current_indent_level
+        yield "}"
+        if markerid is not None:
+            del markers[markerid]
+
+    def _iterencode(o, _current_indent_level):
+        if isinstance(o, str):
+            yield _encoder(o)
+        elif o is None:
+            yield "null"
+        elif o is True:
+            yield "true"
+        elif o is False:
+            yield "false"
+        elif _is_number(o):
+            yield _numberstr(o)
+        elif isinstance(o, (list, tuple)):
+            yield from _iterencode_list(o, _current_indent_level)
+        elif isinstance(o, dict):
+            yield from _iterencode_dict(o, _current_indent_level)
+        else:
+            markerid = _enter(o)
+            o = _default(o)
+            yield from _iterencode(o, _current_indent_level)
+            if markerid is not None:
+                del markers[markerid]
+
+    return _iterencode
+
+
+def dumps(
+    obj: Any,
+    digits: Optional[int] = None,
+    signif: Optional[int] = None,
+    *,
+    cls: Type[RoundingJSONEncoder] = RoundingJSONEncoder,
+    **kwargs: Any,
+) -> str:
+    """Serialize an object to JSON, with its numbers rounded.
+
+    The same as json.dumps(round_object(obj, digits, use_copy=True)), or
+    signif_object() for signif, but without rounding a copy of the
+    object first. Unlike in round_object(), digits has no default of 0:
+    if neither digits nor signif is given, numbers are not rounded.
+
+    Args:
+        obj (any): the object to serialize
+        digits (int, optional): number of decimal digits. Defaults to
+            None, which means no rounding unless signif is given.
+        signif (int, optional): number of significant digits, instead of
+            decimal digits. Defaults to None.
+        cls (type, optional): a subclass of RoundingJSONEncoder to use.
+        **kwargs: other arguments of json.dumps(), like indent or
+            sort_keys
+    Returns:
+        str: JSON text
+    >>> dumps({"total": 1234.5678, "items": [0.125, 2]}, 1, indent=None)
+    '{"total": 1234.6, "items": [0.1, 2]}'
+    """
+    return cls(digits=digits, signif=signif, **kwargs).encode(obj)
+
+
+def dump(
+    obj: Any,
+    fp: IO[str],
+    digits: Optional[int] = None,
+    signif: Optional[int] = None,
+    *,
+    cls: Type[RoundingJSONEncoder] = RoundingJSONEncoder,
+    **kwargs: Any,
+) -> None:
+    """Serialize an object as JSON to a file, with its numbers rounded.
+
+    The JSON text is written in chunks, as it is encoded. See dumps().
+
+    Args:
+        obj (any): the object to serialize
+        fp (file): a text file open for writing
+        digits (int, optional): number of decimal digits. Defaults to
+            None, which means no rounding unless signif is given.
+        signif (int, optional): number of significant digits, instead of
+            decimal digits. Defaults to None.
+        cls (type, optional): a subclass of RoundingJSONEncoder to use.
+        **kwargs: other arguments of json.dump()
+    """
+    for chunk in cls(digits=digits, signif=signif, **kwargs).iterencode(obj):
+        fp.write(chunk)
@@ -0,0 +1,143 @@
+"""Rounding of large containers in parallel, in a pool of processes.
+
+A large list, tuple or dict is split into chunks of items, which are
+rounded by separate workers and then put together again, in order.
+Containers below a size threshold, and objects of other types, are
+rounded as usual, in the calling thread:
+
+>>> parallel_round_object([1.2345, {"a": 2.3456}], 2)
+[1.23, {'a': 2.35}]
+
+On free-threaded builds of CPython, the workers are threads, so there is
+no cost of sending the items to other processes and back.
+"""
+
+import itertools
+import os
+import sys
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+from .rounder import _do
+from .stream import DEFAULT_DIGITS, METHODS
+
+
+PARALLEL_MIN_LENGTH = 100_000
+CHUNKS_PER_WORKER = 4
+
+
+def _get_func(
+    method: Union[str, Callable], digits: Optional[int]
+) -> Tuple[Callable, List[int]]:
+    if callable(method):
+        return method, [] if digits is None else [digits]
+    try:
+        func = METHODS[method]
+    except KeyError:
+        raise ValueError(
+            f"method must be one of {', '.join(METHODS)} or a function, "
+            f"not {method!r}"
+        ) from None
+    if method in ("floor", "ceil"):
+        return func, []
+    return func, [DEFAULT_DIGITS[method] if digits is None else digits]
+
+
+def _free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _round_chunk(
+    items: list, func: Callable, digits: List[int], use_copy: bool
+) -> list:
+    return _do(func, items, digits, use_copy)
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def parallel_round_object(
+    obj: Any,
+    digits: Optional[int] = None,
+    use_copy: bool = False,
+    method: Union[str, Callable] = "round",
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    min_length: int = PARALLEL_MIN_LENGTH,
+) -> Any:
+    """Round numbers in a large list, tuple or dict in parallel.
+
+    With a pool of processes, the items travel to the workers and back
+    by pickling, so they must be picklable (as must method, if it is a
+    function), and rounded items are new objects even if use_copy is
+    False; the container itself is still changed inplace, though.
+    Objects shared between items are not shared in the result.
+
+    Args:
+        obj: a list, tuple or dict; objects of other types, and those
+            with fewer than min_length items, are rounded in the calling
+            thread
+        digits (int, optional): number of digits (decimal or significant,
+            depending on method). A function given as method is called
+            with digits only if they are given. Defaults to None, which
+            means 0 for "round" and 3 for "signif", as in round_object()
+            and signif_object().
+        use_copy (bool, optional): use a copy or work with the original
+            object? Defaults to False.
+        method (str or function, optional): "round", "signif", "floor",
+            "ceil", or a function applied to each number. Defaults to
+            "round".
+        workers (int, optional): number of workers of the pool that is
+            created for the call. Defaults to None, which means as many
+            as CPUs.
+        executor (concurrent.futures.Executor, optional): a pool to use
+            instead of creating one (e.g., a ThreadPoolExecutor); it is
+            not shut down afterwards
+        min_length (int, optional): the smallest number of items worth
+            rounding in parallel
+    Returns:
+        the rounded object
+    """
+    func, args = _get_func(method, digits)
+    splittable = isinstance(obj, (list, dict)) or type(obj) is tuple
+    if not splittable or len(obj) < min_length:
+        return _do(func, obj, args, use_copy)
+
+    items = list(obj.values()) if isinstance(obj, dict) else list(obj)
+    workers = workers or os.cpu_count() or 1
+    pool: Optional[Executor] = None
+    if executor is None:
+        if _free_threaded():
+            executor = pool = ThreadPoolExecutor(workers)
+        else:
+            executor = pool = ProcessPoolExecutor(workers)
+    try:
+        size = -(-len(items) // (workers * CHUNKS_PER_WORKER))
+        results = executor.map(
+            _round_chunk,
+            _chunks(items, size),
+            itertools.repeat(func),
+            itertools.repeat(args),
+            itertools.repeat(use_copy),
+        )
+        values = list(itertools.chain.from_iterable(results))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if isinstance(obj, dict):
+        return_obj = type(obj)() if use_copy else obj
+        for k, v in zip(list(obj), values):
+            return_obj[k] = v
+        return return_obj
+    if type(obj) is tuple:
+        return tuple(values)
+    if use_copy:
+        return type(obj)(values)
+    obj[:] = values
+    return obj
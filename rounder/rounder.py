@@ -1,23 +1,78 @@
 import array
+import asyncio
 import builtins
+import contextlib
+import contextvars
 import copy
+import dataclasses
+import decimal
+import fnmatch
+import functools
+import io
+import itertools
 import math
+import operator
+import re
+import sys
+import threading
+import time
 import types
+import typing
+import weakref
 from collections import defaultdict
 from collections import deque
 from collections import OrderedDict
 from collections import defaultdict
 from collections import Counter
+from collections import namedtuple
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Set
+from concurrent.futures import Executor
 from collections import UserList
 from numbers import Number
 from decimal import Decimal
 from fractions import Fraction
-from typing import Any, Callable, Dict, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
+try:
+    from . import _speedups  # type: ignore[attr-defined]
+except ImportError:  # the optional extension has not been built
+    _speedups = None
 
-dispatch_table_store: Dict = {}
+
+_INTEGER_TYPECODES = "bBhHiIlLqQ"
+_FLOAT_TYPECODES = "fd"
+_NUMBER_TYPECODES = _INTEGER_TYPECODES + _FLOAT_TYPECODES
+_NATIVE_BYTE_ORDERS = ("", "@", "=", "<" if sys.byteorder == "little" else ">")
+
+ENGINES = ("recursive", "iterative", "copy_on_write")
+DECIMAL_ROUNDINGS = (
+    decimal.ROUND_HALF_EVEN,
+    decimal.ROUND_HALF_UP,
+    decimal.ROUND_HALF_DOWN,
+    decimal.ROUND_UP,
+    decimal.ROUND_DOWN,
+    decimal.ROUND_CEILING,
+    decimal.ROUND_FLOOR,
+    decimal.ROUND_05UP,
+)
+ASYNC_CHUNK_SIZE = 1000
+# Depth of nesting beyond which the recursive engine goes on iteratively
+# when it cannot start again after RecursionError (see Rounder).
+RECURSIVE_MAX_DEPTH = 100
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
 
 
 def types_lookup(type_name: str) -> Optional[Any]:
@@ -28,152 +83,1615 @@ def types_lookup(type_name: str) -> Optional[Any]:
     return getattr(types, type_name, None)
 
 
-def _do(func, obj, digits, use_copy):
+def _numpy() -> Optional[types.ModuleType]:
+    """Get numpy if it has already been imported, None otherwise.
 
-    if type(obj) in (float, int):
-        return func(obj, *digits)
+    An object cannot be a NumPy array unless numpy has been imported, so
+    rounder never imports numpy itself to detect arrays.
+    """
+    return sys.modules.get("numpy")
 
-    def convert_number(obj):
-        return func(obj, *digits)
 
-    def convert_complex(obj):
-        return convert(obj.real) + convert(obj.imag) * 1j
+class Rounder:
+    """Compiled rounding plan: a function applied to all numbers in objects.
 
-    def convert_list(obj):
-        if use_copy:
-            return type(obj)(map(convert, obj))
-        obj[:] = list(map(convert, obj))
-        return obj
+    Rounder builds its dispatch table once, at construction, so that one
+    instance can be reused for any number of objects without paying for
+    the setup on every call.
 
-    def convert_map(obj):
-        if use_copy:
-            obj_copy = copy.deepcopy(obj)
-            return map(convert, obj_copy)
-        return map(convert, obj)
+    Args:
+        func: function applied to each number, as func(x) or, if
+            digits is given, func(x, digits)
+        digits (int, optional): second argument passed to func.
+            Defaults to None, in which case func is called with the
+            number only.
+        use_copy (bool, optional): use a deep copy or work with the
+            original object? Defaults to False, in which case mutable
+            objects will be affected inplace.
+        engine (str, optional): "recursive", "iterative" or
+            "copy_on_write". The recursive engine is faster, but it is
+            limited by Python's recursion limit; when it reaches the
+            limit, the object is converted again with the iterative
+            engine. A function other than round, math.floor, math.ceil or
+            signif must not be applied twice, so with such a function and
+            use_copy=False, objects nested deeper than RECURSIVE_MAX_DEPTH
+            are converted iteratively from the start instead. The
+            iterative engine uses an explicit stack, so it works with any
+            depth of nesting. The copy_on_write engine never changes the
+            object (use_copy is implied): it creates new containers only
+            on the paths to numbers that change, and shares everything
+            else with the original. Defaults to "recursive".
+        max_depth (int, optional): depth of nesting beyond which objects
+            are left as they are (not rounded nor copied); the object
+            itself is at depth 0. Implies the iterative engine, so it
+            cannot be used with the copy_on_write engine. Defaults to
+            None, which means no limit.
+        stats (RoundingStats, optional): statistics to collect the calls
+            into; the handlers are then compiled with instrumentation,
+            which is left out entirely otherwise. Defaults to None.
+        rounding (str, optional): rounding mode for Decimal numbers, one
+            of DECIMAL_ROUNDINGS (e.g., decimal.ROUND_HALF_UP); can only
+            be used when func is round or signif. Defaults to None, which
+            means the rounding of the current decimal context.
 
-    def convert_filter(obj):
-        return filter(
-            bool, convert_map(obj)
-        )  # bool of map object is always True
+    >>> round_2 = Rounder(round, 2)
+    >>> round_2([1.2345, {"a": 2.3456}])
+    [1.23, {'a': 2.35}]
+    >>> Rounder(math.floor)((1.9, 2.1))
+    (1, 2)
+    """
 
-    def convert_generator(obj):
-        return map(convert, obj)
+    def __init__(
+        self,
+        func: Callable[..., Number],
+        digits: Optional[int] = None,
+        use_copy: bool = False,
+        engine: str = "recursive",
+        max_depth: Optional[int] = None,
+        stats: Optional["RoundingStats"] = None,
+        rounding: Optional[str] = None,
+    ):
+        if engine not in ENGINES:
+            raise ValueError(
+                f"engine must be one of {', '.join(ENGINES)}, not {engine!r}"
+            )
+        if rounding is not None:
+            if rounding not in DECIMAL_ROUNDINGS:
+                raise ValueError(
+                    f"rounding must be one of {', '.join(DECIMAL_ROUNDINGS)}"
+                    f", not {rounding!r}"
+                )
+            if func is not builtins.round and func is not signif:
+                raise ValueError(
+                    "rounding can only be used with round and signif"
+                )
+        if engine == "copy_on_write":
+            if max_depth is not None:
+                raise ValueError(
+                    "max_depth cannot be used with the copy_on_write engine"
+                )
+            use_copy = True
+        self.func = func
+        self.digits = digits
+        self.use_copy = use_copy
+        self.engine = engine
+        self.max_depth = max_depth
+        self.stats = stats
+        self.rounding = rounding
+        engines = self._compile()
+        _rounders.add(self)
+        self._convert_iteratively = engines["iterative"]
+        if max_depth is not None:
+            engine = "iterative"
+        self._convert = engines[engine]
+        if stats is not None:
+            self._convert = stats._count_calls(self._convert)
+        # When a recursive engine hits the recursion limit, the object
+        # can be converted again iteratively, unless the first attempt
+        # has already changed it in a way that cannot be repeated.
+        self._retry_iteratively = engine != "iterative" and (
+            use_copy or func in _IDEMPOTENT_FUNCS
+        )
 
-    def convert_namedtuple(obj):
-        return obj._replace(**convert(obj._asdict()))
+    def __repr__(self) -> str:
+        rounding = ""
+        if self.rounding is not None:
+            rounding = f", rounding={self.rounding!r}"
+        return (
+            f"{type(self).__name__}({self.func!r}, {self.digits!r}, "
+            f"use_copy={self.use_copy!r}{rounding})"
+        )
 
-    def convert_dict(obj):
-        if use_copy:
-            return_obj = type(obj)()
-        else:
-            return_obj = obj
-        for k, v in obj.items():
-            return_obj[k] = convert(v)
+    def __call__(self, obj: Any) -> Any:
+        try:
+            return self._convert(obj, {})
+        except RecursionError:
+            if not self._retry_iteratively:
+                raise
+            if self.stats is not None:
+                self.stats.retries += 1
+        except Exception as error:
+            if self.stats is not None:
+                self.stats.errors.append(error)
+            return obj
+        try:
+            return self._convert_iteratively(obj, {})
+        except Exception as error:
+            if self.stats is not None:
+                self.stats.errors.append(error)
+            return obj
+
+    async def call_async(
+        self,
+        obj: Any,
+        chunk_size: Optional[int] = ASYNC_CHUNK_SIZE,
+        executor: Union[Executor, bool, None] = None,
+    ) -> Any:
+        """Round an object without blocking the asyncio event loop.
+
+        The object is converted with the iterative engine, which lets
+        the event loop run other tasks after every chunk_size objects
+        (containers and numbers alike), or it is converted in another
+        thread.
+
+        Args:
+            obj (any): any Python object
+            chunk_size (int, optional): number of objects converted
+                before other tasks are let run. Defaults to
+                ASYNC_CHUNK_SIZE.
+            executor (concurrent.futures.Executor or bool, optional):
+                an executor that converts the object instead of the
+                event loop; True means the default executor of the loop.
+                Defaults to None, in which case the object is converted
+                in the event loop, in chunks.
+        Returns:
+            the object with rounded numbers
+        >>> asyncio.run(Rounder(round, 1).call_async([1.23, (2.34,)]))
+        [1.2, (2.3,)]
+        """
+        if executor is not None and executor is not False:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None if executor is True else executor, self, obj
+            )
+        if chunk_size is None or chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be a positive integer, not {chunk_size!r}"
+            )
+        steps = self._convert_in_steps(obj, {}, chunk_size)
+        if self.stats is not None:
+            self.stats._count_call()
+        try:
+            while True:
+                next(steps)
+                await asyncio.sleep(0)
+        except StopIteration as stop:
+            return stop.value
+        except Exception as error:
+            if self.stats is not None:
+                self.stats.errors.append(error)
+            return obj
+
+    def iterate(self, iterable: Iterable, tee: bool = False) -> Any:
+        """Round items of an iterable lazily, as they are pulled.
+
+        Nothing is read from iterable before the result is iterated over,
+        and items are never collected, so this works for unbounded
+        streams, too.
+
+        Args:
+            iterable (iterable): any iterable, e.g., a generator
+            tee (bool, optional): also return an independent iterator
+                over the original items, like itertools.tee() does.
+                Defaults to False.
+        Returns:
+            generator of rounded items, or a tuple of such a generator
+                and an iterator over the original items, if tee is True
+        >>> numbers = itertools.count(0.125, 0.25)
+        >>> rounded, original = Rounder(round, 1).iterate(numbers, tee=True)
+        >>> list(itertools.islice(rounded, 4))
+        [0.1, 0.4, 0.6, 0.9]
+        >>> list(itertools.islice(original, 2))
+        [0.125, 0.375]
+        """
+        if tee:
+            iterable, original = itertools.tee(iterable)
+            return self._iterate(iterable), original
+        return self._iterate(iterable)
+
+    def _iterate(self, iterable: Iterable) -> Iterator:
+        for item in iterable:
+            yield self(item)
+
+    def _reset_dispatch_table(self) -> None:
+        # Types whose handlers have been registered, also through their
+        # base classes, are left to find_handler().
+        self.dispatch_table.clear()
+        self.dispatch_table.update(
+            (cls, handler)
+            for cls, handler in self._builtin_handlers.items()
+            if _find_registered(cls) is None
+        )
+
+    def _compile(self) -> Dict[str, Callable[[Any, Dict], Any]]:
+        func = self.func
+        digits = () if self.digits is None else (self.digits,)
+        use_copy = self.use_copy
+        ndarray_kernel = _get_kernel(_ndarray_kernels, func)
+        many_kernel = _get_kernel(_many_kernels, func)
+        integers_unchanged = func in (math.floor, math.ceil) or (
+            func is builtins.round and all(d >= 0 for d in digits)
+        )
+        # Decimals are rounded with quantize(), which keeps them exact,
+        # to an exponent computed once (or cached, for significant digits)
+        rounding = self.rounding
+        round_decimal = None
+        if digits and func is builtins.round:
+            quantum = _decimal_quantum(-digits[0])
+
+            def round_decimal(x):
+                return x.quantize(quantum, rounding)
+
+        elif digits and func is signif:
+
+            def round_decimal(x):
+                return _signif_decimal(x, *digits, rounding)
+
+        # Fractions are rounded with integer arithmetic, also exactly
+        round_fraction = _get_kernel(_fraction_funcs, func)
+
+        stats = self.stats
+        if stats is not None:
+            func = stats._count_numbers(func)
+            round_decimal = stats._count_numbers(round_decimal)
+            round_fraction = stats._count_numbers(round_fraction)
+            many_kernel = stats._count_numbers(
+                many_kernel, lambda values, *args: len(values)
+            )
+            ndarray_kernel = stats._count_numbers(
+                ndarray_kernel, lambda np, x, *args, **kwargs: x.size
+            )
+
+        # Every handler takes a memo, which maps id() of each container
+        # already seen during a call to a pair (container, result), like
+        # in copy.deepcopy(). Holding the container in the memo keeps it
+        # alive, so that its id() cannot be reused by another object.
+        # Mutable containers are put in the memo before their items are
+        # converted, so that reference cycles lead back to them.
+
+        def convert_number(obj, memo):
+            return func(obj, *digits)
+
+        def convert_decimal(obj, memo):
+            return round_decimal(obj)
+
+        def convert_fraction(obj, memo):
+            return round_fraction(obj, *digits)
+
+        def convert_complex(obj, memo):
+            return convert(obj.real, memo) + convert(obj.imag, memo) * 1j
+
+        # digits are bound once, so that numbers can be rounded in bulk
+        # by map(), without unpacking digits for each of them
+        bound_digits = [itertools.repeat(d) for d in digits]
+
+        def map_numbers(values):
+            return map(func, values, *bound_digits)
+
+        def round_numbers(values):
+            # Lists of floats and ints only, the most common ones, are
+            # rounded in one pass, without dispatching each item (or by
+            # the kernel, if all items are floats); None for other lists.
+            # With stats, numbers are dispatched, to be counted by type.
+            if values and type(values[0]) not in (float, int):
+                return None
+            kinds = set(map(type, values))
+            if many_kernel is not None and kinds <= _FLOAT:
+                return many_kernel(values, *digits)
+            if kinds <= _FLOAT_INT and stats is None:
+                return list(map_numbers(values))
+            return None
+
+        def convert_items(obj, memo):
+            values = round_numbers(obj)
+            if values is None:
+                values = [convert(x, memo) for x in obj]
+            return values
+
+        def convert_list(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            if not use_copy:
+                memo[key] = (obj, obj)
+                obj[:] = convert_items(obj, memo)
+                return obj
+            if type(obj) is list:
+                return_obj = []
+                memo[key] = (obj, return_obj)
+                return_obj[:] = convert_items(obj, memo)
+                return return_obj
+            # a subclass, which may need its items to be created
+            values = convert_items(obj, memo)
+            if key in memo:  # created already, through a reference cycle
+                return memo[key][1]
+            return_obj = type(obj)(values)
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        def memoized(handler):
+            # for objects that hold no other objects to convert
+            @functools.wraps(handler)
+            def convert_memoized(obj, memo):
+                key = id(obj)
+                if key in memo:
+                    return memo[key][1]
+                return_obj = handler(obj, memo)
+                memo[key] = (obj, return_obj)
+                return return_obj
+
+            return convert_memoized
+
+        def convert_item(obj):
+            # Items of an iterator are pulled after the call has returned,
+            # and they can be temporary objects, so each one gets its own
+            # memo.
+            return convert(obj, {})
+
+        @memoized
+        def convert_iterator(obj, memo):
+            # Items are rounded lazily, as they are pulled from obj, so obj
+            # is consumed; use_copy applies to the items only.
+            return map(convert_item, obj)
+
+        @memoized
+        def convert_map_filter(obj, memo):
+            # With use_copy, map and filter objects are deep-copied, with
+            # the iterables they draw from (which fails for one-shot ones,
+            # like generators), so that the original is not consumed.
+            if use_copy:
+                obj = copy.deepcopy(obj)
+            return map(convert_item, obj)
+
+        async def round_async_items(obj):
+            async for item in obj:
+                yield convert_item(item)
+
+        @memoized
+        def convert_async_iterator(obj, memo):
+            # Items are rounded as they arrive. Asynchronous iterators
+            # cannot be copied, so use_copy does not apply to them.
+            return round_async_items(obj)
+
+        def convert_range(obj, memo):
+            return map(convert_item, obj)
+
+        def convert_namedtuple(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            values = [convert(x, memo) for x in obj]
+            if key in memo:  # created already, through a reference cycle
+                return memo[key][1]
+            return_obj = obj._replace(**dict(zip(obj._fields, values)))
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        def convert_dict(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            if use_copy:
+                return_obj = type(obj)()
+            else:
+                return_obj = obj
+            memo[key] = (obj, return_obj)
+            for k, v in obj.items():
+                return_obj[k] = convert(v, memo)
         
-        return return_obj
+            return return_obj
 
-    def convert_array(obj):
-        if use_copy:
-            return array.array(obj.typecode, convert(obj.tolist()))
-        obj[:] = array.array(obj.typecode, convert(obj.tolist()))
-        return obj
+        def round_array(obj):
+            # returns a new array.array of the same typecode
+            if obj.typecode in _FLOAT_TYPECODES and many_kernel is not None:
+                return many_kernel(obj, *digits)
+            return array.array(obj.typecode, map_numbers(obj))
 
-    def convert_deque(obj):
-        if use_copy:
-            return type(obj)(map(convert, obj))
-        for i, elem in enumerate(obj):
-            obj[i] = convert(elem)
-        return obj
+        @memoized
+        def convert_array(obj, memo):
+            typecode = obj.typecode
+            if typecode not in _NUMBER_TYPECODES or (
+                typecode in _INTEGER_TYPECODES and integers_unchanged
+            ):
+                return copy.copy(obj) if use_copy else obj
+            values = round_array(obj)
+            if use_copy:
+                return values
+            memoryview(obj)[:] = memoryview(values)
+            return obj
+
+        @memoized
+        def convert_memoryview(obj, memo):
+            typecode = _native_typecode(obj)
+            if obj.ndim != 1 or typecode is None or (
+                typecode in _INTEGER_TYPECODES and integers_unchanged
+            ):
+                return obj
+            values = round_array(array.array(typecode, obj.tobytes()))
+            if use_copy or obj.readonly:
+                return memoryview(values)
+            if obj.format == typecode:
+                obj[:] = memoryview(values)
+            elif obj.c_contiguous:
+                obj.cast("B")[:] = memoryview(values).cast("B")
+            else:
+                return memoryview(values)
+            return obj
 
-    def convert_tuple_set_frozenset(obj):
-        return type(obj)(map(convert, obj))
+        def convert_deque(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            if use_copy:
+                return_obj = type(obj)()
+                memo[key] = (obj, return_obj)
+                return_obj.extend([convert(x, memo) for x in obj])
+                return return_obj
+            memo[key] = (obj, obj)
+            for i, elem in enumerate(obj):
+                obj[i] = convert(elem, memo)
+            return obj
+
+        def convert_tuple_set_frozenset(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            values = [convert(x, memo) for x in obj]
+            if key in memo:  # created already, through a reference cycle
+                return memo[key][1]
+            return_obj = type(obj)(values)
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        def round_ndarray(obj):
+            # returns a new, rounded copy of a numeric array
+            np = _numpy()
+            if ndarray_kernel is not None:
+                return ndarray_kernel(np, obj, *digits)
+            values = [func(x, *digits) for x in obj.ravel().tolist()]
+            return np.array(values).reshape(obj.shape)
 
-    def convert_rest(obj):
-        if isinstance(obj, Number):
+        def convert_ndarray(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            kind = obj.dtype.kind
+            if kind in "iufc":
+                if ndarray_kernel is not None and not use_copy:
+                    target = ndarray_kernel(_numpy(), obj, *digits, out=obj)
+                else:
+                    target = round_ndarray(obj)
+                    if not use_copy:
+                        obj[...] = target
+                        target = obj
+                memo[key] = (obj, target)
+                return target
+            target = obj.copy() if use_copy else obj
+            memo[key] = (obj, target)
+            if kind == "O":
+                for index, value in _numpy().ndenumerate(obj):
+                    target[index] = convert(value, memo)
+            return target
+
+        def convert_numpy_scalar(obj, memo):
+            if ndarray_kernel is not None and obj.dtype.kind in "iufc":
+                np = _numpy()
+                return ndarray_kernel(np, np.asarray(obj), *digits)[()]
             if isinstance(obj, complex):
-                return type(obj)(convert_complex(obj))
-            return type(obj)(convert_number(obj))
-        if isinstance(obj, (list, UserList)):
-            return type(obj)(convert_list(obj))
-        if isinstance(obj, tuple):
-            if hasattr(obj, "_fields"):  # it's a namedtuple
-                return convert_namedtuple(obj)
-            return convert_tuple_set_frozenset(obj)
-        if isinstance(obj, Set):
-            return convert_tuple_set_frozenset(obj)
-        if isinstance(obj, Mapping):
-            return convert_dict(obj)
-        if isinstance(obj, array.array):
-            return convert_array(obj)
-        if isinstance(obj, deque):
-            return convert_deque(obj)
-        if isinstance(obj, map):
-            return convert_map(obj)
-        if hasattr(obj, "__dict__"):
-            # placed at the end as some of the above (derived) types
-            # might have a __dict__
+                return type(obj)(convert_complex(obj, memo))
+            if isinstance(obj, Number):
+                return type(obj)(func(obj, *digits))
+            return obj
+
+        def round_pandas_values(values):
+            # returns rounded values of a Series, or None for those
+            # that are not numeric or would not change
+            dtype = values.dtype
+            if dtype.kind not in "iufc" or (
+                dtype.kind in "iu" and integers_unchanged
+            ):
+                return None
+            np = _numpy()
+            if isinstance(dtype, np.dtype):
+                return round_ndarray(values.to_numpy())
+            # a nullable extension dtype, like Float64 or Int64
+            result = round_ndarray(values.to_numpy(float, na_value=np.nan))
+            return _pandas().array(result, dtype=dtype)
+
+        @memoized
+        def convert_pandas(obj, memo):
+            pd = _pandas()
+            if not isinstance(obj, (pd.Series, pd.DataFrame)):
+                return obj
+            target = obj.copy() if use_copy else obj
+            if isinstance(obj, pd.Series):
+                values = round_pandas_values(target)
+                if values is not None:
+                    target.iloc[:] = values
+                return target
+            for i in range(target.shape[1]):
+                values = round_pandas_values(target.iloc[:, i])
+                if values is not None:
+                    target.isetitem(i, values)
+            return target
+
+        def convert_number_subclass(obj, memo):
+            return type(obj)(func(obj, *digits))
+
+        def convert_complex_subclass(obj, memo):
+            return type(obj)(convert_complex(obj, memo))
+
+        def convert_instance(obj, memo):
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
             if use_copy:
                 obj_copy = copy.copy(obj)
+                memo[key] = (obj, obj_copy)
                 for k, v in obj_copy.__dict__.items():
-                    obj_copy.__dict__[k] = convert(v)
+                    obj_copy.__dict__[k] = convert(v, memo)
                 return obj_copy
-            convert_dict(obj.__dict__)
+            memo[key] = (obj, obj)
+            convert_dict(obj.__dict__, memo)
             return obj
 
-        return obj
+        def keep(obj, memo):
+            return obj
 
-    def convert(obj):
-        if type(obj) in (float, int):
-            return func(obj, *digits)
+        def make_instance_handler(obj):
+            # Generates a handler for all instances of type(obj), so that
+            # their fields are found once per class rather than per
+            # object.
+            cls = type(obj)
+            frozen = _frozen_fields(cls)
+            if frozen is not None:
+                replace, fields = frozen
 
-        return dispatch_table.get(type(obj), convert_rest)(obj)
+                def get_children(obj):
+                    return [getattr(obj, name) for name, _ in fields]
 
-    try:
-        dispatch_table = dispatch_table_store[(func, *digits, use_copy)]
-    except KeyError:
-        dispatch_table = dispatch_table_store[(func, *digits, use_copy)] = {
-            bool: lambda obj: func(obj, *digits),
-            Decimal: lambda obj: func(obj, *digits),
-            Fraction: lambda obj: func(obj, *digits),
-            complex: lambda obj: convert(obj.real) + convert(obj.imag) * 1j,
+                def rebuild(obj, target, values):
+                    return replace(
+                        obj, **{arg: v for (_, arg), v in zip(fields, values)}
+                    )
+
+                start = start_immutable
+            else:
+                slots = _slot_names(cls)
+                has_dict = hasattr(obj, "__dict__")
+                if not slots or cls.__setattr__ is not object.__setattr__:
+                    # a class with a custom __setattr__ and __slots__ is
+                    # most likely immutable on purpose, like uuid.UUID
+                    return convert_instance if has_dict else keep
+
+                def set_slots(obj):
+                    return [name for name in slots if hasattr(obj, name)]
+
+                def get_children(obj):
+                    values = [getattr(obj, name) for name in set_slots(obj)]
+                    if has_dict:
+                        values.extend(vars(obj).values())
+                    return values
+
+                def rebuild(obj, target, values):
+                    names = set_slots(obj)
+                    for name, value in zip(names, values):
+                        object.__setattr__(target, name, value)
+                    if has_dict:
+                        for k, v in zip(list(vars(obj)), values[len(names) :]):
+                            target.__dict__[k] = v
+                    return target
+
+                start = start_instance
+
+            def convert_fields(obj, memo):
+                key = id(obj)
+                if key in memo:
+                    return memo[key][1]
+                target = start(obj)
+                if target is not None:
+                    memo[key] = (obj, target)
+                values = [convert(x, memo) for x in get_children(obj)]
+                if target is None and key in memo:
+                    # created already, through a reference cycle
+                    return memo[key][1]
+                return_obj = rebuild(obj, target, values)
+                memo[key] = (obj, return_obj)
+                return return_obj
+
+            expanders[convert_fields] = (get_children, start, rebuild)
+            return convert_fields
+
+        def make_registered_handler(handler):
+            def convert_registered(obj, memo):
+                key = id(obj)
+                if key in memo:
+                    return memo[key][1]
+                return_obj = handler(
+                    obj, lambda value: convert(value, memo), use_copy
+                )
+                memo[key] = (obj, return_obj)
+                return return_obj
+
+            return convert_registered
+
+        def choose_handler(obj):
+            registered = _find_registered(type(obj))
+            if registered is not None:
+                return make_registered_handler(registered)
+            if type(obj).__module__.partition(".")[0] == "pandas":
+                return convert_pandas
+            np = _numpy()
+            if np is not None:
+                if isinstance(obj, np.ndarray):
+                    return convert_ndarray
+                if isinstance(obj, np.generic):
+                    return convert_numpy_scalar
+            if isinstance(obj, Number):
+                if isinstance(obj, complex):
+                    return convert_complex_subclass
+                return convert_number_subclass
+            if isinstance(obj, (list, UserList)):
+                return convert_list
+            if isinstance(obj, tuple):
+                if hasattr(obj, "_fields"):  # it's a namedtuple
+                    return convert_namedtuple
+                return convert_tuple_set_frozenset
+            if isinstance(obj, Set):
+                return convert_tuple_set_frozenset
+            if isinstance(obj, Mapping):
+                return convert_dict
+            if isinstance(obj, array.array):
+                return convert_array
+            if isinstance(obj, memoryview):
+                return convert_memoryview
+            if isinstance(obj, deque):
+                return convert_deque
+            if isinstance(obj, Iterator) and not isinstance(obj, io.IOBase):
+                return convert_iterator
+            if isinstance(obj, AsyncIterator):
+                return convert_async_iterator
+            # placed at the end as some of the above (derived) types
+            # might have a __dict__ or __slots__
+            return make_instance_handler(obj)
+
+        def find_handler(obj):
+            # For types that are not in the dispatch table. The handler
+            # depends on the type only, so it is put in the table, and
+            # the next objects of the type get it in one lookup.
+            handler = choose_handler(obj)
+            if stats is not None:
+                handler = instrument(handler)
+            dispatch_table[type(obj)] = handler
+            return handler
+
+        def convert_rest(obj, memo):
+            return find_handler(obj)(obj, memo)
+
+        def convert(obj, memo):
+            if type(obj) in (float, int):
+                return func(obj, *digits)
+
+            return dispatch_table.get(type(obj), convert_rest)(obj, memo)
+
+        if stats is not None:
+            # Numbers go through the dispatch table, too, so that they
+            # are counted and timed like other objects.
+            def convert(obj, memo):
+                return dispatch_table.get(type(obj), convert_rest)(obj, memo)
+
+        # A function other than round, floor, ceil and signif must not be
+        # applied twice to an object changed inplace, so such an object
+        # cannot be converted again after RecursionError. Instead, objects
+        # nested deeper than RECURSIVE_MAX_DEPTH are converted iteratively
+        # right away. The depth is kept in the memo, which is per call.
+        repeatable = use_copy or self.func in _IDEMPOTENT_FUNCS
+        if not repeatable:
+            convert_shallow = convert
+            depth_key = object()
+
+            def convert(obj, memo):
+                depth = memo.get(depth_key, 0)
+                if depth >= RECURSIVE_MAX_DEPTH:
+                    return convert_iteratively(obj, memo)
+                memo[depth_key] = depth + 1
+                try:
+                    return convert_shallow(obj, memo)
+                finally:
+                    memo[depth_key] = depth
+
+        # The iterative engine creates the result of a mutable container
+        # when it meets the container (start_*), and fills it when all
+        # the items are converted (rebuild_*). Immutable containers
+        # cannot be created before their items, so start_* returns None.
+
+        def start_list(obj):
+            if not use_copy:
+                return obj
+            return [] if type(obj) is list else None
+
+        def start_copy(obj):
+            return type(obj)() if use_copy else obj
+
+        def start_instance(obj):
+            return copy.copy(obj) if use_copy else obj
+
+        def start_immutable(obj):
+            return None
+
+        def rebuild_list(obj, target, values):
+            if target is None:
+                return type(obj)(values)
+            target[:] = values
+            return target
+
+        def rebuild_collection(obj, target, values):
+            return type(obj)(values)
+
+        def rebuild_namedtuple(obj, target, values):
+            return obj._replace(**dict(zip(obj._fields, values)))
+
+        def rebuild_dict(obj, target, values):
+            for k, v in zip(list(obj), values):
+                target[k] = v
+            return target
+
+        def rebuild_deque(obj, target, values):
+            if target is not obj:
+                target.extend(values)
+                return target
+            for i, v in enumerate(values):
+                obj[i] = v
+            return obj
+
+        def rebuild_instance(obj, target, values):
+            for k, v in zip(list(vars(obj)), values):
+                target.__dict__[k] = v
+            return target
+
+        # handler: (function getting the children, function creating
+        # the result, function filling it with the converted children)
+        expanders = {
+            convert_list: (list, start_list, rebuild_list),
+            convert_tuple_set_frozenset: (
+                list,
+                start_immutable,
+                rebuild_collection,
+            ),
+            convert_namedtuple: (list, start_immutable, rebuild_namedtuple),
+            convert_dict: (
+                lambda obj: list(obj.values()),
+                start_copy,
+                rebuild_dict,
+            ),
+            convert_deque: (list, start_copy, rebuild_deque),
+            convert_instance: (
+                lambda obj: list(vars(obj).values()),
+                start_instance,
+                rebuild_instance,
+            ),
+        }
+        max_depth = self.max_depth
+        pending = object()
+
+        def convert_in_steps(obj, memo, steps=None):
+            # Post-order traversal with an explicit stack of frames
+            # (container, its result, rebuild function, children,
+            # converted children) instead of recursion, so any depth of
+            # nesting works. A generator returning the result: if steps
+            # is given, it yields after every steps objects, so that the
+            # conversion can be interleaved with other work.
+            stack: list = []
+            node = obj
+            count = 0
+            while True:
+                if steps is not None:
+                    count += 1
+                    if count == steps:
+                        count = 0
+                        yield
+                if max_depth is not None and len(stack) > max_depth:
+                    result = node
+                elif type(node) in (float, int):
+                    result = func(node, *digits)
+                else:
+                    handler = dispatch_table.get(type(node)) or find_handler(
+                        node
+                    )
+                    expander = expanders.get(handler)
+                    if expander is None or (
+                        handler is convert_list
+                        and steps is None
+                        and (max_depth is None or len(stack) < max_depth)
+                        and _numbers_only(node)
+                    ):
+                        result = handler(node, memo)
+                    elif id(node) in memo:
+                        result = memo[id(node)][1]
+                    else:
+                        get_children, start, rebuild = expander
+                        target = start(node)
+                        if target is not None:
+                            memo[id(node)] = (node, target)
+                        children = iter(get_children(node))
+                        stack.append((node, target, rebuild, children, []))
+                        result = pending
+
+                while True:
+                    if result is not pending:
+                        if not stack:
+                            return result
+                        stack[-1][4].append(result)
+                    container, target, rebuild, children, values = stack[-1]
+                    node = next(children, pending)
+                    if node is not pending:
+                        break
+                    stack.pop()
+                    key = id(container)
+                    if target is None and key in memo:
+                        # created already, through a reference cycle
+                        result = memo[key][1]
+                    else:
+                        result = rebuild(container, target, values)
+                        memo[key] = (container, result)
+
+        def convert_iteratively(obj, memo):
+            try:
+                next(convert_in_steps(obj, memo))
+            except StopIteration as stop:
+                return stop.value
+
+        def same(old, new):
+            # can old be kept in place of new?
+            if new is old:
+                return True
+            return (
+                type(old) is float
+                and type(new) is float
+                and new == old
+                and math.copysign(1.0, new) == math.copysign(1.0, old)
+            )
+
+        def convert_sharing(obj, memo):
+            # Copy-on-write: a container whose items do not change is
+            # kept (shared with the original), so new containers are
+            # created only on the paths to numbers that change. The
+            # result of a mutable container is created up front, like in
+            # the iterative engine, so that reference cycles lead to it;
+            # it is dropped if nothing changes (containers in a cycle are
+            # always copied, though, as their results refer to each other).
+            if type(obj) in (float, int):
+                new = func(obj, *digits)
+                return obj if same(obj, new) else new
+            handler = dispatch_table.get(type(obj)) or find_handler(obj)
+            if handler is keep:
+                return obj
+            expander = expanders.get(handler)
+            if expander is None:
+                return handler(obj, memo)
+            key = id(obj)
+            if key in memo:
+                return memo[key][1]
+            get_children, start, rebuild = expander
+            target = start(obj)
+            if target is not None:
+                memo[key] = (obj, target)
+            children = get_children(obj)
+            values = None
+            if handler is convert_list:
+                values = round_numbers(children)
+            if values is not None:
+                unchanged = all(map(same, children, values))
+            else:
+                values = [convert_sharing(x, memo) for x in children]
+                unchanged = all(map(operator.is_, children, values))
+            if target is None and key in memo:
+                # created already, through a reference cycle
+                return memo[key][1]
+            if unchanged:
+                return_obj = obj
+            else:
+                return_obj = rebuild(obj, target, values)
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        decimal_handler = convert_decimal
+        if round_decimal is None:
+            decimal_handler = convert_number
+        fraction_handler = convert_fraction
+        if round_fraction is None:
+            fraction_handler = convert_number
+        builtin_handlers = {
+            bool: convert_number,
+            Decimal: decimal_handler,
+            Fraction: fraction_handler,
+            complex: convert_complex,
             list: convert_list,
-            tuple: lambda obj: tuple(map(convert, obj)),
-            set: lambda obj: set(map(convert, obj)),
-            frozenset: lambda obj: frozenset(map(convert, obj)),
+            tuple: convert_tuple_set_frozenset,
+            set: convert_tuple_set_frozenset,
+            frozenset: convert_tuple_set_frozenset,
             dict: convert_dict,
             defaultdict: convert_dict,
             OrderedDict: convert_dict,
             Counter: convert_dict,
             array.array: convert_array,
+            memoryview: convert_memoryview,
             deque: convert_deque,
-            map: convert_map,
-            filter: convert_filter,
-            range: convert_map,
-            str: lambda obj: obj,
-            types_lookup("NoneType"): lambda obj: obj,
-            types_lookup("GeneratorType"): convert_generator,
-            types_lookup("FunctionType"): lambda obj: obj,
-            types_lookup("LambdaType"): lambda obj: obj,
-            types_lookup("CoroutineType"): lambda obj: obj,
-            types_lookup("AsyncGeneratorType"): lambda obj: obj,
-            types_lookup("CellType"): lambda obj: obj,
-            types_lookup("MethodType"): lambda obj: obj,
-            types_lookup("BuiltinFunctionType"): lambda obj: obj,
-            types_lookup("BuiltinMethodType"): lambda obj: obj,
-            types_lookup("MethodWrapperType"): lambda obj: obj,
-            types_lookup("NotImplementedType"): lambda obj: obj,
-            types_lookup("MethodDescriptorType"): lambda obj: obj,
-            types_lookup("ClassMethodDescriptorType"): lambda obj: obj,
-            types_lookup("EllipsisType"): lambda obj: obj,
-            types_lookup("UnionType"): lambda obj: obj,
-            types_lookup("FrameType"): lambda obj: obj,
-            types_lookup("MemberDescriptorType"): lambda obj: obj,
+            map: convert_map_filter,
+            filter: convert_map_filter,
+            range: convert_range,
+            str: keep,
+            types_lookup("NoneType"): keep,
+            types_lookup("GeneratorType"): convert_iterator,
+            types_lookup("FunctionType"): keep,
+            types_lookup("LambdaType"): keep,
+            types_lookup("CoroutineType"): keep,
+            types_lookup("AsyncGeneratorType"): convert_async_iterator,
+            types_lookup("CellType"): keep,
+            types_lookup("MethodType"): keep,
+            types_lookup("BuiltinFunctionType"): keep,
+            types_lookup("BuiltinMethodType"): keep,
+            types_lookup("MethodWrapperType"): keep,
+            types_lookup("NotImplementedType"): keep,
+            types_lookup("MethodDescriptorType"): keep,
+            types_lookup("ClassMethodDescriptorType"): keep,
+            types_lookup("EllipsisType"): keep,
+            types_lookup("UnionType"): keep,
+            types_lookup("FrameType"): keep,
+            types_lookup("MemberDescriptorType"): keep,
+        }
+        if stats is not None:
+            builtin_handlers[float] = builtin_handlers[int] = convert_number
+            instrumented: dict = {}
+
+            def instrument(handler):
+                # one instrumented handler for each handler, which the
+                # iterative engines expand like the handler itself
+                if handler not in instrumented:
+                    instrumented[handler] = stats._instrument(handler)
+                    if handler in expanders:
+                        expanders[instrumented[handler]] = expanders[handler]
+                return instrumented[handler]
+
+            builtin_handlers = {
+                cls: instrument(handler)
+                for cls, handler in builtin_handlers.items()
+            }
+        # handlers registered with register_type() take precedence
+        dispatch_table: dict = {}
+        if _speedups is not None and stats is None and repeatable:
+            # The compiled convert() converts lists, tuples, sets,
+            # frozensets and dicts itself, unless their handlers are
+            # replaced in the dispatch table, and leaves other objects to
+            # their handlers, so the results are the same.
+            convert = _speedups.Converter(
+                func,
+                digits,
+                use_copy,
+                many_kernel,
+                dispatch_table,
+                convert_rest,
+                convert_list,
+                convert_tuple_set_frozenset,
+                convert_dict,
+            )
+        self.dispatch_table = dispatch_table
+        self._builtin_handlers: Dict[Any, Callable] = builtin_handlers
+        self._reset_dispatch_table()
+        self._convert_in_steps = convert_in_steps
+        return {
+            "recursive": convert,
+            "iterative": convert_iteratively,
+            "copy_on_write": convert_sharing,
         }
 
+
+_registry: Dict[type, Callable[[Any, Callable, bool], Any]] = {}
+_rounders: "weakref.WeakSet[Rounder]" = weakref.WeakSet()
+# RoundingPolicy objects, which also choose handlers once per type
+_policies: "weakref.WeakSet[RoundingPolicy]" = weakref.WeakSet()
+
+
+def _find_registered(cls: type) -> Optional[Callable]:
+    # the handler registered for the closest class in the MRO of cls
+    for klass in getattr(cls, "__mro__", ()):
+        if klass in _registry:
+            return _registry[klass]
+    return None
+
+
+def register_type(
+    cls: type, handler: Optional[Callable[[Any, Callable, bool], Any]] = None
+) -> Any:
+    """Register how to round objects of a type and of its subclasses.
+
+    The handler is called as handler(obj, convert, use_copy), where
+    convert is a function that rounds any object (e.g., an attribute of
+    obj) and use_copy tells whether obj can be changed inplace; it
+    returns the rounded object. Like functools.singledispatch(), the
+    handler registered for the closest base class in the MRO of a type
+    is used, and the choice is made once per type. Registered handlers
+    take precedence over the built-in ones (but int and float are always
+    rounded directly).
+
+    Can be used as a decorator, when handler is not given.
+
+    Args:
+        cls (type): the class whose objects the handler rounds
+        handler (callable, optional): the handler; see above
+    Returns:
+        the handler
+
+    >>> class Money:
+    ...     def __init__(self, amount, currency):
+    ...         self.amount, self.currency = amount, currency
+    ...     def __repr__(self):
+    ...         return f"Money({self.amount}, {self.currency!r})"
+    >>> @register_type(Money)
+    ... def round_money(obj, convert, use_copy):
+    ...     return Money(convert(obj.amount), obj.currency)
+    >>> round_object([Money(1.2345, "EUR")], 2)
+    [Money(1.23, 'EUR')]
+    """
+    if handler is None:
+        return functools.partial(register_type, cls)
+    if not isinstance(cls, type):
+        raise TypeError(f"cls must be a class, not {cls!r}")
+    if cls in (float, int):
+        raise TypeError(f"{cls.__name__} objects are always rounded directly")
+    _registry[cls] = handler
+    _reset_handlers()
+    return handler
+
+
+def _reset_handlers() -> None:
+    # Handlers chosen before the registry changed are forgotten, so that
+    # live rounders and policies find them again.
+    for rounder in list(_rounders):
+        rounder._reset_dispatch_table()
+    for policy in list(_policies):
+        policy._handlers.clear()
+
+
+class _RounderCache:
+    """Least-recently-used cache of Rounder instances.
+
+    Rounders are keyed by (func, *digits, use_copy). Callables that
+    support weak references are held weakly, so that an entry is dropped
+    as soon as its callable (e.g., a one-off lambda passed to map_object)
+    is garbage collected; otherwise, the least recently used entry is
+    evicted when the cache holds more than maxsize Rounders.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(
+        self,
+        func: Callable,
+        digits: list,
+        use_copy: bool,
+        rounding: Optional[str] = None,
+    ) -> Rounder:
+        weak_func = self._weak(func)
+        # Rounder takes a single digits argument, None for no digits
+        digits_arg = digits[0] if digits else None
+        options = (*digits, use_copy)
+        if rounding is not None:
+            options += (rounding,)
+        key = (func if weak_func is None else weak_func, *options)
+        with self._lock:
+            try:
+                rounder = self._data[key]
+            except KeyError:
+                self.misses += 1
+            except TypeError:  # unhashable callable
+                self.misses += 1
+                return Rounder(
+                    func, digits_arg, use_copy=use_copy, rounding=rounding
+                )
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return rounder
+
+        if weak_func is None:
+            rounder = Rounder(
+                func, digits_arg, use_copy=use_copy, rounding=rounding
+            )
+        else:
+
+            def discard(ref):
+                self._discard((ref, *options))
+
+            key = (weakref.ref(func, discard), *options)
+            rounder = Rounder(
+                weakref.proxy(func),
+                digits_arg,
+                use_copy=use_copy,
+                rounding=rounding,
+            )
+
+        with self._lock:
+            if self.maxsize is None or self.maxsize > 0:
+                self._data[key] = rounder
+                self._trim()
+        return rounder
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._trim()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def _trim(self) -> None:
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _discard(self, key: tuple) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    @staticmethod
+    def _weak(func: Callable) -> Optional[weakref.ref]:
+        # Bound methods are created anew on each attribute access, so
+        # a weak reference to one would die right after the call.
+        if isinstance(func, types.MethodType):
+            return None
+        # Module-level functions live as long as their modules, and
+        # holding them strongly keeps their identity (e.g., for signif).
+        module = sys.modules.get(getattr(func, "__module__", ""))
+        name = getattr(func, "__qualname__", None)
+        if name is not None and getattr(module, name, None) is func:
+            return None
+        try:
+            return weakref.ref(func)
+        except TypeError:
+            return None
+
+
+rounder_store = _RounderCache()
+
+
+def cache_info() -> CacheInfo:
+    """Report statistics of the cache of Rounders used by rounder functions.
+
+    >>> cache_clear()
+    >>> _ = round_object([1.11, 2.22], 1)
+    >>> _ = round_object({"a": 1.11}, 1)
+    >>> cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+    """
+    return rounder_store.info()
+
+
+def cache_clear() -> None:
+    """Clear the cache of Rounders and its statistics."""
+    rounder_store.clear()
+
+
+def set_cache_maxsize(maxsize: Optional[int]) -> None:
+    """Set the maximum number of Rounders kept in the cache.
+
+    Args:
+        maxsize (int or None): maximum number of cached Rounders; None
+            means no limit, and 0 disables caching
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"maxsize must be non-negative, not {maxsize}")
+    rounder_store.resize(maxsize)
+
+
+@dataclasses.dataclass
+class RoundingStats:
+    """Statistics of rounding calls, collected by instrumented Rounders.
+
+    Attributes:
+        calls (int): number of objects rounded, in separate calls
+        numbers (int): number of numbers rounded, including those
+            rounded at once by vectorized kernels (e.g., NumPy arrays)
+        types (collections.Counter): number of objects of each type
+            passed to a handler; the iterative engines pass only the
+            objects that they do not expand themselves
+        seconds (collections.Counter): time spent in each handler, by
+            handler name, without the time of handlers called from it
+        max_depth (int): the deepest nesting of objects passed to
+            handlers, the object itself being at depth 0
+        retries (int): number of calls that reached the recursion limit
+            and were retried with the iterative engine
+        errors (list): exceptions after which the objects were returned
+            as they were; if empty, all calls succeeded
+
+    Not thread-safe: a RoundingStats should collect calls made in one
+    thread at a time.
+    """
+
+    calls: int = 0
+    numbers: int = 0
+    types: Counter = dataclasses.field(default_factory=Counter)
+    seconds: Counter = dataclasses.field(default_factory=Counter)
+    max_depth: int = 0
+    retries: int = 0
+    errors: list = dataclasses.field(default_factory=list)
+    _stack: list = dataclasses.field(
+        default_factory=list, repr=False, compare=False
+    )
+    _rounders: dict = dataclasses.field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def _get_rounder(
+        self,
+        func: Callable,
+        digits: list,
+        use_copy: bool,
+        rounding: Optional[str] = None,
+    ) -> Rounder:
+        key: Optional[tuple] = (func, *digits, use_copy, rounding)
+        try:
+            rounder = self._rounders.get(key)
+        except TypeError:  # unhashable callable
+            rounder = None
+            key = None
+        if rounder is None:
+            # Rounder takes a single digits argument, None for no digits
+            rounder = Rounder(
+                func,
+                digits[0] if digits else None,
+                use_copy=use_copy,
+                stats=self,
+                rounding=rounding,
+            )
+            if key is not None:
+                self._rounders[key] = rounder
+        return rounder
+
+    def _count_call(self) -> None:
+        self.calls += 1
+        del self._stack[:]
+
+    def _count_calls(self, convert: Callable) -> Callable:
+        def convert_counted(obj, memo):
+            self._count_call()
+            return convert(obj, memo)
+
+        return convert_counted
+
+    @overload
+    def _count_numbers(
+        self, func: Callable, count: Callable[..., int] = ...
+    ) -> Callable: ...
+
+    @overload
+    def _count_numbers(
+        self, func: None, count: Callable[..., int] = ...
+    ) -> None: ...
+
+    @overload
+    def _count_numbers(
+        self, func: Optional[Callable], count: Callable[..., int] = ...
+    ) -> Optional[Callable]: ...
+
+    def _count_numbers(
+        self,
+        func: Optional[Callable],
+        count: Callable[..., int] = lambda *args: 1,
+    ) -> Optional[Callable]:
+        # func rounds count(*args) numbers per call
+        if func is None:
+            return None
+
+        def func_counted(*args, **kwargs):
+            self.numbers += count(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        return func_counted
+
+    def _instrument(self, handler: Callable) -> Callable:
+        name = handler.__name__
+        types = self.types
+        seconds = self.seconds
+        # time spent in handlers called from each running handler
+        stack = self._stack
+        perf_counter = time.perf_counter
+
+        @functools.wraps(handler)
+        def convert_instrumented(obj, memo):
+            types[type(obj)] += 1
+            if len(stack) > self.max_depth:
+                self.max_depth = len(stack)
+            stack.append(0.0)
+            start = perf_counter()
+            try:
+                return handler(obj, memo)
+            finally:
+                elapsed = perf_counter() - start
+                seconds[name] += elapsed - stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+
+        return convert_instrumented
+
+
+_active_stats: "contextvars.ContextVar[Optional[RoundingStats]]" = (
+    contextvars.ContextVar("rounder_stats", default=None)
+)
+
+
+@contextlib.contextmanager
+def collect_stats(
+    stats: Optional[RoundingStats] = None,
+) -> "Iterator[RoundingStats]":
+    """Collect statistics of the rounding functions called in a block.
+
+    Inside the block, round_object(), signif_object() and the other
+    functions use instrumented Rounders, which count the objects of each
+    type, the numbers rounded and the depth reached, time the handlers,
+    and record the exceptions after which objects are returned as they
+    were. Outside such blocks, the functions carry no instrumentation.
+    The collection is local to the thread (and the asyncio task).
+
+    Args:
+        stats (RoundingStats, optional): statistics to add to. Defaults
+            to None, in which case new ones are created.
+    Returns:
+        context manager giving the RoundingStats
+
+    >>> with collect_stats() as stats:
+    ...     _ = round_object({"a": [1.234, 5.678], "b": "text"}, 2)
+    >>> stats.calls, stats.numbers, stats.max_depth
+    (1, 2, 2)
+    >>> stats.types[float], stats.types[list], stats.errors
+    (2, 1, [])
+    """
+    if stats is None:
+        stats = RoundingStats()
+    token = _active_stats.set(stats)
     try:
-        return convert(obj)
-    except Exception:
-        return obj
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+@functools.lru_cache(maxsize=None)
+def _decimal_quantum(exponent: int) -> Decimal:
+    # Decimal("1E<exponent>"), e.g., Decimal("0.01") for -2
+    return Decimal((0, (1,), exponent))
+
+
+def _signif_decimal(
+    x: Decimal, digits: int, rounding: Optional[str] = None
+) -> Decimal:
+    # Like signif(), but exact: the exponent of the last significant
+    # digit comes from x.adjusted(), the exponent of the first one.
+    if not x.is_finite() or not x:
+        return x
+    if len(x.as_tuple().digits) <= digits:
+        return x  # no more significant digits than requested
+    exponent = x.adjusted() - digits + 1
+    return x.quantize(_decimal_quantum(exponent), rounding)
+
+
+_LOG10_2 = math.log10(2)
+
+
+def _round_fraction(x: Fraction, digits: Optional[int] = None) -> Any:
+    # The same as round(x, digits), rounding half to even, but with one
+    # division of integers instead of arithmetic on Fractions.
+    if digits is None:
+        shift = 1
+        numerator, denominator = x.numerator, x.denominator
+    elif digits >= 0:
+        shift = 10**digits
+        numerator, denominator = x.numerator * shift, x.denominator
+    else:
+        shift = 10**-digits
+        numerator, denominator = x.numerator, x.denominator * shift
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (
+        2 * remainder == denominator and quotient % 2
+    ):
+        quotient += 1
+    if digits is None:
+        return quotient
+    if digits >= 0:
+        return Fraction(quotient, shift)
+    return Fraction(quotient * shift)
+
+
+def _signif_fraction(x: Fraction, digits: int) -> Fraction:
+    # Like signif(), but exact: the exponent of the first significant
+    # digit is estimated from the bit lengths of the numerator and the
+    # denominator (without converting x to float, which can overflow),
+    # and then corrected with integer comparisons.
+    numerator, denominator = abs(x.numerator), x.denominator
+    if not numerator:
+        return x
+
+    def at_least(exponent):  # is abs(x) >= 10**exponent?
+        if exponent >= 0:
+            return numerator >= denominator * 10**exponent
+        return numerator * 10**-exponent >= denominator
+
+    bits = numerator.bit_length() - denominator.bit_length()
+    exponent = math.floor(bits * _LOG10_2)
+    while at_least(exponent + 1):
+        exponent += 1
+    while not at_least(exponent):
+        exponent -= 1
+    return _round_fraction(x, digits - 1 - exponent)
+
+
+def _floor_fraction(x: Fraction) -> int:
+    return x.numerator // x.denominator
+
+
+def _ceil_fraction(x: Fraction) -> int:
+    return -(-x.numerator // x.denominator)
+
+
+def _native_typecode(view: memoryview) -> Optional[str]:
+    """Get the array typecode matching the format of a memoryview.
+
+    Return None if the format does not describe native numbers, like
+    those of array.array.
+    """
+    prefix, typecode = view.format[:-1], view.format[-1:]
+    if (
+        prefix in _NATIVE_BYTE_ORDERS
+        and typecode in _NUMBER_TYPECODES
+        and array.array(typecode).itemsize == view.itemsize
+    ):
+        return typecode
+    return None
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Get names of the slots of a class, including the inherited ones."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = vars(klass).get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"  # mangled
+            names.append(name)
+    return tuple(names)
+
+
+def _frozen_fields(
+    cls: type,
+) -> Optional[Tuple[Callable, Tuple[Tuple[str, str], ...]]]:
+    """Get the fields of a frozen dataclass or attrs class.
+
+    Instances of such classes cannot be changed, so they are rebuilt
+    with dataclasses.replace() or attr.evolve(), which take the fields
+    as arguments of __init__. dataclasses.replace() needs the values of
+    InitVars, which instances do not keep, so a dataclass with InitVars
+    is rebuilt by setting all its fields on a copy instead, without
+    calling __init__ (and __post_init__) again.
+
+    Returns:
+        None if cls is not a frozen dataclass nor a frozen attrs class;
+            otherwise, a tuple of the function rebuilding an instance
+            and the pairs (attribute name, argument name) of the fields
+            set by __init__
+    """
+    if dataclasses.is_dataclass(cls):
+        if not getattr(cls, "__dataclass_params__").frozen:
+            return None
+        fields = dataclasses.fields(cls)
+        if _has_init_vars(cls):
+            return _replace_fields, tuple(
+                (field.name, field.name) for field in fields
+            )
+        return dataclasses.replace, tuple(
+            (field.name, field.name) for field in fields if field.init
+        )
+    attr = _attr()
+    if attr is None or not attr.has(cls):
+        return None
+    if cls.__setattr__ is not getattr(attr._make, "_frozen_setattrs", None):
+        return None
+    return attr.evolve, tuple(
+        (a.name, getattr(a, "alias", None) or a.name.lstrip("_"))
+        for a in attr.fields(cls)
+        if a.init
+    )
+
+
+def _has_init_vars(cls: type) -> bool:
+    """Check if a dataclass has InitVar pseudo-fields."""
+    init_var = getattr(dataclasses, "_FIELD_INITVAR", None)
+    return init_var is not None and any(
+        getattr(field, "_field_type", None) is init_var
+        for field in getattr(cls, "__dataclass_fields__").values()
+    )
+
+
+def _replace_fields(obj: Any, **changes: Any) -> Any:
+    """Get a copy of a frozen object with some of its fields changed."""
+    obj_copy = copy.copy(obj)
+    for name, value in changes.items():
+        object.__setattr__(obj_copy, name, value)
+    return obj_copy
+
+
+def _attr() -> Optional[types.ModuleType]:
+    """Get attrs if it has already been imported, None otherwise."""
+    return sys.modules.get("attr")
+
+
+def _pandas() -> Optional[types.ModuleType]:
+    """Get pandas if it has already been imported, None otherwise."""
+    return sys.modules.get("pandas")
+
+
+def _get_kernel(kernels: Dict, func: Callable) -> Optional[Callable]:
+    try:
+        return kernels.get(func)
+    except TypeError:  # unhashable callable
+        return None
+
+
+def _all_floats(values) -> bool:
+    return all(type(x) is float for x in values)
+
+
+_FLOAT = frozenset([float])
+_FLOAT_INT = frozenset([float, int])
+
+
+def _numbers_only(values) -> bool:
+    return set(map(type, values)) <= _FLOAT_INT
+
+
+def _get_rounder(
+    func: Callable,
+    digits: list,
+    use_copy: bool,
+    rounding: Optional[str] = None,
+) -> Rounder:
+    stats = _active_stats.get()
+    if stats is None:
+        return rounder_store.get(func, digits, use_copy, rounding)
+    return stats._get_rounder(func, digits, use_copy, rounding)
+
+
+def _do(func, obj, digits, use_copy, rounding=None):
+    if type(obj) in (float, int) and _active_stats.get() is None:
+        return func(obj, *digits)
+
+    return _get_rounder(func, digits, use_copy, rounding)(obj)
 
 
 def signif(x: float, digits: int) -> float:
@@ -197,7 +1715,19 @@ def signif(x: float, digits: int) -> float:
     123.0
     >>> signif(123.123123, 1)
     100.0
+
+    Decimals are rounded exactly, with the rounding of the current
+    decimal context, and stay Decimals:
+
+    >>> signif(Decimal("123.456"), 4)
+    Decimal('123.5')
+    >>> signif(Decimal("123456"), 2)
+    Decimal('1.2E+5')
     """
+    if isinstance(x, Decimal):
+        return _signif_decimal(x, digits)
+    if isinstance(x, Fraction):
+        return _signif_fraction(x, digits)
     if x == 0:
         return 0
     if not isinstance(x, Number) or isinstance(x, complex):
@@ -215,7 +1745,243 @@ def signif(x: float, digits: int) -> float:
         return type(x)(shifted / magnitude)
 
 
-def round_object(obj: Any, digits: int = 0, use_copy: bool = False) -> Any:
+def _ndarray_by_parts(np, kernel, x, out):
+    # floor and ceil have no complex counterparts in NumPy, so
+    # complex numbers are rounded part by part, like in convert_complex
+    result = kernel(x.real) + kernel(x.imag) * 1j
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+
+def _ndarray_round(np, x, digits=0, out=None):
+    if x.dtype.kind in "iu" and digits >= 0:
+        return x if out is not None else x.copy()
+    return np.round(x, digits, out=out)
+
+
+def _ndarray_floor(np, x, out=None):
+    if x.dtype.kind in "iu":
+        return x if out is not None else x.copy()
+    if x.dtype.kind == "c":
+        return _ndarray_by_parts(np, np.floor, x, out)
+    return np.floor(x, out=out)
+
+
+def _ndarray_ceil(np, x, out=None):
+    if x.dtype.kind in "iu":
+        return x if out is not None else x.copy()
+    if x.dtype.kind == "c":
+        return _ndarray_by_parts(np, np.ceil, x, out)
+    return np.ceil(x, out=out)
+
+
+def _pow10(power: int) -> float:
+    try:
+        return math.pow(10, power)
+    except OverflowError:
+        return math.inf
+
+
+def _ndarray_signif(np, x, digits, out=None):
+    """Vectorized signif() for NumPy arrays.
+
+    Zeros, infinities and NaNs are kept as they are; integer arrays
+    keep their dtype.
+    """
+    if x.dtype.kind == "c":
+        return _ndarray_by_parts(
+            np, lambda part: _ndarray_signif(np, part, digits), x, out
+        )
+    values = x.astype(float)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        d = np.ceil(np.log10(np.abs(values)))
+        finite = np.isfinite(d)
+        magnitude = np.ones_like(values)
+        if finite.any():
+            # np.power may differ from math.pow in the last bit, so the
+            # powers of ten are taken from signif's own arithmetic
+            low = int(d[finite].min())
+            high = int(d[finite].max())
+            powers = np.array(
+                [_pow10(digits - e) for e in range(low, high + 1)]
+            )
+            magnitude[finite] = powers[d[finite].astype(int) - low]
+        result = np.round(values * magnitude) / magnitude
+    result = np.where(values >= 10.0 ** digits, np.round(result), result)
+    keep = ~np.isfinite(result) | (values == 0)
+    result = np.where(keep, values, result)
+    if x.dtype.kind in "iu":
+        result = np.rint(result)
+    if out is None:
+        return result.astype(x.dtype)
+    out[...] = result
+    return out
+
+
+_IDEMPOTENT_FUNCS = (builtins.round, math.floor, math.ceil, signif)
+
+_ndarray_kernels = {
+    builtins.round: _ndarray_round,
+    math.floor: _ndarray_floor,
+    math.ceil: _ndarray_ceil,
+    signif: _ndarray_signif,
+}
+
+# Below this length, converting a list to a NumPy array and back
+# costs more than rounding its elements one by one.
+NUMPY_MIN_LENGTH = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy() -> Optional[types.ModuleType]:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _signif_floats(values, digits: int) -> list:
+    # The same arithmetic as in signif(), but the powers of ten are
+    # computed once per magnitude instead of twice per number.
+    log10 = math.log10
+    ceil = math.ceil
+    powers: Dict[int, float] = {}
+    threshold = math.pow(10, digits)
+    result: list = []
+    append = result.append
+    for x in values:
+        if type(x) is not float:
+            append(signif(x, digits))
+            continue
+        if x == 0:
+            append(0)
+            continue
+        d = ceil(log10(abs(x)))
+        try:
+            magnitude = powers[d]
+        except KeyError:
+            magnitude = powers[d] = math.pow(10, digits - d)
+        shifted = builtins.round(x * magnitude)
+        if x >= threshold:
+            append(float(builtins.round(shifted / magnitude)))
+        else:
+            append(shifted / magnitude)
+    return result
+
+
+def _signif_vectorizable(np, x, digits: int) -> bool:
+    # NaNs, infinities and numbers so small that their power of ten
+    # overflows are left to the loop, in which signif() raises for them,
+    # like for a short sequence; _ndarray_signif() keeps them instead.
+    if not np.isfinite(x).all():
+        return False
+    nonzero = np.abs(x[x != 0])
+    if not nonzero.size:
+        return True
+    d = math.ceil(math.log10(float(nonzero.min())))
+    return not math.isinf(_pow10(digits - d))
+
+
+def signif_many(values: Any, digits: int = 3) -> Any:
+    """Round many numbers to significant digits at once.
+
+    The result is the same as that of calling signif() for each number,
+    but computed in bulk: vectorized with NumPy when it is installed and
+    the input is large enough, and in a tight loop otherwise.
+
+    Args:
+        values: a sequence of numbers, an array.array or a NumPy array
+        digits (int, optional): number of significant digits.
+            Defaults to 3.
+    Returns:
+        a NumPy array for a NumPy array, an array.array for an
+            array.array, and a list for any other sequence
+    >>> signif_many([1.2222, 12222.0, 0.012345], 3)
+    [1.22, 12200.0, 0.0123]
+    >>> signif_many(array.array("d", [1.2222, 0.012345]), 2)
+    array('d', [1.2, 0.012])
+    """
+    np = _numpy()
+    if np is not None and isinstance(values, np.ndarray):
+        return _ndarray_signif(np, values, digits)
+    if len(values) >= NUMPY_MIN_LENGTH:
+        np = _import_numpy()
+    else:
+        np = None
+    if isinstance(values, array.array):
+        if np is not None and values.typecode in "fd":
+            x = np.frombuffer(values, dtype=values.typecode)
+            if _signif_vectorizable(np, x, digits):
+                result = _ndarray_signif(np, x, digits)
+                return array.array(values.typecode, result.tobytes())
+        return array.array(values.typecode, _signif_floats(values, digits))
+    if np is not None and _all_floats(values):
+        x = np.array(values, dtype=float)
+        if not _signif_vectorizable(np, x, digits):
+            return _signif_floats(values, digits)
+        result = _ndarray_signif(np, x, digits).tolist()
+        for i in np.flatnonzero(x == 0).tolist():
+            result[i] = 0  # like in signif()
+        return result
+    return _signif_floats(values, digits)
+
+
+def _ndarray_round_floats(np, x, digits: int) -> list:
+    """round() of each number in a float array, vectorized.
+
+    np.round() scales the numbers by a power of ten, which can move a
+    number to the other side of the half between two results, so the
+    numbers whose scaled values are too close to a half to tell (and
+    those too large to be scaled exactly) are rounded by round() itself.
+    Dividing the rounded values back is correctly rounded, like round().
+    """
+    scale = 10.0 ** abs(digits)
+    with np.errstate(over="ignore", invalid="ignore"):
+        scaled = x * scale if digits >= 0 else x / scale
+        result = np.rint(scaled)
+        result = result / scale if digits >= 0 else result * scale
+        size = np.abs(scaled)
+        exact = (np.abs(scaled - np.floor(scaled) - 0.5) > size * 2.0**-50) & (
+            size < 2.0**52
+        )
+    values = result.tolist()
+    for i in np.flatnonzero(~exact).tolist():
+        values[i] = builtins.round(float(x[i]), digits)
+    return values
+
+
+def _round_floats(values: list, digits: int) -> list:
+    # round() of each float, vectorized for long lists if NumPy is
+    # installed; the powers of ten are exact up to 10**22
+    np = None
+    if len(values) >= NUMPY_MIN_LENGTH and abs(digits) <= 22:
+        np = _import_numpy()
+    if np is None:
+        return list(map(builtins.round, values, itertools.repeat(digits)))
+    return _ndarray_round_floats(np, np.array(values, dtype=float), digits)
+
+
+_many_kernels = {
+    signif: signif_many,
+}
+
+_fraction_funcs = {
+    builtins.round: _round_fraction,
+    signif: _signif_fraction,
+    math.floor: _floor_fraction,
+    math.ceil: _ceil_fraction,
+}
+
+
+def round_object(
+    obj: Any,
+    digits: int = 0,
+    use_copy: bool = False,
+    rounding: Optional[str] = None,
+) -> Any:
     """Round numbers in a Python object.
     Args:
         obj (any): any Python object
@@ -224,6 +1990,10 @@ def round_object(obj: Any, digits: int = 0, use_copy: bool = False) -> Any:
             object? Defaults to False, in which case mutable objects (a list
             or a dict, for instance) will be affected inplace. In the case of
             unpickable objects, TypeError will be raised.
+        rounding (str, optional): rounding mode for Decimal numbers, such as
+            decimal.ROUND_HALF_UP. Defaults to None, which means the
+            rounding of the current decimal context (ROUND_HALF_EVEN, unless
+            changed).
     Returns:
         any: the object with values rounded to requested number of digits
     >>> round_object(12.12, 1)
@@ -235,8 +2005,49 @@ def round_object(obj: Any, digits: int = 0, use_copy: bool = False) -> Any:
     >>> obj = {'number': 12.323, 'string': 'whatever', 'list': [122.45, .01]}
     >>> round_object(obj, 2)
     {'number': 12.32, 'string': 'whatever', 'list': [122.45, 0.01]}
+    >>> round_object([Decimal("2.675"), Decimal("2.665")], 2)
+    [Decimal('2.68'), Decimal('2.66')]
+    >>> round_object([Decimal("2.665")], 2, rounding=decimal.ROUND_HALF_UP)
+    [Decimal('2.67')]
+    """
+    return _do(builtins.round, obj, [digits], use_copy, rounding)
+
+
+async def round_object_async(
+    obj: Any,
+    digits: int = 0,
+    use_copy: bool = False,
+    chunk_size: int = ASYNC_CHUNK_SIZE,
+    executor: Union[Executor, bool, None] = None,
+    rounding: Optional[str] = None,
+) -> Any:
+    """Round numbers in a Python object without blocking the event loop.
+
+    The same as round_object(), but the event loop can run other tasks
+    after every chunk_size objects are rounded; alternatively, the object
+    can be rounded by an executor. See Rounder.call_async().
+
+    Args:
+        obj (any): any Python object
+        digits (int, optional): number of digits. Defaults to 0.
+        use_copy (bool, optional): use a deep copy or work with the original
+            object? Defaults to False.
+        chunk_size (int, optional): number of objects rounded at a time.
+            Defaults to ASYNC_CHUNK_SIZE.
+        executor (concurrent.futures.Executor or bool, optional): an
+            executor that rounds the object; True means the default
+            executor of the event loop. Defaults to None.
+        rounding (str, optional): rounding mode for Decimal numbers, as in
+            round_object(). Defaults to None.
+    Returns:
+        any: the object with values rounded to requested number of digits
+    >>> asyncio.run(round_object_async({"a": [1.234, 5.678]}, 2))
+    {'a': [1.23, 5.68]}
     """
-    return _do(builtins.round, obj, [digits], use_copy)
+    if type(obj) in (float, int) and _active_stats.get() is None:
+        return builtins.round(obj, digits)
+    rounder = _get_rounder(builtins.round, [digits], use_copy, rounding)
+    return await rounder.call_async(obj, chunk_size, executor)
 
 
 def ceil_object(obj: Any, use_copy: bool = False) -> Any:
@@ -286,7 +2097,12 @@ def floor_object(obj: Any, use_copy: bool = False) -> Any:
     return _do(math.floor, obj, [], use_copy)
 
 
-def signif_object(obj: Any, digits: int = 3, use_copy: bool = False):
+def signif_object(
+    obj: Any,
+    digits: int = 3,
+    use_copy: bool = False,
+    rounding: Optional[str] = None,
+):
     """Round numbers in a Python object to requested significant digits.
     Args:
         obj (any): any Python object
@@ -294,6 +2110,9 @@ def signif_object(obj: Any, digits: int = 3, use_copy: bool = False):
         use_copy (bool, optional): use a deep copy or work with the original
             object? Defaults to False, in which case mutable objects (a list
             or a dict, for instance) will be affect inplace.
+        rounding (str, optional): rounding mode for Decimal numbers, such as
+            decimal.ROUND_HALF_UP. Defaults to None, which means the
+            rounding of the current decimal context.
     Returns:
         any: the object with values rounded to requested number of significant
             digits
@@ -314,8 +2133,10 @@ def signif_object(obj: Any, digits: int = 3, use_copy: bool = False):
     >>> obj = {'number': 12.323, 'string': 'whatever', 'list': [122.45, .01]}
     >>> signif_object(obj, 3)
     {'number': 12.3, 'string': 'whatever', 'list': [122.0, 0.01]}
+    >>> signif_object([Decimal("0.0012345"), Decimal("-98.765")], 3)
+    [Decimal('0.00123'), Decimal('-98.8')]
     """
-    return _do(signif, obj, [digits], use_copy)
+    return _do(signif, obj, [digits], use_copy, rounding)
 
 
 def map_object(
@@ -395,3 +2216,831 @@ def map_object_clean(
     {'number': 3.51, 'string': 'whatever', 'list': [11.1, 0.1]}
     """
     return _do(map_function, obj, [], use_copy)
+
+
+@dataclasses.dataclass(frozen=True)
+class Signif:
+    """Rule of a rounding policy: round numbers to significant digits.
+
+    In a policy, a plain int means decimal digits, as in round_object(),
+    while Signif(n) means n significant digits, as in signif_object().
+
+    >>> Signif(3)
+    Signif(digits=3)
+    """
+
+    digits: int
+
+
+# number of keys whose matched rules are cached per state of a policy
+POLICY_KEYS_CACHE_SIZE = 10_000
+
+_NO_RULE = object()
+
+
+def _policy_action(pattern: str, value: Any) -> Optional[Tuple[Callable, int]]:
+    # (function, digits) rounding the numbers under a rule, or None,
+    # which keeps them as they are
+    if value is None:
+        return None
+    func: Callable[[Any, int], Any]
+    if isinstance(value, Signif):
+        func, digits = signif, value.digits
+    else:
+        func, digits = builtins.round, value
+    if not isinstance(digits, int) or isinstance(digits, bool):
+        raise TypeError(
+            f"digits for {pattern!r} must be an int, Signif or None, "
+            f"not {value!r}"
+        )
+    return func, digits
+
+
+def _part_matcher(part: str) -> Callable[[str], Any]:
+    if not any(char in part for char in "*?["):
+        return part.__eq__
+    return re.compile(fnmatch.translate(part)).match
+
+
+def _keep_number(x: Number) -> Number:
+    return x
+
+
+# types whose objects have no keys for the rules of a policy, so the
+# rule in effect applies to all the numbers in them
+_POLICY_LEAF_TYPES = (
+    Number,
+    Set,
+    Mapping,
+    UserList,
+    array.array,
+    memoryview,
+    deque,
+    Iterator,
+    AsyncIterator,
+    io.IOBase,
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+)
+
+
+class RoundingPolicy:
+    """Compiled rounding policy: digits chosen by the keys leading to numbers.
+
+    The rules are compiled once, at construction, and each object is
+    rounded in a single traversal, whatever the number of rules.
+
+    Args:
+        rules (mapping): maps key patterns to digits: an int for decimal
+            digits (as in round_object()), Signif(n) for significant
+            digits (as in signif_object()), or None, which keeps numbers
+            as they are. A pattern matches keys of dicts, fields of
+            namedtuples and attributes of instances; it can have
+            shell-style wildcards (*, ?, [seq]), as in fnmatch, and dots
+            between the keys of nested objects, like "geo.*" for any key
+            right under a "geo" key. Patterns match at any depth.
+        default (int, Signif or None, optional): digits for numbers that
+            no rule matches. Defaults to None, which keeps them as they
+            are.
+        use_copy (bool, optional): use a deep copy or work with the
+            original object? Defaults to False, in which case mutable
+            objects will be affected inplace.
+
+    A rule applies to everything under the key it matches, unless
+    another rule matches a key deeper down. When several rules match
+    the same key, the one with more dotted parts wins, then the one
+    without wildcards, then the one given first. Items of lists and
+    tuples get the rule of their container. In other objects (deques,
+    sets, arrays, NumPy arrays, Decimals and so on), all numbers are
+    rounded by the rule in effect, as round_object() or signif_object()
+    would round them. Keys that are not strings match no rule.
+
+    >>> policy = RoundingPolicy({"price": 2, "geo.*": 6, "lat*": Signif(2)})
+    >>> policy({
+    ...     "price": 9.87654,
+    ...     "geo": {"lat": 52.2296756, "lon": 21.0122287},
+    ...     "latency": [12.3456, 0.123456],
+    ...     "count": 1.5,
+    ... })  # doctest: +NORMALIZE_WHITESPACE
+    {'price': 9.88, 'geo': {'lat': 52.229676, 'lon': 21.012229},
+     'latency': [12.0, 0.12], 'count': 1.5}
+    """
+
+    def __init__(
+        self,
+        rules: "Mapping[str, Union[int, Signif, None]]",
+        default: Union[int, Signif, None] = None,
+        use_copy: bool = False,
+    ):
+        self.rules = dict(rules)
+        self.default = default
+        self.use_copy = use_copy
+        self._handlers: Dict[type, Callable] = {}
+        self._convert = self._compile()
+        _policies.add(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.rules!r}, {self.default!r}, "
+            f"use_copy={self.use_copy!r})"
+        )
+
+    def __call__(self, obj: Any) -> Any:
+        try:
+            return self._convert(obj)
+        except Exception:
+            return obj
+
+    def _compile(self) -> Callable[[Any], Any]:
+        use_copy = self.use_copy
+        default = _policy_action("default", self.default)
+        compiled = []
+        for index, (pattern, value) in enumerate(self.rules.items()):
+            if not isinstance(pattern, str):
+                raise TypeError(
+                    f"rule patterns must be str, not {type(pattern).__name__}"
+                )
+            parts = pattern.split(".")
+            if not all(parts):
+                raise ValueError(f"empty key in rule pattern {pattern!r}")
+            wildcards = any(char in pattern for char in "*?[")
+            priority = (-len(parts), wildcards, index)
+            matchers = tuple(map(_part_matcher, parts))
+            action = _policy_action(pattern, value)
+            compiled.append((priority, matchers, action))
+        # the rules in the order of precedence
+        rules = [rule[1:] for rule in sorted(compiled)]
+        no_state: frozenset = frozenset()
+
+        # A state is the set of pairs (rule index, number of its parts
+        # matched) for rules matched partially by the keys leading to
+        # an object. Each key moves to another state and possibly
+        # matches a rule; this depends only on the state and the key, so
+        # it is computed once and cached.
+
+        def step(state, key):
+            matched = _NO_RULE
+            partial = []
+            if isinstance(key, str):
+                for index, (matchers, action) in enumerate(rules):
+                    for position, matcher in enumerate(matchers):
+                        if position and (index, position) not in state:
+                            continue
+                        if not matcher(key):
+                            continue
+                        if position + 1 < len(matchers):
+                            partial.append((index, position + 1))
+                        elif matched is _NO_RULE:
+                            matched = action
+            return matched, frozenset(partial)
+
+        transitions: Dict[frozenset, dict] = {}
+
+        def convert_fields(names, values, action, state, memo):
+            # values converted by the rules their names (keys) match
+            table = transitions.get(state)
+            if table is None:
+                table = transitions[state] = {}
+            converted = []
+            for name, value in zip(names, values):
+                found = table.get(name)
+                if found is None:
+                    found = step(state, name)
+                    if len(table) < POLICY_KEYS_CACHE_SIZE:
+                        table[name] = found
+                rule, next_state = found
+                if rule is _NO_RULE:
+                    rule = action
+                converted.append(convert(value, rule, next_state, memo))
+            return converted
+
+        # As in Rounder, the memo maps each container already seen to a
+        # pair (container, result), but the key includes the rule and
+        # the state, since the same container can be reached by keys
+        # matching different rules.
+
+        def convert_other(obj, action, state, memo):
+            if action is None:
+                if not use_copy:
+                    return obj
+                return _get_rounder(_keep_number, [], use_copy)(obj)
+            func, digits = action
+            return _get_rounder(func, [digits], use_copy)(obj)
+
+        def convert_dict(obj, action, state, memo):
+            key = (id(obj), action, state)
+            if key in memo:
+                return memo[key][1]
+            return_obj = type(obj)() if use_copy else obj
+            memo[key] = (obj, return_obj)
+            names = list(obj)
+            values = convert_fields(names, obj.values(), action, state, memo)
+            for k, v in zip(names, values):
+                return_obj[k] = v
+            return return_obj
+
+        def convert_list(obj, action, state, memo):
+            if action is not None and _numbers_only(obj):
+                return convert_other(obj, action, state, memo)
+            key = (id(obj), action, state)
+            if key in memo:
+                return memo[key][1]
+            if not use_copy or type(obj) is list:
+                return_obj = obj if not use_copy else []
+                memo[key] = (obj, return_obj)
+                return_obj[:] = [convert(x, action, state, memo) for x in obj]
+                return return_obj
+            values = [convert(x, action, state, memo) for x in obj]
+            if key in memo:  # created already, through a reference cycle
+                return memo[key][1]
+            return_obj = type(obj)(values)
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        def convert_tuple(obj, action, state, memo):
+            key = (id(obj), action, state)
+            if key in memo:
+                return memo[key][1]
+            values = [convert(x, action, state, memo) for x in obj]
+            if key in memo:  # created already, through a reference cycle
+                return memo[key][1]
+            return_obj = type(obj)(values)
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        def convert_namedtuple(obj, action, state, memo):
+            key = (id(obj), action, state)
+            if key in memo:
+                return memo[key][1]
+            values = convert_fields(obj._fields, obj, action, state, memo)
+            if key in memo:  # created already, through a reference cycle
+                return memo[key][1]
+            return_obj = obj._replace(**dict(zip(obj._fields, values)))
+            memo[key] = (obj, return_obj)
+            return return_obj
+
+        def convert_instance(obj, action, state, memo):
+            key = (id(obj), action, state)
+            if key in memo:
+                return memo[key][1]
+            return_obj = copy.copy(obj) if use_copy else obj
+            memo[key] = (obj, return_obj)
+            names = list(vars(obj))
+            values = convert_fields(
+                names, list(vars(obj).values()), action, state, memo
+            )
+            for k, v in zip(names, values):
+                return_obj.__dict__[k] = v
+            return return_obj
+
+        def make_frozen_handler(replace, fields):
+            names = [name for name, _ in fields]
+
+            def convert_frozen(obj, action, state, memo):
+                key = (id(obj), action, state)
+                if key in memo:
+                    return memo[key][1]
+                values = convert_fields(
+                    names,
+                    [getattr(obj, name) for name in names],
+                    action,
+                    state,
+                    memo,
+                )
+                if key in memo:  # created already, through a reference cycle
+                    return memo[key][1]
+                return_obj = replace(
+                    obj, **{arg: v for (_, arg), v in zip(fields, values)}
+                )
+                memo[key] = (obj, return_obj)
+                return return_obj
+
+            return convert_frozen
+
+        def choose_handler(obj):
+            cls = type(obj)
+            if _find_registered(cls) is not None:
+                return convert_other
+            if cls.__module__.partition(".")[0] in ("numpy", "pandas"):
+                return convert_other
+            if isinstance(obj, dict):
+                return convert_dict
+            if isinstance(obj, list):
+                return convert_list
+            if isinstance(obj, tuple):
+                if hasattr(obj, "_fields"):  # it's a namedtuple
+                    return convert_namedtuple
+                return convert_tuple
+            if isinstance(obj, _POLICY_LEAF_TYPES):
+                return convert_other
+            frozen = _frozen_fields(cls)
+            if frozen is not None:
+                return make_frozen_handler(*frozen)
+            if hasattr(obj, "__dict__") and not _slot_names(cls):
+                return convert_instance
+            return convert_other
+
+        handlers = self._handlers
+
+        def convert(obj, action, state, memo):
+            cls = type(obj)
+            if cls is float or cls is int:
+                if action is None:
+                    return obj
+                return action[0](obj, action[1])
+            if cls is str or obj is None:
+                return obj
+            handler = handlers.get(cls)
+            if handler is None:
+                handler = handlers[cls] = choose_handler(obj)
+            return handler(obj, action, state, memo)
+
+        def convert_object(obj):
+            return convert(obj, default, no_state, {})
+
+        return convert_object
+
+
+@functools.lru_cache(maxsize=128)
+def _get_policy(
+    rules: Tuple[Tuple[str, Any], ...],
+    default: Union[int, Signif, None],
+    use_copy: bool,
+) -> RoundingPolicy:
+    return RoundingPolicy(dict(rules), default, use_copy)
+
+
+def round_by_policy(
+    obj: Any,
+    policy: Union[
+        "Mapping[str, Union[int, Signif, None]]", RoundingPolicy
+    ],
+    default: Union[int, Signif, None] = None,
+    use_copy: bool = False,
+) -> Any:
+    """Round numbers in a Python object, with digits chosen by their keys.
+
+    Different fields can be rounded differently, e.g., prices to 2
+    decimal digits and latencies to 3 significant digits, in a single
+    traversal of the object. See RoundingPolicy for how the rules are
+    matched. Compiled policies are cached, so the rules of a policy
+    given as a dict are compiled once for all the calls with it.
+
+    Args:
+        obj (any): any Python object
+        policy (mapping or RoundingPolicy): maps key patterns to digits:
+            an int for decimal digits, Signif(n) for significant digits,
+            or None to keep numbers as they are
+        default (int, Signif or None, optional): digits for numbers that
+            no rule matches. Defaults to None, which keeps them as they
+            are. Ignored for a RoundingPolicy, which has its own.
+        use_copy (bool, optional): use a deep copy or work with the
+            original object? Defaults to False, in which case mutable
+            objects will be affected inplace. Ignored for a
+            RoundingPolicy, which has its own.
+    Returns:
+        any: the object with values rounded by the policy
+    >>> obj = {"price": 9.87654, "geo": {"lat": 52.2296756}, "n": 1.234}
+    >>> round_by_policy(obj, {"price": 2, "geo.*": 4}, default=Signif(2))
+    {'price': 9.88, 'geo': {'lat': 52.2297}, 'n': 1.2}
+    >>> round_by_policy([{"id": 12345, "x": 1.2345}], {"id": None}, 1)
+    [{'id': 12345, 'x': 1.2}]
+    """
+    if isinstance(policy, RoundingPolicy):
+        return policy(obj)
+    try:
+        compiled = _get_policy(tuple(policy.items()), default, use_copy)
+    except TypeError:  # unhashable digits, which RoundingPolicy rejects
+        compiled = RoundingPolicy(policy, default, use_copy)
+    return compiled(obj)
+
+
+_RECORD_NUMBER_TYPES = frozenset([float, int, bool])
+
+
+def _record_spec(obj: Any, seen: frozenset = frozenset()) -> tuple:
+    """Get the spec of a record from an example of it.
+
+    A spec is a tuple (kind, class, fields), where fields is a tuple of
+    pairs (key, spec of the value); kind is "number", "str" or "none"
+    for values of these types, "dict", "namedtuple", "frozen" (a frozen
+    dataclass or attrs class) or "instance" (a dataclass) for records,
+    "list" for lists of records (with the spec of an item as fields) and
+    "generic" for anything else, which is converted by a Rounder.
+    """
+    cls = type(obj)
+    if cls in _RECORD_NUMBER_TYPES:
+        return ("number", cls, ())
+    if cls is str:
+        return ("str", cls, ())
+    if obj is None:
+        return ("none", cls, ())
+    if id(obj) in seen or _find_registered(cls) is not None:
+        return ("generic", cls, ())
+    seen = seen | {id(obj)}
+    if cls is dict:
+        fields = tuple((k, _record_spec(v, seen)) for k, v in obj.items())
+        return ("dict", cls, fields)
+    if cls is list:
+        if obj and _record_spec(obj[0], seen)[0] in _RECORD_KINDS:
+            return ("list", cls, _record_spec(obj[0], seen))
+        return ("generic", cls, ())
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        fields = tuple(
+            (name, _record_spec(value, seen))
+            for name, value in zip(obj._fields, obj)
+        )
+        return ("namedtuple", cls, fields)
+    frozen = _frozen_fields(cls)
+    if frozen is not None:
+        fields = tuple(
+            ((name, arg), _record_spec(getattr(obj, name), seen))
+            for name, arg in frozen[1]
+        )
+        return ("frozen", cls, fields)
+    if (
+        dataclasses.is_dataclass(obj)
+        and hasattr(obj, "__dict__")
+        and not _slot_names(cls)
+    ):
+        fields = tuple(
+            (k, _record_spec(v, seen)) for k, v in vars(obj).items()
+        )
+        return ("instance", cls, fields)
+    return ("generic", cls, ())
+
+
+def _schema_spec(schema: Any, seen: frozenset = frozenset()) -> tuple:
+    """Get the spec of a record from its type; see _record_spec()."""
+    if schema in _RECORD_NUMBER_TYPES:
+        return ("number", schema, ())
+    if schema is str:
+        return ("str", schema, ())
+    if schema is None or schema is type(None):
+        return ("none", type(None), ())
+    if typing.get_origin(schema) is list:
+        item = _schema_spec((typing.get_args(schema) or (Any,))[0], seen)
+        if item[0] in _RECORD_KINDS:
+            return ("list", list, item)
+    if not isinstance(schema, type) or schema in seen:
+        return ("generic", schema, ())
+    seen = seen | {schema}
+    hints = typing.get_type_hints(schema)
+
+    def spec(name):
+        return _schema_spec(hints.get(name, Any), seen)
+
+    if issubclass(schema, dict) and hasattr(schema, "__total__"):
+        # a TypedDict, whose instances are dicts
+        return ("dict", dict, tuple((key, spec(key)) for key in hints))
+    if issubclass(schema, tuple) and hasattr(schema, "_fields"):
+        fields = tuple((name, spec(name)) for name in schema._fields)
+        return ("namedtuple", schema, fields)
+    frozen = _frozen_fields(schema)
+    if frozen is not None:
+        fields = tuple(((name, arg), spec(name)) for name, arg in frozen[1])
+        return ("frozen", schema, fields)
+    if dataclasses.is_dataclass(schema) and not _slot_names(schema):
+        fields = tuple(
+            (field.name, spec(field.name))
+            for field in dataclasses.fields(schema)
+        )
+        return ("instance", schema, fields)
+    return ("generic", schema, ())
+
+
+_RECORD_KINDS = ("dict", "namedtuple", "frozen", "instance")
+
+
+def _compile_record(
+    spec: tuple, func: Callable, digits: list, use_copy: bool
+) -> Callable[[Any], Any]:
+    """Generate the converter of records with the given spec.
+
+    The converter first checks the types of all the fields, loading
+    them into local variables, and converts the record only if they all
+    match the spec; it does so without any dispatch, touching only the
+    fields that change. Other records, and records whose conversion
+    fails, are converted by a Rounder, as they would be by _do().
+    """
+    rounder = _get_rounder(func, digits, use_copy)
+    if spec[0] not in _RECORD_KINDS and spec[0] != "list":
+        return rounder
+    namespace: Dict[str, Any] = {
+        "fallback": rounder,
+        "generic": rounder._convert,
+        "func": func,
+        "NUMBERS": _RECORD_NUMBER_TYPES,
+        "copy": copy.copy,
+    }
+    args = "".join(f", d{i}" for i, _ in enumerate(digits))
+    namespace.update((f"d{i}", d) for i, d in enumerate(digits))
+    fail = "return fallback(obj)"
+    checks: list = []  # statements checking the record, in pre-order
+    builds: list = []  # statements converting it, in post-order
+    counter = itertools.count()
+    generic_fields = []
+
+    def name(prefix, value=None):
+        # a new local variable or, if value is given, global name
+        identifier = f"{prefix}{next(counter)}"
+        if value is not None:
+            namespace[identifier] = value
+        return identifier
+
+    def convert_source(spec, var):
+        # Emits the statements for the value in var, and returns the
+        # expression of the converted value.
+        kind, cls, fields = spec
+        if kind == "number":
+            checks.append(f"if type({var}) not in NUMBERS: {fail}")
+            return f"func({var}{args})"
+        if kind == "str":
+            checks.append(f"if type({var}) is not str: {fail}")
+            return var
+        if kind == "none":
+            checks.append(f"if {var} is not None: {fail}")
+            return var
+        if kind == "generic":
+            generic_fields.append(var)
+            return f"generic({var}, memo)"
+        if kind == "list":
+            checks.append(f"if type({var}) is not list: {fail}")
+            compiled = _compile_record(fields, func, digits, use_copy)
+            item = name("item", compiled)
+            if use_copy:
+                return f"list(map({item}, {var}))"
+            builds.append(f"{var}[:] = map({item}, {var})")
+            return var
+        checks.append(f"if type({var}) is not {name('cls', cls)}: {fail}")
+        if kind == "namedtuple":
+            values = [name("v") for _ in fields]
+            if values:
+                checks.append(f"{', '.join(values)}, = {var}")
+            results = [
+                convert_source(field, value)
+                for (_, field), value in zip(fields, values)
+            ]
+            if results == values:
+                return var
+            result = name("r")
+            make = name("make", cls._make)
+            builds.append(f"{result} = {make}(({', '.join(results)},))")
+            return result
+        if kind == "frozen":
+            changes = []
+            for (attribute, arg), field in fields:
+                value = name("v")
+                checks.append(f"{value} = {var}.{attribute}")
+                converted = convert_source(field, value)
+                if converted != value:
+                    changes.append(f"{arg}={converted}")
+            if not changes:
+                return var
+            result = name("r")
+            replace = name("replace", _frozen_fields(cls)[0])
+            builds.append(f"{result} = {replace}({var}, {', '.join(changes)})")
+            return result
+        # a dict or an instance, changed inplace or in a copy
+        items = var
+        if kind == "instance":
+            items = name("vars")
+            checks.append(f"{items} = {var}.__dict__")
+        checks.append(f"if len({items}) != {len(fields)}: {fail}")
+        changes = []
+        for key, field in fields:
+            value = name("v")
+            key = name("key", key)
+            checks.append(f"{value} = {items}[{key}]")
+            converted = convert_source(field, value)
+            if converted != value:
+                changes.append((key, converted))
+        result = var
+        if use_copy:
+            result = name("r")
+            if kind == "dict":
+                builds.append(f"{result} = {var}.copy()")
+                items = result
+            else:
+                builds.append(f"{result} = copy({var})")
+                items = f"{result}.__dict__"
+        builds.extend(f"{items}[{key}] = {new}" for key, new in changes)
+        return result
+
+    result = convert_source(spec, "obj")
+    if generic_fields:
+        # shared by the fields, as in one call of a Rounder
+        builds.insert(0, "memo = {}")
+    lines = [
+        "def convert_record(obj):",
+        "    try:",
+        *(f"        {statement}" for statement in checks + builds),
+        f"        return {result}",
+        "    except Exception:",
+        "        return fallback(obj)",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["convert_record"]
+
+
+def compile(
+    example_or_schema: Any,
+    digits: Optional[int] = 0,
+    use_copy: bool = False,
+    func: Callable[..., Number] = builtins.round,
+) -> Callable[[Any], Any]:
+    """Compile a converter specialized for records of a fixed shape.
+
+    The shape is taken from an example record, or from a type: a
+    TypedDict, a dataclass or a NamedTuple. The converter checks that a
+    record has this shape and rounds its numeric fields directly,
+    without looking up a handler for each object; other values (lists
+    of numbers, Decimals, and so on) are converted as usual. Records of
+    another shape are converted in the usual way, so the results are
+    always the same as those of round_object() (or Rounder(func, digits,
+    use_copy), if func is given), only faster for records of the shape.
+
+    Records can be dicts, namedtuples, dataclass instances (frozen or
+    not) and frozen attrs instances, nested in each other; lists of
+    records are compiled to the converter of their first record.
+    Records are expected to be trees: a record shared by several fields
+    is converted for each of them.
+
+    Args:
+        example_or_schema (any): an example record, or its type
+        digits (int, optional): number of digits; None means func is
+            called with the number only. Defaults to 0.
+        use_copy (bool, optional): use a copy of a record or work with
+            the original one? Defaults to False, in which case records
+            are changed inplace.
+        func (callable, optional): function applied to each number.
+            Defaults to round.
+    Returns:
+        callable: function converting a record, returning the result
+    >>> round_record = compile({"id": 7, "name": "x", "price": 9.876}, 2)
+    >>> round_record({"id": 8, "name": "y", "price": 1.2345})
+    {'id': 8, 'name': 'y', 'price': 1.23}
+    >>> round_record({"price": "free", "other": 2.345})  # another shape
+    {'price': 'free', 'other': 2.35}
+    """
+    if isinstance(example_or_schema, type) or typing.get_origin(
+        example_or_schema
+    ):
+        spec = _schema_spec(example_or_schema)
+    else:
+        spec = _record_spec(example_or_schema)
+    digits_list = [] if digits is None else [digits]
+    return _compile_record(spec, func, digits_list, use_copy)
+
+
+ROUND_RECORDS_OUTPUTS = ("records", "lists", "arrays")
+
+_TEXT = frozenset([str, type(None)])
+# values of flat records: those in other columns are traversed
+_FLAT = _FLOAT_INT | _TEXT | frozenset([bool, complex, Decimal, Fraction])
+
+
+def _columns(records: list, keys: Iterable) -> Optional[Dict[Any, list]]:
+    # The values of each key, or None if a record has no such key.
+    columns = {}
+    for key in keys:
+        try:
+            columns[key] = list(map(operator.itemgetter(key), records))
+        except KeyError:
+            return None
+    return columns
+
+
+def round_records(
+    records: Any,
+    digits: int = 0,
+    use_copy: bool = False,
+    output: str = "records",
+) -> Any:
+    """Round numbers in a list of records (dicts), column by column.
+
+    The records are transposed into columns, one per key, and each
+    column is rounded at once: a column of floats (vectorized with
+    NumPy, if it is installed and the column is long enough), of floats
+    and ints, or, for columns with other values, value by value, as in
+    round_object(). Columns of strings and None are not touched. The
+    result is the same as that of round_object(records, digits,
+    use_copy), which is used for anything else than a list of distinct
+    flat dicts with the same keys: for records with containers or other
+    objects in them, a single traversal by round_object() is faster.
+
+    With output="lists" or output="arrays", the result is a dict of
+    columns instead, each a list or a NumPy array (of the numbers'
+    dtype for columns of numbers, and of objects for other columns);
+    then records can also have different keys, a value missing from a
+    record is None, and the records are not changed.
+
+    Args:
+        records (list): list of dicts
+        digits (int, optional): number of digits. Defaults to 0.
+        use_copy (bool, optional): use copies of the records or work with
+            the original ones? Defaults to False, in which case the
+            records are changed inplace.
+        output (str, optional): "records", "lists" or "arrays". Defaults
+            to "records".
+    Returns:
+        the records with values rounded to requested number of digits,
+            or a dict mapping keys to the columns of rounded values
+    >>> rows = [{"id": 1, "x": 1.2345, "y": None}, {"id": 2, "x": 2.3456}]
+    >>> round_records(rows, 2, output="lists")
+    {'id': [1, 2], 'x': [1.23, 2.35], 'y': [None, None]}
+    >>> round_records(rows[:1], 1)
+    [{'id': 1, 'x': 1.2, 'y': None}]
+    """
+    if output not in ROUND_RECORDS_OUTPUTS:
+        raise ValueError(
+            f"output must be one of {', '.join(ROUND_RECORDS_OUTPUTS)}, "
+            f"not {output!r}"
+        )
+    np = None
+    if output == "arrays":
+        np = _import_numpy()
+        if np is None:
+            raise ImportError('output="arrays" requires NumPy')
+    if output == "records":
+        columns = None
+        if (
+            type(records) is list
+            and records
+            and set(map(type, records)) == {dict}
+            and len(set(map(len, records))) == 1
+            # a record repeated in the list is the same object in the
+            # result, as with round_object(), and not separate copies
+            and len(set(map(id, records))) == len(records)
+        ):
+            columns = _columns(records, records[0])
+        if columns is None:
+            return round_object(records, digits, use_copy)
+    else:
+        records = list(records)
+        for record in records:
+            if not isinstance(record, Mapping):
+                raise TypeError(
+                    f"records must be mappings, not {type(record).__name__}"
+                )
+        keys = dict.fromkeys(itertools.chain.from_iterable(records))
+        columns = _columns(records, keys) or {
+            key: [record.get(key) for record in records] for key in keys
+        }
+        use_copy = True  # the records are not changed
+
+    column_kinds = {key: set(map(type, v)) for key, v in columns.items()}
+    if output == "records" and not all(
+        kinds <= _FLAT for kinds in column_kinds.values()
+    ):
+        return round_object(records, digits, use_copy)
+
+    rounder = _get_rounder(builtins.round, [digits], use_copy)
+    memo: dict = {}
+    rounded = {}
+    try:
+        for key, column in columns.items():
+            kinds = column_kinds[key]
+            if kinds <= _FLOAT:
+                rounded[key] = _round_floats(column, digits)
+            elif kinds == {int} and digits >= 0:
+                continue  # round() would return the same ints
+            elif kinds <= _FLOAT_INT:
+                rounded[key] = list(
+                    map(builtins.round, column, itertools.repeat(digits))
+                )
+            elif not kinds <= _TEXT:
+                # converted like in one call of the Rounder, which also
+                # keeps the references between the values
+                rounded[key] = [rounder._convert(x, memo) for x in column]
+    except Exception:
+        if output == "records":
+            return round_object(records, digits, use_copy)
+        raise
+
+    if output == "records":
+        if use_copy:
+            records = list(map(dict.copy, records))
+        for key, values in rounded.items():
+            # in C, without a loop in Python
+            deque(
+                map(operator.setitem, records, itertools.repeat(key), values),
+                maxlen=0,
+            )
+        return records
+    columns.update(rounded)
+    if output == "lists":
+        return columns
+    assert np is not None  # imported above for output="arrays"
+    for key, values in columns.items():
+        if values and set(map(type, values)) <= _FLOAT_INT:
+            try:
+                columns[key] = np.array(values)
+                continue
+            except OverflowError:  # ints too large for NumPy
+                pass
+        columns[key] = np.fromiter(values, dtype=object, count=len(values))
+    return columns
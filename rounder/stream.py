@@ -0,0 +1,285 @@
+"""Rounding of numbers in JSON and NDJSON documents, in constant memory.
+
+The input is never parsed into Python objects: it is tokenized
+incrementally, numeric literals are rounded and everything else
+(whitespace included) is copied to the output as it is. The result is
+the same as that of rounding the loaded document with round_object(),
+signif_object(), floor_object() or ceil_object(), except that JSON
+booleans, not being numeric literals, are kept:
+
+>>> round_json_text('{"a": 1.2345, "b": [10, "1.2345", 2.5e-3]}', 2)
+'{"a": 1.23, "b": [10, "1.2345", 0.0]}'
+>>> round_json_text('[123456.7, 0.0012345]', 3, method="signif")
+'[123000.0, 0.00123]'
+"""
+
+import builtins
+import contextlib
+import itertools
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Pattern,
+    Union,
+)
+
+from .rounder import signif
+
+
+METHODS: Dict[str, Callable[..., Any]] = {
+    "round": builtins.round,
+    "signif": signif,
+    "floor": math.floor,
+    "ceil": math.ceil,
+}
+
+# digits used when none are given, like the defaults of round_object()
+# and signif_object()
+DEFAULT_DIGITS = {"round": 0, "signif": 3}
+
+CHUNK_SIZE = 64 * 1024
+NDJSON_BATCH_SIZE = 1000
+
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_NUMBER_CHARS = re.compile(r"[-+.0-9eE]+")
+_OTHER = re.compile(r'[^"0-9-]+')
+
+Source = Union[str, os.PathLike, IO[str]]
+
+
+def _get_rounder(
+    method: str, digits: Optional[int]
+) -> Callable[[str], str]:
+    try:
+        func = METHODS[method]
+    except KeyError:
+        raise ValueError(
+            f"method must be one of {', '.join(METHODS)}, not {method!r}"
+        ) from None
+    if method in ("floor", "ceil"):
+        args: tuple = ()
+    else:
+        args = (DEFAULT_DIGITS[method] if digits is None else digits,)
+
+    def round_literal(literal: str) -> str:
+        # A literal whose rounded value cannot be represented (say, 1e400,
+        # which float() turns into inf) is kept, as inf is not valid JSON.
+        try:
+            if "." in literal or "e" in literal or "E" in literal:
+                x = func(float(literal), *args)
+                return repr(x) if math.isfinite(x) else literal
+            return str(func(int(literal), *args))
+        except OverflowError:
+            return literal
+
+    return round_literal
+
+
+def _match_end(pattern: Pattern[str], text: str, pos: int) -> int:
+    # for patterns that are known to match at pos
+    match = pattern.match(text, pos)
+    assert match is not None
+    return match.end()
+
+
+def round_json_chunks(
+    chunks: Iterable[str],
+    digits: Optional[int] = None,
+    method: str = "round",
+) -> Iterator[str]:
+    """Round numbers in a JSON document given in chunks of text.
+
+    Chunks can be split anywhere, also in the middle of a string or
+    a number; only a number split between two chunks is kept in memory
+    until its end is known.
+
+    Args:
+        chunks (iterable of str): consecutive parts of a JSON document
+        digits (int, optional): number of digits (decimal or significant,
+            depending on method). Defaults to None, which means 0 for
+            "round" and 3 for "signif", as in round_object() and
+            signif_object().
+        method (str, optional): "round", "signif", "floor" or "ceil".
+            Defaults to "round".
+    Yields:
+        str: consecutive parts of the rounded document
+    >>> "".join(round_json_chunks(['{"a": 1.23', '45, "b\\\\', '"": 2}'], 1))
+    '{"a": 1.2, "b\\\\"": 2}'
+    """
+    round_literal = _get_rounder(method, digits)
+    in_string = False
+    leftover = ""
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            final = True
+            buffer = leftover
+        else:
+            final = False
+            buffer = leftover + chunk
+        leftover = ""
+        output = []
+        pos, end = 0, len(buffer)
+        while pos < end:
+            if in_string:
+                stop = _match_end(_STRING_BODY, buffer, pos)
+                if stop == end or buffer[stop] == "\\":
+                    # the string (or an escape sequence) goes on
+                    # in the next chunk
+                    output.append(buffer[pos:stop])
+                    leftover = buffer[stop:]
+                    break
+                output.append(buffer[pos : stop + 1])
+                pos = stop + 1
+                in_string = False
+                continue
+            char = buffer[pos]
+            if char == '"':
+                output.append(char)
+                in_string = True
+                pos += 1
+                continue
+            if char == "-" or char.isdigit():
+                if (
+                    _match_end(_NUMBER_CHARS, buffer, pos) == end
+                    and not final
+                ):
+                    # the number may go on in the next chunk
+                    leftover = buffer[pos:]
+                    break
+                match = _NUMBER.match(buffer, pos)
+                if match is None:  # not valid JSON; left as it is
+                    output.append(char)
+                    pos += 1
+                    continue
+                output.append(round_literal(match.group()))
+                pos = match.end()
+                continue
+            stop = _match_end(_OTHER, buffer, pos)
+            output.append(buffer[pos:stop])
+            pos = stop
+        if output:
+            yield "".join(output)
+
+
+def round_json_text(
+    text: str, digits: Optional[int] = None, method: str = "round"
+) -> str:
+    """Round numbers in a JSON document given as a string.
+
+    Args:
+        text (str): a JSON document
+        digits (int, optional): number of digits. Defaults to None,
+            which means 0 for "round" and 3 for "signif".
+        method (str, optional): "round", "signif", "floor" or "ceil".
+            Defaults to "round".
+    Returns:
+        str: the document with rounded numbers
+    """
+    return "".join(round_json_chunks([text], digits, method))
+
+
+@contextlib.contextmanager
+def _open(file: Source, mode: str) -> Iterator[IO[str]]:
+    # opens a path, or uses an already open file without closing it
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, mode, encoding="utf-8") as opened:
+            yield opened
+    else:
+        yield file
+
+
+def _read_chunks(src: IO[str], chunk_size: int) -> Iterator[str]:
+    return iter(lambda: src.read(chunk_size), "")
+
+
+def _round_lines(lines: list, digits: Optional[int], method: str) -> list:
+    return [round_json_text(line, digits, method) for line in lines]
+
+
+def _round_ndjson(
+    src: IO[str],
+    dst: IO[str],
+    digits: Optional[int],
+    method: str,
+    workers: Optional[int],
+    batch_size: int,
+) -> None:
+    batches = iter(lambda: list(itertools.islice(src, batch_size)), [])
+    if workers is None or workers == 1:
+        for batch in batches:
+            dst.writelines(_round_lines(batch, digits, method))
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        # Only a couple of batches per worker are in flight at a time,
+        # so memory use does not depend on the size of the input.
+        pending: list = []
+        max_pending = 2 * workers
+        for batch in batches:
+            pending.append(
+                executor.submit(_round_lines, batch, digits, method)
+            )
+            if len(pending) >= max_pending:
+                dst.writelines(pending.pop(0).result())
+        for future in pending:
+            dst.writelines(future.result())
+
+
+def round_json(
+    src: Source,
+    dst: Source,
+    digits: Optional[int] = None,
+    method: str = "round",
+    ndjson: bool = False,
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    batch_size: int = NDJSON_BATCH_SIZE,
+) -> None:
+    """Round numbers in a JSON or NDJSON file, in constant memory.
+
+    Args:
+        src: path of the input file, or a text file object
+        dst: path of the output file, or a text file object
+        digits (int, optional): number of digits (decimal or significant,
+            depending on method). Defaults to None, which means 0 for
+            "round" and 3 for "signif", as in round_object() and
+            signif_object().
+        method (str, optional): "round", "signif", "floor" or "ceil".
+            Defaults to "round".
+        ndjson (bool, optional): is the input newline-delimited JSON,
+            with one document per line? Defaults to False.
+        workers (int, optional): number of processes that round NDJSON
+            lines in parallel; 0 means as many as CPUs. Defaults to None,
+            in which case the lines are rounded in this process.
+        chunk_size (int, optional): number of characters read at a time
+            from a JSON document
+        batch_size (int, optional): number of NDJSON lines rounded at
+            a time (by one process)
+    """
+    _get_rounder(method, digits)  # validate the arguments early
+    if workers is not None and not ndjson:
+        raise ValueError("workers can only be used for NDJSON input")
+    if workers == 0:
+        workers = os.cpu_count()
+
+    with _open(src, "r") as src_file, _open(dst, "w") as dst_file:
+        if ndjson:
+            _round_ndjson(
+                src_file, dst_file, digits, method, workers, batch_size
+            )
+        else:
+            dst_file.writelines(
+                round_json_chunks(
+                    _read_chunks(src_file, chunk_size), digits, method
+                )
+            )
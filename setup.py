@@ -0,0 +1,18 @@
+"""Build the optional compiled core of rounder.
+
+All metadata lives in pyproject.toml. The extension is optional: if it
+cannot be built (e.g., there is no C compiler), rounder is installed
+without it and uses its pure-Python code.
+"""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "rounder._speedups",
+            sources=["rounder/_speedups.c"],
+            optional=True,
+        )
+    ]
+)
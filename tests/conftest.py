@@ -115,3 +115,15 @@ def obj_set(request):
 )
 def obj_tuple(request):
     return request.param
+
+
+@pytest.fixture
+def registry():
+    """Restore the handlers registered with register_type() after a test."""
+    from rounder.rounder import _registry, _reset_handlers
+
+    saved = dict(_registry)
+    yield _registry
+    _registry.clear()
+    _registry.update(saved)
+    _reset_handlers()
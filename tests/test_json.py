@@ -0,0 +1,174 @@
+import array
+import dataclasses
+import io
+import json
+import math
+import uuid
+from collections import Counter, OrderedDict, deque, namedtuple
+from copy import deepcopy
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+import rounder as r
+import rounder.json as rjson
+
+Point = namedtuple("Point", "x y")
+
+
+def payload():
+    return {
+        "a": 12.22221111,
+        "string": "something nice, ha? ✓",
+        "b": 2,
+        "c": -1.0e-7,
+        "d": [1.12343, 0.023492, 123456789, -0.5, 1.5, 2.5],
+        "e": {
+            "ea": 1 / 44,
+            "eb": (1.333, 2.999),
+            "ec": OrderedDict(eca=1.565656, ecb=1.765765765),
+        },
+        "point": Point(1.2345, 6.789e20),
+        "counts": Counter(a=3),
+        "nothing": None,
+        "empty": [[], {}, ()],
+        "nan": math.nan,
+        "inf": [math.inf, -math.inf],
+        1.23456: "float key",
+        7: "int key",
+        None: "None key",
+    }
+
+
+@pytest.mark.parametrize("digits", [-1, 0, 2, 5])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"indent": 2},
+        {"indent": "\t", "sort_keys": False},
+        {"separators": (",", ":")},
+        {"ensure_ascii": False},
+    ],
+)
+def test_dumps_is_round_then_dump(digits, options):
+    obj = payload()
+    expected = json.dumps(r.round_object(deepcopy(obj), digits), **options)
+    assert rjson.dumps(obj, digits, **options) == expected
+    # the object itself is not changed
+    assert json.dumps(obj) == json.dumps(payload())
+
+
+@pytest.mark.parametrize("digits", [1, 3, 6])
+def test_dumps_is_signif_then_dump(digits):
+    obj = payload()
+    # signif_object() leaves the whole object unrounded for them
+    del obj["nan"], obj["inf"]
+    expected = json.dumps(r.signif_object(deepcopy(obj), digits), indent=1)
+    assert rjson.dumps(obj, signif=digits, indent=1) == expected
+
+
+def test_dumps_sort_keys():
+    obj = {"b": 1.2345, "a": [2.3456], "c": {"z": 1.0, "y": 0.55}}
+    assert rjson.dumps(obj, 1, sort_keys=True) == json.dumps(
+        r.round_object(deepcopy(obj), 1), sort_keys=True
+    )
+
+
+def test_dumps_without_rounding():
+    obj = payload()
+    assert rjson.dumps(obj) == json.dumps(obj)
+
+
+def test_dumps_keeps_booleans_and_keys():
+    obj = {1.2345: True, 12345: [False, 1.2345], True: 0.5}
+    assert rjson.dumps(obj, signif=2) == (
+        '{"1.2345": true, "12345": [false, 1.2], "true": 0.5}'
+    )
+
+
+def test_dumps_exact_numbers():
+    obj = {
+        "decimals": [Decimal("2.665"), Decimal("-0.0001"), Decimal("1E+3")],
+        "fraction": Fraction(2, 3),
+    }
+    assert rjson.dumps(obj, 2) == (
+        '{"decimals": [2.66, -0.00, 1000.00], "fraction": 0.67}'
+    )
+    assert rjson.dumps(Decimal("123456.789"), signif=3) == "1.23E+5"
+
+
+def test_dumps_more_types():
+    @dataclasses.dataclass(frozen=True)
+    class Frozen:
+        x: float
+
+    class Slotted:
+        __slots__ = ("x", "y")
+
+        def __init__(self):
+            self.x = 1.2345
+
+    class Plain:
+        def __init__(self):
+            self.values = deque([1.2345, 2.3456])
+
+    obj = [
+        array.array("d", [1.2345, 2.3456]),
+        {1.2345},
+        frozenset([2.3456]),
+        range(2),
+        iter([1.2345]),
+        Frozen(1.2345),
+        Slotted(),
+        Plain(),
+    ]
+    assert rjson.dumps(obj, 1) == (
+        '[[1.2, 2.3], [1.2], [2.3], [0, 1], [1.2], {"x": 1.2}, {"x": 1.2}, '
+        '{"values": [1.2, 2.3]}]'
+    )
+    with pytest.raises(TypeError, match="UUID"):
+        rjson.dumps([uuid.uuid4()], 1)
+    with pytest.raises(TypeError, match="complex"):
+        rjson.dumps([1 + 2j], 1)
+    assert rjson.dumps([uuid.UUID(int=1)], 1, default=str) == (
+        '["00000000-0000-0000-0000-000000000001"]'
+    )
+
+
+def test_dumps_numbers_that_cannot_be_rounded():
+    obj = [1.2345, math.nan, math.inf, -math.inf]
+    assert rjson.dumps(obj, signif=2) == "[1.2, NaN, Infinity, -Infinity]"
+    assert rjson.dumps(obj, 2) == "[1.23, NaN, Infinity, -Infinity]"
+
+
+def test_dumps_errors():
+    with pytest.raises(ValueError, match="together"):
+        rjson.dumps([1.5], 1, 2)
+    obj = [1.5]
+    obj.append(obj)
+    with pytest.raises(ValueError, match="Circular"):
+        rjson.dumps(obj, 1)
+    with pytest.raises(ValueError, match="JSON compliant"):
+        rjson.dumps([math.nan], 1, allow_nan=False)
+    with pytest.raises(TypeError, match="keys"):
+        rjson.dumps({(1, 2): 1.5}, 1)
+    assert rjson.dumps({(1, 2): 1.5, "a": 1.5}, 0, skipkeys=True) == (
+        '{"a": 2.0}'
+    )
+
+
+def test_dump_and_encoder_class():
+    obj = payload()
+    del obj["nan"], obj["inf"]
+    file = io.StringIO()
+    rjson.dump(obj, file, 3, indent=4)
+    assert file.getvalue() == json.dumps(
+        r.round_object(deepcopy(obj), 3), indent=4
+    )
+    assert json.dumps(obj, cls=rjson.RoundingJSONEncoder, signif=2) == (
+        json.dumps(r.signif_object(deepcopy(obj), 2))
+    )
+    encoder = rjson.RoundingJSONEncoder(digits=1)
+    assert list(encoder.iterencode([1.25, "a"])) == ["[1.2", ', "a"', "]"]
@@ -0,0 +1,186 @@
+import math
+
+import pytest
+import rounder as r
+
+np = pytest.importorskip("numpy")
+
+
+def test_round_ndarray_no_copy():
+    x = np.array([1.2345, 2.3456, -3.4567])
+    x_rounded = r.round_object(x, 2)
+    assert x_rounded is x
+    assert x.tolist() == [1.23, 2.35, -3.46]
+
+
+def test_round_ndarray_copy():
+    x = np.array([[1.2345, 2.3456], [3.4567, 4.5678]])
+    x_rounded = r.round_object(x, 1, use_copy=True)
+    assert x_rounded is not x
+    assert x_rounded.tolist() == [[1.2, 2.3], [3.5, 4.6]]
+    assert x.tolist() == [[1.2345, 2.3456], [3.4567, 4.5678]]
+
+
+def test_floor_ceil_ndarray():
+    x = np.array([1.5, -1.5, 2.0])
+    assert r.floor_object(x, True).tolist() == [1, -2, 2]
+    assert r.ceil_object(x, True).tolist() == [2, -1, 2]
+    assert x.dtype == r.floor_object(x).dtype
+
+    z = np.array([1.5 - 2.5j])
+    assert r.floor_object(z, True).tolist() == [1 - 3j]
+    assert r.ceil_object(z, True).tolist() == [2 - 2j]
+
+
+def test_integer_ndarray():
+    x = np.array([1234, 5678])
+    assert r.round_object(x, 2) is x
+    assert r.floor_object(x, True) is not x
+    assert r.round_object(x, -2, True).tolist() == [1200, 5700]
+    assert r.signif_object(np.array([1444555]), 3).tolist() == [1440000]
+    assert r.signif_object(np.array([1444555]), 3).dtype == x.dtype
+
+
+def test_signif_ndarray_matches_signif():
+    values = [1.444555, 0.00012345, -98765.4321, 123123123123.0002, 7.0]
+    for digits in range(1, 8):
+        x = np.array(values)
+        assert r.signif_object(x, digits).tolist() == [
+            r.signif(v, digits) for v in values
+        ]
+
+
+def test_signif_ndarray_special_values():
+    x = np.array([0.0, np.inf, -np.inf, np.nan, 1.2345])
+    x_rounded = r.signif_object(x, 2, True)
+    assert x_rounded[:3].tolist() == [0.0, np.inf, -np.inf]
+    assert math.isnan(x_rounded[3])
+    assert x_rounded[4] == 1.2
+
+
+def test_map_object_ndarray():
+    x = np.array([1.5, 2.5])
+    assert r.map_object(lambda v: v * 2, x, True).tolist() == [3.0, 5.0]
+    assert x.tolist() == [1.5, 2.5]
+    assert r.map_object(lambda v: v * 2, x) is x
+    assert x.tolist() == [3.0, 5.0]
+
+
+def test_ndarray_nested():
+    obj = {
+        "values": np.array([1.223, 3.3332, 2.323]),
+        "objects": np.array([1.234, "text", [5.678]], dtype=object),
+        "strings": np.array(["a", "b"]),
+        "something_else": "whatever else",
+    }
+    obj_rounded = r.round_object(obj, 1, use_copy=True)
+    assert obj_rounded["values"].tolist() == [1.2, 3.3, 2.3]
+    assert obj_rounded["objects"].tolist() == [1.2, "text", [5.7]]
+    assert obj_rounded["strings"].tolist() == ["a", "b"]
+    assert obj["values"].tolist() == [1.223, 3.3332, 2.323]
+
+
+def test_numpy_scalars():
+    x = r.round_object(np.float64(1.2345), 2)
+    assert x == 1.23
+    assert type(x) is np.float64
+
+    x = r.signif_object(np.float32(123.456), 2)
+    assert x == 120
+    assert type(x) is np.float32
+
+    assert r.floor_object(np.int64(7)) == 7
+    assert r.map_object(lambda v: -v, np.float64(1.5)) == -1.5
+    assert r.round_object(np.bool_(True)) is np.bool_(True)
+
+
+def test_signif_many_ndarray():
+    x = np.array([1.444555, 0.00012345, -98765.4321, 0.0])
+    x_rounded = r.signif_many(x, 3)
+    assert isinstance(x_rounded, np.ndarray)
+    assert x_rounded.tolist() == [1.44, 0.000123, -98800.0, 0.0]
+    assert x.tolist() == [1.444555, 0.00012345, -98765.4321, 0.0]
+
+
+def test_signif_many_bulk_matches_signif():
+    import array
+    import random
+
+    values = [random.uniform(-1e6, 1e6) for _ in range(5000)]
+    values += [10.0**e for e in range(-300, 300)] + [0.0]
+    for digits in (1, 3, 7):
+        expected = [r.signif(v, digits) for v in values]
+        assert r.signif_many(values, digits) == expected
+        assert r.signif_many(array.array("d", values), digits).tolist() == (
+            expected
+        )
+
+
+@pytest.mark.parametrize("length", [10, r.rounder.NUMPY_MIN_LENGTH])
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_signif_many_not_finite_numbers(length, value):
+    import array
+
+    # the same for short and long sequences: signif() raises for them
+    values = [1.2345] * (length - 1) + [value]
+    with pytest.raises((ValueError, OverflowError)):
+        r.signif_many(values, 2)
+    with pytest.raises((ValueError, OverflowError)):
+        r.signif_many(array.array("d", values), 2)
+    assert r.signif_object(values, 2) is values
+    assert values[0] == 1.2345
+
+
+@pytest.mark.parametrize("digits", [1, 3, 7, 15])
+def test_signif_many_near_smallest_numbers(digits):
+    import array
+    import random
+
+    rng = random.Random(digits)
+    values = [
+        rng.choice([-1, 1]) * rng.uniform(1, 10) * 10.0**e
+        for e in range(-324, -290)
+        for _ in range(20)
+    ] + [5e-324, 2.2250738585072014e-308]
+    for value in values:
+        try:
+            expected = r.signif(value, digits)
+        except OverflowError:
+            expected = None
+        # the same result (or error) below and above the threshold
+        for length in (10, r.rounder.NUMPY_MIN_LENGTH):
+            floats = [1.2345] * (length - 1) + [value]
+            for sequence in (floats, array.array("d", floats)):
+                if expected is None:
+                    with pytest.raises(OverflowError):
+                        r.signif_many(sequence, digits)
+                else:
+                    assert r.signif_many(sequence, digits)[-1] == expected
+
+
+@pytest.mark.parametrize("digits", [-3, 0, 1, 2, 6, 15, 22, 23])
+def test_round_floats_is_round(digits):
+    rng = np.random.default_rng(digits + 10)
+    values = rng.uniform(-1, 1, 3000) * 10.0 ** rng.integers(-30, 30, 3000)
+    values = values.tolist()
+    # halves, which the scaled values are closest to
+    values += [(k + 0.5) / 10**max(digits, 0) for k in range(-500, 500)]
+    values += [0.0, -0.0, math.inf, -math.inf, math.nan, 1e308, 5e-324]
+    values_rounded = r.rounder._round_floats(values, digits)
+    assert len(values_rounded) == len(values)
+    for x, x_rounded in zip(values, values_rounded):
+        assert repr(x_rounded) == repr(round(x, digits))
+
+
+def test_round_records_as_arrays():
+    records = [
+        {"id": i, "x": i / 7, "big": 10**20, "name": "a", "v": [i]}
+        for i in range(2000)
+    ]
+    columns = r.round_records(records, 2, output="arrays")
+    assert columns["x"].dtype == float
+    assert columns["x"].tolist() == [round(i / 7, 2) for i in range(2000)]
+    assert columns["id"].dtype.kind == "i"
+    assert columns["big"].dtype == object
+    assert columns["name"].dtype == object
+    assert columns["v"].shape == (2000,) and columns["v"][1] == [1]
@@ -0,0 +1,70 @@
+import pytest
+import rounder as r
+
+pd = pytest.importorskip("pandas")
+
+
+@pytest.fixture()
+def df():
+    return pd.DataFrame(
+        {
+            "float": [1.2345, 2.3456],
+            "string": ["x", "y"],
+            "int": [1444555, 2],
+            "nullable": pd.array([1.2345, None], dtype="Float64"),
+        },
+        index=["first", "second"],
+    )
+
+
+def test_round_dataframe_copy(df):
+    df_rounded = r.round_object(df, 1, use_copy=True)
+    assert df_rounded is not df
+    assert df_rounded["float"].tolist() == [1.2, 2.3]
+    assert df_rounded["string"].tolist() == ["x", "y"]
+    assert df_rounded["int"].tolist() == [1444555, 2]
+    assert df_rounded["nullable"].iloc[0] == 1.2
+    assert df_rounded["nullable"].isna().iloc[1]
+    assert df_rounded.index.tolist() == ["first", "second"]
+    assert df_rounded.dtypes.tolist() == df.dtypes.tolist()
+    assert df["float"].tolist() == [1.2345, 2.3456]
+
+
+def test_round_dataframe_no_copy(df):
+    df_rounded = r.floor_object(df)
+    assert df_rounded is df
+    assert df["float"].tolist() == [1.0, 2.0]
+    assert df["float"].dtype == float
+
+
+def test_signif_and_map_dataframe(df):
+    df_rounded = r.signif_object(df, 2, use_copy=True)
+    assert df_rounded["float"].tolist() == [1.2, 2.3]
+    assert df_rounded["int"].tolist() == [1400000, 2]
+
+    df_mapped = r.map_object(lambda x: -x, df, use_copy=True)
+    assert df_mapped["float"].tolist() == [-1.2345, -2.3456]
+    assert df_mapped["string"].tolist() == ["x", "y"]
+
+
+def test_round_series():
+    s = pd.Series([1.55, 2.44], name="values")
+    s_rounded = r.ceil_object(s, use_copy=True)
+    assert s_rounded.tolist() == [2.0, 3.0]
+    assert s_rounded.name == "values"
+    assert r.round_object(s, 1) is s
+    assert s.tolist() == [1.6, 2.4]
+
+
+def test_nested_pandas_objects(df):
+    obj = {"frame": df, "other": [1.2345]}
+    obj_rounded = r.round_object(obj, 2, use_copy=True)
+    assert obj_rounded["frame"]["float"].tolist() == [1.23, 2.35]
+    assert obj_rounded["other"] == [1.23]
+
+
+def test_other_pandas_objects_untouched():
+    index = pd.Index([1.2345])
+    assert r.round_object(index, 1) is index
+    timestamp = pd.Timestamp("2020-01-01 12:34:56.789")
+    assert r.round_object(timestamp, 1) is timestamp
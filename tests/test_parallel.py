@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from math import floor
+
+import pytest
+
+import rounder as r
+from rounder.parallel import parallel_round_object
+
+
+def records(n=200):
+    return [
+        {"x": i + 0.555, "y": [i + 1.555, "text"], "z": (i + 2.555,)}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_parallel_round_object_in_processes(use_copy):
+    obj = records()
+    expected = r.round_object(deepcopy(obj), 2)
+    obj_rounded = parallel_round_object(
+        obj, 2, use_copy, workers=2, min_length=10
+    )
+    assert obj_rounded == expected
+    assert (obj_rounded is obj) is not use_copy
+    assert (obj == records()) is use_copy
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_parallel_round_object_in_threads(use_copy):
+    obj = records()
+    first = obj[0]
+    expected = r.signif_object(deepcopy(obj), 3)
+    with ThreadPoolExecutor(3) as executor:
+        obj_rounded = parallel_round_object(
+            obj,
+            3,
+            use_copy,
+            method="signif",
+            executor=executor,
+            min_length=10,
+        )
+    assert obj_rounded == expected
+    # with threads, items are rounded inplace, too
+    assert (obj_rounded[0] is first) is not use_copy
+    assert (first == records(1)[0]) is use_copy
+
+
+def test_parallel_round_object_with_dicts_and_tuples():
+    obj = {str(i): [i + 0.5, i + 1.5] for i in range(100)}
+    with ThreadPoolExecutor(2) as executor:
+        obj_rounded = parallel_round_object(
+            obj, method="floor", executor=executor, min_length=10
+        )
+        assert obj_rounded is obj
+        assert obj == {str(i): [i, i + 1] for i in range(100)}
+
+        obj = tuple(i + 0.25 for i in range(100))
+        obj_rounded = parallel_round_object(
+            obj, None, method=floor, executor=executor, min_length=10
+        )
+        assert obj_rounded == tuple(range(100))
+
+
+def test_parallel_round_object_with_one_argument_function():
+    obj = [i - 0.5 for i in range(100)]
+    with ThreadPoolExecutor(2) as executor:
+        obj_rounded = parallel_round_object(
+            obj, method=abs, executor=executor, min_length=10
+        )
+    assert obj_rounded == [abs(i - 0.5) for i in range(100)]
+    assert parallel_round_object([-1.5], method=abs) == [1.5]
+    assert parallel_round_object([1.5], method=round) == [2]
+    assert parallel_round_object([1.55], 1, method=round) == [1.6]
+    assert parallel_round_object([1.5]) == [2.0]
+
+
+def test_parallel_round_object_default_digits():
+    obj = [[123.4, 567.8, 0.01234]] * 20
+    with ThreadPoolExecutor(2) as executor:
+        for method, rounding in (
+            ("signif", r.signif_object),
+            ("round", r.round_object),
+        ):
+            obj_rounded = parallel_round_object(
+                obj,
+                use_copy=True,
+                method=method,
+                executor=executor,
+                min_length=10,
+            )
+            assert obj_rounded == rounding(obj, use_copy=True)
+    assert obj_rounded[0] == [123.0, 568.0, 0.0]
+    assert parallel_round_object([123.4], method="signif") == [123.0]
+
+
+def test_parallel_round_object_below_threshold():
+    obj = records(5)
+    obj_rounded = parallel_round_object(obj, 1, min_length=10)
+    assert obj_rounded is obj
+    assert obj[0] == {"x": 0.6, "y": [1.6, "text"], "z": (2.6,)}
+    assert parallel_round_object(1.2345, 2) == 1.23
+    assert parallel_round_object({1.55, 2.55}, 1) == {1.6, 2.5}
+
+
+def test_parallel_round_object_with_wrong_method():
+    with pytest.raises(ValueError, match="method"):
+        parallel_round_object([1.5], method="truncate")
@@ -5,6 +5,7 @@ import pytest
 import random
 import rounder as r
 
+from collections import OrderedDict
 from numbers import Number
 from copy import deepcopy
 from math import ceil, floor
@@ -645,6 +646,116 @@ def test_no_copy_for_Decimal():
     assert x_rounded == Decimal("0.1429")
 
 
+@pytest.mark.parametrize("engine", r.rounder.ENGINES)
+def test_round_decimals_with_rounding_modes(engine):
+    D = decimal.Decimal
+    obj = [D("2.665"), D("-2.665"), (D("2.675"),), {"a": D("1.5")}]
+
+    rounder = r.Rounder(round, 2, True, engine)
+    assert rounder(obj) == [
+        D("2.66"),
+        D("-2.66"),
+        (D("2.68"),),
+        {"a": D("1.50")},
+    ]
+    rounder = r.Rounder(round, 2, True, engine, rounding="ROUND_HALF_UP")
+    assert rounder(obj) == [D("2.67"), D("-2.67"), (D("2.68"),), {"a": 1.5}]
+    rounder = r.Rounder(r.signif, 1, True, engine, rounding="ROUND_DOWN")
+    assert rounder(obj) == [D("2"), D("-2"), (D("2"),), {"a": D("1")}]
+
+
+def test_round_decimals_is_exact():
+    D = decimal.Decimal
+    with decimal.localcontext() as context:
+        context.prec = 50
+        x = D("1.0000000000000000000000000000049999")
+        assert r.round_object(x, 30) == D("1.000000000000000000000000000005")
+        assert r.signif_object([x], 31) == [
+            D("1.000000000000000000000000000005")
+        ]
+    # far beyond the range of floats
+    assert r.signif_object(D("1.23456E+500"), 3) == D("1.23E+500")
+    assert r.signif_object(D("-1.23456E-500"), 2) == D("-1.2E-500")
+    assert r.round_object(
+        {"x": D("0.125")}, 2, rounding=decimal.ROUND_HALF_UP
+    ) == {"x": D("0.13")}
+
+
+def test_signif_decimal():
+    D = decimal.Decimal
+    assert r.signif(D("123.456"), 2) == D("1.2E+2")
+    assert r.signif(D("0.000123456"), 3) == D("0.000123")
+    assert r.signif(D("99.96"), 3) == D("100.0")
+    # already short enough, so no trailing zeros are added
+    assert str(r.signif(D("1.2"), 3)) == "1.2"
+    for x in (D(0), D("-0.00"), D("Infinity"), D("NaN")):
+        assert r.signif(x, 3) is x
+    assert r.signif_object([D("1.25"), 1.25], 2) == [D("1.2"), 1.2]
+    assert r.signif_object(
+        [D("1.25")], 2, rounding=decimal.ROUND_HALF_UP
+    ) == [D("1.3")]
+
+
+def test_decimal_rounding_modes_are_cached_separately():
+    D = decimal.Decimal
+    half_up = r.round_object([D("0.5")], rounding=decimal.ROUND_HALF_UP)
+    half_even = r.round_object([D("0.5")])
+    assert half_up == [D("1")]
+    assert half_even == [D("0")]
+
+
+def test_wrong_decimal_rounding():
+    with pytest.raises(ValueError, match="rounding"):
+        r.Rounder(round, 2, rounding="ROUND_NEAREST")
+    with pytest.raises(ValueError, match="round and signif"):
+        r.Rounder(floor, rounding=decimal.ROUND_UP)
+    with pytest.raises(ValueError, match="rounding"):
+        r.round_object([1.5], 1, rounding="up")
+
+
+@pytest.mark.parametrize("digits", [None, -2, 0, 1, 3])
+def test_round_fractions_like_builtin_round(digits):
+    F = fractions.Fraction
+    random.seed(digits)
+    obj = [
+        F(random.randint(-(10**20), 10**20), random.randint(1, 10**12))
+        for _ in range(200)
+    ] + [F(1, 2), F(3, 2), F(-5, 2), F(25, 1000), F(35, 1000), F(0)]
+    obj_rounded = r.Rounder(round, digits)(list(obj))
+    assert obj_rounded == [round(x, digits) for x in obj]
+    assert [type(x) for x in obj_rounded] == [
+        type(round(x, digits)) for x in obj
+    ]
+
+
+def test_floor_and_ceil_fractions():
+    F = fractions.Fraction
+    obj = [F(7, 2), F(-7, 2), F(4), F(-1, 10**30)]
+    assert r.floor_object(obj, use_copy=True) == [3, -4, 4, -1]
+    assert r.ceil_object(obj, use_copy=True) == [4, -3, 4, 0]
+    assert all(type(x) is int for x in r.floor_object(obj))
+
+
+def test_signif_fractions_is_exact():
+    F = fractions.Fraction
+    assert r.signif(F(1, 3), 2) == F(33, 100)
+    assert r.signif(F(-2, 3), 1) == F(-7, 10)
+    assert r.signif(F(12345), 3) == F(12300)
+    assert r.signif(F(999, 1000), 2) == F(1)
+    assert r.signif(F(0), 3) == 0
+    # far beyond the range of floats
+    huge = F(10**400, 3)
+    assert r.signif(huge, 3) == F(333 * 10**397)
+    assert r.signif(1 / huge, 2) == F(3, 10**400)
+    assert r.signif_object([huge, F(1, 7)], 2) == [
+        F(33 * 10**398),
+        F(14, 100),
+    ]
+    assert all(
+        type(x) is F for x in r.signif_object([F(1, 3), F(5, 1)], 1)
+    )
+
+
 def test_copy_for_Fraction():
     from fractions import Fraction
 
@@ -907,3 +1018,1164 @@ def test_int_return():
     assert isinstance(r.round_object(10), int)
     assert isinstance(r.ceil_object(10.234234), int)
     assert isinstance(r.floor_object(10.234234), int)
+
+
+def test_Rounder_reuse():
+    round_2 = r.Rounder(round, 2)
+    assert round_2(1.2345) == 1.23
+    assert round_2([1.2345, {"a": 2.3456}]) == [1.23, {"a": 2.35}]
+    assert round_2((1.2345, "x")) == (1.23, "x")
+
+    floor_rounder = r.Rounder(floor)
+    assert floor_rounder({1.9, 2.1}) == {1, 2}
+    assert floor_rounder.func is floor
+
+
+def test_Rounder_use_copy():
+    x = [1.2345, [2.3456]]
+    x_rounded = r.Rounder(round, 1, use_copy=True)(x)
+    assert x_rounded == [1.2, [2.3]]
+    assert x == [1.2345, [2.3456]]
+
+    x_rounded = r.Rounder(round, 1)(x)
+    assert x_rounded is x
+    assert x == [1.2, [2.3]]
+
+
+def test_round_object_reuses_Rounder():
+    r.cache_clear()
+    r.round_object([1.23], 1)
+    r.round_object({"a": 1.23}, 1)
+    r.floor_object([1.23])
+    assert r.cache_info() == (1, 2, 128, 2)
+
+
+def test_cache_is_bounded():
+    r.cache_clear()
+    try:
+        r.set_cache_maxsize(2)
+        for digits in range(5):
+            r.round_object([1.23], digits)
+        info = r.cache_info()
+        assert info.misses == 5
+        assert info.currsize == 2
+
+        r.round_object([1.23], 4)
+        assert r.cache_info().hits == 1
+        r.round_object([1.23], 0)
+        assert r.cache_info().misses == 6
+    finally:
+        r.set_cache_maxsize(128)
+        r.cache_clear()
+
+    with pytest.raises(ValueError, match="maxsize"):
+        r.set_cache_maxsize(-1)
+
+
+def test_cache_does_not_keep_lambdas_alive():
+    import gc
+
+    r.cache_clear()
+    for _ in range(10):
+        assert r.map_object(lambda x: 2 * x, [1, 2]) == [2, 4]
+    gc.collect()
+    assert r.cache_info().currsize == 0
+    assert r.cache_info().misses == 10
+
+
+def test_cache_with_unhashable_callable():
+    class Doubler:
+        __hash__ = None
+
+        def __call__(self, x):
+            return 2 * x
+
+    assert r.map_object(Doubler(), [1, 2]) == [2, 4]
+
+
+def test_signif_many():
+    values = [1.444555, 0.00012345, -98765.4321, 0.0, 7, 1444555]
+    for digits in range(1, 8):
+        expected = [r.signif(x, digits) for x in values]
+        assert r.signif_many(values, digits) == expected
+        assert r.signif_many(tuple(values), digits) == expected
+
+    import array
+
+    x = array.array("d", values)
+    x_rounded = r.signif_many(x, 3)
+    assert x_rounded == array.array(
+        "d", [1.44, 0.000123, -98800, 0, 7, 1440000]
+    )
+    assert x == array.array("d", values)
+
+
+def test_signif_many_without_numpy(monkeypatch, length):
+    import array
+
+    monkeypatch.setattr(r.rounder, "_import_numpy", lambda: None)
+    x = [random.uniform(-1000, 1000) for _ in range(length)]
+    expected = [r.signif(v, 3) for v in x]
+    assert r.signif_many(x, 3) == expected
+    assert r.signif_many(array.array("d", x), 3).tolist() == expected
+
+
+def test_signif_object_bulk(length):
+    import array
+
+    x = [random.uniform(-1000, 1000) for _ in range(length)] + [0.0]
+    expected = [r.signif(v, 4) for v in x]
+    assert r.signif_object(x, 4, use_copy=True) == expected
+    assert r.signif_object(array.array("d", x), 4).tolist() == expected
+    assert r.signif_object(x, 4) is x
+    assert x == expected
+    assert type(x[-1]) is int
+
+
+def test_array_in_place_and_copy():
+    import array
+
+    x = array.array("d", [1.234, 5.678])
+    x_rounded_copy = r.round_object(x, 1, use_copy=True)
+    assert x_rounded_copy == array.array("d", [1.2, 5.7])
+    assert x == array.array("d", [1.234, 5.678])
+
+    x_rounded = r.round_object(x, 1)
+    assert x_rounded is x
+    assert x == array.array("d", [1.2, 5.7])
+
+    x = array.array("f", [1.5, -1.5])
+    assert r.floor_object(x, True) == array.array("f", [1, -2])
+    assert r.ceil_object(x, True) == array.array("f", [2, -1])
+
+
+def test_integer_array():
+    import array
+
+    x = array.array("l", [1234, 5678])
+    assert r.round_object(x, 2) is x
+    assert r.floor_object(x) is x
+    x_copy = r.ceil_object(x, True)
+    assert x_copy is not x
+    assert x_copy == x
+    assert r.round_object(x, -2, True) == array.array("l", [1200, 5700])
+    assert r.signif_object(x, 1, True) == array.array("l", [1000, 6000])
+    assert r.map_object(lambda v: -v, x, True) == array.array(
+        "l", [-1234, -5678]
+    )
+
+
+def test_non_number_array():
+    import array
+
+    x = array.array("u", "abc")
+    assert r.round_object(x, 1) is x
+    assert r.round_object(x, 1, True) == x
+
+
+def test_memoryview():
+    import array
+    import ctypes
+
+    x = array.array("d", [1.234, 5.678, 9.999])
+    view = memoryview(x)
+    assert r.round_object(view, 1) is view
+    assert x == array.array("d", [1.2, 5.7, 10.0])
+
+    x = array.array("d", [1.234, 5.678, 9.999])
+    view = r.round_object(memoryview(x), 1, use_copy=True)
+    assert view.tolist() == [1.2, 5.7, 10.0]
+    assert x == array.array("d", [1.234, 5.678, 9.999])
+
+    x = array.array("d", [1.234, 5.678, 9.999])
+    r.round_object(memoryview(x)[::2], 1)
+    assert x == array.array("d", [1.2, 5.678, 10.0])
+
+    x = (ctypes.c_double * 2)(1.234, 5.678)
+    r.round_object(memoryview(x), 1)
+    assert list(x) == [1.2, 5.7]
+
+    view = memoryview(bytes(array.array("d", [1.234])))
+    assert r.round_object(view.cast("d"), 1).tolist() == [1.2]
+    assert r.round_object(memoryview(b"text"), 1).tobytes() == b"text"
+
+
+def test_filter_keeps_zeros():
+    flt = filter(lambda x: x < 1, [0.2, 0.7, 1.5, -0.3])
+    assert list(r.round_object(flt)) == [0, 1, 0]
+
+    flt = filter(lambda x: x < 1, [0.2, 0.7, 1.5, -0.3])
+    assert list(r.round_object(flt, use_copy=True)) == [0, 1, 0]
+    assert list(flt) == [0.2, 0.7, -0.3]
+
+
+def test_copy_for_map_of_generator():
+    m = map(lambda x: x / 3, (i for i in range(4)))
+    # the generator cannot be copied, so neither can the map
+    assert r.round_object(m, 1, use_copy=True) is m
+    assert list(r.round_object(m, 1)) == [0.0, 0.3, 0.7, 1.0]
+
+
+def test_use_copy_does_not_copy_iterators():
+    rows = [[1.55], [2.55]]
+    zipped = zip(rows, ["a", "b"])
+    rounded = r.round_object(zipped, 1, use_copy=True)
+    assert next(rounded) == ([1.6], "a")
+    # the iterator is consumed, but the items are copies
+    assert list(zipped) == [([2.55], "b")]
+    assert rows == [[1.55], [2.55]]
+
+    gen = (x for x in [[1.55], [2.55]])
+    assert list(r.round_object(gen, 1, use_copy=True)) == [[1.6], [2.5]]
+    assert list(gen) == []
+
+
+def test_iterators_are_rounded_lazily():
+    import itertools
+
+    pulled = []
+
+    def numbers():
+        for x in itertools.count(0.25, 0.5):
+            pulled.append(x)
+            yield x
+
+    rounded = r.round_object({"stream": numbers()}, 1)["stream"]
+    assert pulled == []
+    assert list(itertools.islice(rounded, 3)) == [0.2, 0.8, 1.2]
+    assert pulled == [0.25, 0.75, 1.25]
+
+    counter = r.round_object(itertools.count(0.55), 1)
+    assert list(itertools.islice(counter, 2)) == [0.6, 1.6]
+
+    zipped = r.round_object(zip([1.11, 2.22], [3.33, 4.44]), 1)
+    assert list(zipped) == [(1.1, 3.3), (2.2, 4.4)]
+
+
+def test_files_are_not_iterated(tmp_path):
+    path = tmp_path / "numbers.txt"
+    path.write_text("1.2345\n")
+    with open(path) as f:
+        assert r.round_object({"file": f}, 1)["file"] is f
+        assert f.read() == "1.2345\n"
+
+
+def test_Rounder_iterate():
+    import itertools
+
+    round_1 = r.Rounder(round, 1)
+    rounded = round_1.iterate([1.23, [2.34], "text", 3.45])
+    assert list(rounded) == [1.2, [2.3], "text", 3.5]
+
+    rounded, original = round_1.iterate(itertools.count(0.125, 0.25), True)
+    assert list(itertools.islice(rounded, 3)) == [0.1, 0.4, 0.6]
+    assert list(itertools.islice(original, 3)) == [0.125, 0.375, 0.625]
+
+
+def nested_list(depth, value=1.55):
+    obj = node = []
+    for _ in range(depth):
+        node.append(value)
+        node.append([])
+        node = node[-1]
+    return obj
+
+
+def innermost(obj):
+    while obj[1]:
+        obj = obj[1]
+    return obj[0]
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_iterative_engine_same_as_recursive(complex_object, use_copy):
+    from collections import OrderedDict, UserDict, UserList, deque, namedtuple
+
+    X = namedtuple("X", "a b")
+
+    class A:
+        def __init__(self):
+            self.x = 1.234
+            self.y = [2.345, {"z": 3.456}]
+
+        def __eq__(self, other):
+            return vars(self) == vars(other)
+
+    def make_obj():
+        obj = deepcopy(complex_object)
+        obj.update(
+            namedtuple=X(1.11, [2.22, (3.33,)]),
+            ordered=OrderedDict(c=deque([1.5, 2.5])),
+            instance=A(),
+            user=[UserList([1.77]), UserDict(h=2.22), frozenset([1.1])],
+            complex=1.5 - 2.5j,
+        )
+        return obj
+
+    for func, digits in ((round, 2), (floor, None), (r.signif, 3)):
+        recursive = r.Rounder(func, digits, use_copy)
+        iterative = r.Rounder(func, digits, use_copy, engine="iterative")
+        rounded = recursive(make_obj())
+        rounded_iteratively = iterative(make_obj())
+        rounded.pop("callable")
+        rounded_iteratively.pop("callable")
+        assert rounded == rounded_iteratively
+
+
+def test_deeply_nested_objects():
+    obj = nested_list(10_000)
+    obj_rounded = r.round_object(obj, 1, use_copy=True)
+    assert innermost(obj_rounded) == 1.6
+    assert innermost(obj) == 1.55
+
+    r.signif_object(obj, 2)
+    assert innermost(obj) == 1.6
+
+    rounded = r.Rounder(round, 1, engine="iterative")(nested_list(10_000))
+    assert innermost(rounded) == 1.6
+
+    # map_object cannot repeat the work it started inplace, so it goes on
+    # iteratively below RECURSIVE_MAX_DEPTH
+    obj = nested_list(10_000)
+    assert r.map_object(lambda x: 2 * x, obj) is obj
+    assert obj[0] == innermost(obj) == 3.1
+    obj_mapped = r.map_object(lambda x: 2 * x, nested_list(10_000), True)
+    assert innermost(obj_mapped) == 3.1
+
+    calls = []
+    obj = [nested_list(3_000), {"x": nested_list(500)}]
+    r.map_object(lambda x: calls.append(x) or x + 1, obj)
+    assert len(calls) == 3_500
+    assert innermost(obj[0]) == innermost(obj[1]["x"]) == 2.55
+
+
+def test_max_depth():
+    obj = [1.55, [2.55, [3.55, (4.55,)]]]
+    assert r.Rounder(round, 1, max_depth=0)(1.55) == 1.6
+    assert r.Rounder(round, 1, max_depth=0)(deepcopy(obj)) == obj
+    assert r.Rounder(round, 1, max_depth=2)(deepcopy(obj)) == [
+        1.6,
+        [2.5, [3.55, (4.55,)]],
+    ]
+    assert r.Rounder(round, 1, max_depth=3)(deepcopy(obj)) == [
+        1.6,
+        [2.5, [3.5, (4.55,)]],
+    ]
+
+
+@pytest.mark.parametrize("engine", ["recursive", "iterative"])
+def test_reference_cycles(engine):
+    x = [1.55]
+    x.append(x)
+    x_rounded = r.Rounder(round, 1, engine=engine)(x)
+    assert x_rounded is x
+    assert x[0] == 1.6
+    assert x[1] is x
+
+    d = {"a": 1.55}
+    d["self"] = d
+    d_rounded = r.Rounder(round, 1, use_copy=True, engine=engine)(d)
+    assert d_rounded is not d
+    assert d_rounded["self"] is d_rounded
+    assert d_rounded["a"] == 1.6
+    assert d["a"] == 1.55
+
+    # a cycle through an immutable container
+    y = [2.25]
+    t = (y,)
+    y.append(t)
+    t_rounded = r.Rounder(round, 1, use_copy=True, engine=engine)(t)
+    assert t_rounded[0] == [2.2, t_rounded]
+    assert t_rounded[0][1] is t_rounded
+    assert y[0] == 2.25
+
+
+@pytest.mark.parametrize("engine", ["recursive", "iterative"])
+def test_shared_references(engine):
+    shared = [1.55]
+    obj = [shared, shared, (shared,), {"a": shared}]
+    double = r.Rounder(lambda x: 2 * x, use_copy=True, engine=engine)
+    obj_doubled = double(obj)
+    assert obj_doubled[0] == [3.1]
+    assert obj_doubled[0] is not shared
+    assert obj_doubled[1] is obj_doubled[0]
+    assert obj_doubled[2][0] is obj_doubled[0]
+    assert obj_doubled[3]["a"] is obj_doubled[0]
+
+    # each container is converted once, also inplace
+    assert r.map_object(lambda x: 2 * x, obj) is obj
+    assert shared == [3.1]
+
+
+@pytest.mark.parametrize("engine", ["recursive", "iterative"])
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_slots(engine, use_copy):
+    class WithSlots:
+        __slots__ = ("x", "__y", "unset")
+
+        def __init__(self):
+            self.x = 1.55
+            self.__y = [2.55]
+
+    class WithSlotsAndDict(WithSlots):
+        def __init__(self):
+            super().__init__()
+            self.z = 3.55
+
+    rounder = r.Rounder(round, 1, use_copy, engine=engine)
+    obj = WithSlotsAndDict()
+    obj_rounded = rounder(obj)
+    assert obj_rounded.x == 1.6
+    assert obj_rounded._WithSlots__y == [2.5]
+    assert obj_rounded.z == 3.5
+    assert not hasattr(obj_rounded, "unset")
+    assert (obj_rounded is obj) is not use_copy
+    assert obj.x == (1.55 if use_copy else 1.6)
+    assert type(obj_rounded) in rounder.dispatch_table
+
+
+@pytest.mark.parametrize("engine", ["recursive", "iterative"])
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_dataclasses(engine, use_copy):
+    import dataclasses
+
+    @dataclasses.dataclass
+    class Point:
+        x: float
+        y: float
+
+    @dataclasses.dataclass(frozen=True)
+    class Frozen:
+        x: float
+        points: list
+        total: float = dataclasses.field(init=False, default=0.0)
+
+        def __post_init__(self):
+            object.__setattr__(self, "total", sum(p.x for p in self.points))
+
+    rounder = r.Rounder(round, 1, use_copy, engine=engine)
+    obj = Frozen(1.55, [Point(2.55, 3.55), Point(4.55, 5.55)])
+    obj_rounded = rounder(obj)
+    assert obj_rounded is not obj
+    assert obj_rounded == Frozen(1.6, [Point(2.5, 3.5), Point(4.5, 5.5)])
+    assert obj_rounded.total == 7.0  # computed by __init__ again
+    assert obj.x == 1.55
+    assert (obj.points[0].x == 2.55) is use_copy
+
+
+@pytest.mark.parametrize("engine", ["recursive", "iterative"])
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_frozen_dataclass_with_init_var(engine, use_copy):
+    import dataclasses
+
+    @dataclasses.dataclass(frozen=True)
+    class Price:
+        net: float
+        tax_rate: dataclasses.InitVar[float]
+        gross: float = dataclasses.field(init=False)
+
+        def __post_init__(self, tax_rate):
+            object.__setattr__(self, "gross", self.net * (1 + tax_rate))
+
+    obj = Price(10.555, 0.5)
+    obj_rounded = r.Rounder(round, 2, use_copy, engine=engine)(obj)
+    assert obj_rounded is not obj
+    # InitVars are not kept, so __init__ cannot be called again
+    assert (obj_rounded.net, obj_rounded.gross) == (10.55, 15.83)
+    assert (obj.net, obj.gross) == (10.555, 15.8325)
+    assert r.compile(obj, 2)(obj) == obj_rounded
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_attrs_classes(use_copy):
+    attr = pytest.importorskip("attr")
+
+    @attr.s(frozen=True)
+    class Frozen:
+        x = attr.ib()
+        _y = attr.ib()
+
+    @attr.s(slots=True)
+    class WithSlots:
+        x = attr.ib()
+
+    frozen = Frozen(1.55, 2.55)
+    obj_rounded = r.round_object([frozen, WithSlots(3.55)], 1, use_copy)
+    assert obj_rounded == [Frozen(1.6, 2.5), WithSlots(3.5)]
+    assert frozen == Frozen(1.55, 2.55)
+
+
+def test_immutable_instances_with_slots():
+    import uuid
+
+    x = uuid.UUID(int=123456789)
+    assert r.signif_object(x, 2) is x
+    assert x.int == 123456789
+
+
+def test_round_object_async(complex_object):
+    import asyncio
+
+    async def count_switches(switches):
+        while True:
+            switches.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        switches = []
+        task = asyncio.create_task(count_switches(switches))
+        await asyncio.sleep(0)
+        obj = [{"a": i + 0.555, "b": [1.5, 2.5]} for i in range(1000)]
+        obj_rounded = await r.round_object_async(obj, 2, True, chunk_size=100)
+        task.cancel()
+        assert obj_rounded == r.round_object(obj, 2, use_copy=True)
+        # 6000 objects were rounded, in chunks of 100
+        assert len(switches) > 50
+
+        x = deepcopy(complex_object)
+        x_rounded = await r.round_object_async(x, 1, use_copy=True)
+        expected = r.round_object(x, 1, use_copy=True)
+        x_rounded.pop("callable")
+        expected.pop("callable")
+        assert x_rounded == expected
+        assert await r.round_object_async(1.55, 1) == 1.6
+
+    asyncio.run(main())
+
+
+def test_round_object_async_in_executor():
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            x = await r.round_object_async([1.55], 1, executor=executor)
+            assert x == [1.6]
+        assert await r.round_object_async([1.55], 1, executor=True) == [1.6]
+
+    asyncio.run(main())
+
+
+def test_round_object_async_rounding_and_stats():
+    import asyncio
+
+    async def main():
+        obj = [decimal.Decimal("2.665"), [1.55]]
+        with r.collect_stats() as stats:
+            x = await r.round_object_async(
+                obj, 2, True, rounding=decimal.ROUND_HALF_UP
+            )
+            assert x == [decimal.Decimal("2.67"), [1.55]]
+            await r.round_object_async(obj, 1, True, executor=True)
+        assert stats.calls == 2
+        assert stats.numbers == 4
+
+    asyncio.run(main())
+
+
+def test_round_object_async_wrong_chunk_size():
+    import asyncio
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        asyncio.run(r.round_object_async([1.55], 1, chunk_size=0))
+
+
+def test_async_generators():
+    import asyncio
+
+    async def numbers():
+        for x in (1.55, [2.55], "text"):
+            yield x
+            await asyncio.sleep(0)
+
+    async def main():
+        gen = numbers()
+        rounded = r.round_object({"numbers": gen}, 1)["numbers"]
+        assert rounded is not gen
+        assert [x async for x in rounded] == [1.6, [2.5], "text"]
+
+    asyncio.run(main())
+
+
+def test_register_type(registry):
+    class Money:
+        def __init__(self, amount, currency):
+            self.amount = amount
+            self.currency = currency
+
+    class Euro(Money):
+        pass
+
+    rounder = r.Rounder(round, 2, use_copy=True)
+    assert rounder(Money(1.2345, "EUR")).amount == 1.23
+
+    calls = []
+
+    def round_money(obj, convert, use_copy):
+        calls.append(use_copy)
+        return type(obj)(convert(obj.amount), "rounded")
+
+    assert r.register_type(Money, round_money) is round_money
+    # the existing Rounder sees the new handler, also for subclasses
+    obj = [Euro(1.2345, "EUR"), Euro(2.3456, "EUR")]
+    obj_rounded = rounder(obj)
+    assert [(x.amount, x.currency) for x in obj_rounded] == [
+        (1.23, "rounded"),
+        (2.35, "rounded"),
+    ]
+    assert calls == [True, True]
+    assert Euro in rounder.dispatch_table
+
+    x = r.floor_object({"price": Money(1.9, "PLN")})
+    assert (x["price"].amount, x["price"].currency) == (1, "rounded")
+    assert calls == [True, True, False]
+
+
+def test_register_type_for_builtin_subclass(registry):
+    class Scores(dict):
+        pass
+
+    @r.register_type(Scores)
+    def round_scores(obj, convert, use_copy):
+        return {k: convert(v) for k, v in obj.items() if k != "skip"}
+
+    obj = [{"a": 1.55}, Scores(a=1.55, skip=2.55)]
+    assert r.round_object(obj, 1, use_copy=True) == [{"a": 1.6}, {"a": 1.6}]
+
+
+def test_register_type_with_wrong_class():
+    with pytest.raises(TypeError):
+        r.register_type("Money", lambda obj, convert, use_copy: obj)
+    with pytest.raises(TypeError):
+        r.register_type(float, lambda obj, convert, use_copy: obj)
+
+
+def test_subclasses_are_dispatched_once():
+    from collections import UserDict
+
+    class Record(UserDict):
+        pass
+
+    rounder = r.Rounder(round, 1)
+    obj = [Record(a=1.55), Record(b=2.55)]
+    assert rounder(obj) == [{"a": 1.6}, {"b": 2.5}]
+    assert Record in rounder.dispatch_table
+
+
+def test_copy_on_write_engine(complex_object):
+    for func, digits in ((round, 2), (floor, None), (r.signif, 3)):
+        obj = deepcopy(complex_object)
+        cow = r.Rounder(func, digits, engine="copy_on_write")
+        obj_rounded = cow(obj)
+        assert obj == complex_object
+        expected = r.Rounder(func, digits, use_copy=True)(obj)
+        obj_rounded.pop("callable")
+        expected.pop("callable")
+        assert obj_rounded == expected
+
+
+def test_copy_on_write_engine_shares_unchanged_objects():
+    cow = r.Rounder(round, 1, engine="copy_on_write")
+    obj = {
+        "names": ["a", "b", {"c": "d"}],
+        "values": [1.55, 2.0],
+        "items": [{"x": 1.0, "y": 2}, {"x": 2.25}],
+        "pair": ("x", 1.0),
+    }
+    obj_rounded = cow(obj)
+    assert obj_rounded == {
+        "names": ["a", "b", {"c": "d"}],
+        "values": [1.6, 2.0],
+        "items": [{"x": 1.0, "y": 2}, {"x": 2.2}],
+        "pair": ("x", 1.0),
+    }
+    assert obj_rounded is not obj
+    assert obj_rounded["names"] is obj["names"]
+    assert obj_rounded["pair"] is obj["pair"]
+    assert obj_rounded["items"] is not obj["items"]
+    assert obj_rounded["items"][0] is obj["items"][0]
+    assert obj["values"] == [1.55, 2.0]
+    assert obj["items"][1] == {"x": 2.25}
+    assert cow(obj["names"]) is obj["names"]
+
+    # containers in a cycle are copied
+    d = {"a": 1.55}
+    d["self"] = d
+    d_rounded = cow(d)
+    assert d_rounded["self"] is d_rounded
+    assert d_rounded["a"] == 1.6
+    assert d["a"] == 1.55
+
+
+def test_copy_on_write_engine_with_max_depth():
+    with pytest.raises(ValueError, match="max_depth"):
+        r.Rounder(round, 1, engine="copy_on_write", max_depth=2)
+
+
+def test_wrong_engine():
+    with pytest.raises(ValueError, match="engine"):
+        r.Rounder(round, 1, engine="magic")
+
+
+def test_collect_stats():
+    obj = {"a": [1.234, 5.678], "b": ("x", [2.5]), "c": 7}
+    with r.collect_stats() as stats:
+        obj_rounded = r.round_object(obj, 1, use_copy=True)
+        r.signif_object([1.2345, 2.3456, 3.4567], 2)
+        r.floor_object(1.5)
+    assert obj_rounded == {"a": [1.2, 5.7], "b": ("x", [2.5]), "c": 7}
+    assert stats.calls == 3
+    assert stats.numbers == 4 + 3 + 1
+    assert stats.max_depth == 3
+    assert stats.types[dict] == 1
+    assert stats.types[list] == 3
+    assert stats.types[int] == 1
+    assert stats.types[str] == 1
+    assert stats.seconds["convert_list"] > 0
+    assert stats.errors == [] and stats.retries == 0
+
+    # outside the block, nothing is collected
+    r.round_object([1.5], 0)
+    assert stats.calls == 3
+
+
+def test_collect_stats_records_errors():
+    class Broken:
+        @property
+        def __dict__(self):
+            raise RuntimeError("no attributes")
+
+    obj = [1.55, Broken()]
+    with r.collect_stats() as stats:
+        assert r.round_object(obj, 1) is obj
+    assert len(stats.errors) == 1
+    assert isinstance(stats.errors[0], RuntimeError)
+
+
+def test_collect_stats_with_deep_nesting():
+    obj = []
+    for _ in range(5000):
+        obj = [obj, 1.5]
+    with r.collect_stats() as stats:
+        r.round_object(obj, use_copy=True)
+    assert stats.retries == 1
+    assert stats.numbers == 5000
+    assert stats.errors == []
+
+
+def test_rounder_with_stats():
+    stats = r.RoundingStats()
+    round_1 = r.Rounder(round, 1, stats=stats)
+    assert round_1([1.25, (2.25, 3)]) == [1.2, (2.2, 3)]
+    assert round_1(range(3)) is not None
+    assert stats.calls == 2
+    assert stats.numbers == 3
+    assert stats.types[range] == 1
+    # a Rounder without stats is not instrumented
+    assert r.Rounder(round, 1).stats is None
+
+
+@pytest.mark.parametrize("engine", r.rounder.ENGINES)
+@pytest.mark.parametrize(
+    "func, digits",
+    [(round, 1), (round, None), (floor, None), (r.signif, 2), (abs, None)],
+)
+def test_flat_lists_of_numbers(engine, func, digits):
+    obj = [1.55, -2, 3.25, 10**20, -0.0, 7]
+    args = () if digits is None else (digits,)
+    expected = [func(x, *args) for x in obj]
+    obj_rounded = r.Rounder(func, digits, True, engine)(obj)
+    assert obj_rounded == expected
+    assert [type(x) for x in obj_rounded] == [type(x) for x in expected]
+
+    # not only numbers, or not only floats and ints
+    for other in (True, None, decimal.Decimal("1.25")):
+        obj_rounded = r.Rounder(func, digits, True, engine)(obj + [other])
+        assert obj_rounded[:-1] == expected
+
+
+def test_flat_lists_of_numbers_inplace_and_shared():
+    class Values(list):
+        pass
+
+    obj = [1.25, 2, 3.75]
+    assert r.round_object(obj) is obj
+    assert obj == [1, 2, 4]
+    obj = Values([1.25, 2.5])
+    obj_rounded = r.round_object(obj, use_copy=True)
+    assert type(obj_rounded) is Values and obj_rounded == [1, 2]
+    cow = r.Rounder(floor, engine="copy_on_write")
+    ints = [1, 2, 3]
+    assert cow([ints, [1.5]])[0] is ints
+
+
+@pytest.mark.parametrize("func", [round, r.signif])
+def test_flat_lists_of_numbers_beyond_max_depth(func):
+    obj = [1.55, [2.55, [3.55]]]
+    obj_rounded = r.Rounder(func, 1, max_depth=1)(obj)
+    assert obj_rounded == [func(1.55, 1), [2.55, [3.55]]]
+
+
+def policy_payload():
+    return {
+        "orders": [
+            {"price": 9.87654, "geo": {"lat": 52.2296756, "lon": 21.0122287}},
+            {"price": 1.005, "latency_ms": 123.456, "latency_p99": [0.123456]},
+        ],
+        "price": (4.5678, 1.2345),
+        "count": 2.5,
+        "tags": {"x", "y"},
+    }
+
+
+def test_round_by_policy():
+    obj = policy_payload()
+    policy = {"price": 2, "geo.*": 6, "latency_*": r.Signif(3)}
+    obj_rounded = r.round_by_policy(obj, policy, use_copy=True)
+    assert obj_rounded == {
+        "orders": [
+            {"price": 9.88, "geo": {"lat": 52.229676, "lon": 21.012229}},
+            {"price": 1.0, "latency_ms": 123.0, "latency_p99": [0.123]},
+        ],
+        "price": (4.57, 1.23),
+        "count": 2.5,
+        "tags": {"x", "y"},
+    }
+    assert obj == policy_payload()
+    obj_rounded = r.round_by_policy(obj, policy, default=0)
+    assert obj_rounded is obj
+    assert obj["count"] == 2 and obj["orders"][0]["price"] == 9.88
+
+
+def test_round_by_policy_with_default_is_round_object(obj_dict):
+    expected = r.round_object(deepcopy(obj_dict), 2)
+    assert r.round_by_policy(obj_dict, {}, 2, use_copy=True) == expected
+    expected = r.signif_object(deepcopy(obj_dict), 2)
+    assert r.round_by_policy(obj_dict, {}, r.Signif(2)) == expected
+
+
+def test_round_by_policy_precedence():
+    obj = {"a": {"b": {"c": 1.23456}}, "ab": 1.23456, "b": [1.23456]}
+    # a rule with more parts wins, then a rule without wildcards, then
+    # the first rule
+    policy = {"c": 1, "b.c": 2, "a*": 3, "ab": 4, "a?": 5}
+    assert r.round_by_policy(obj, policy, use_copy=True) == {
+        "a": {"b": {"c": 1.23}},
+        "ab": 1.2346,
+        "b": [1.23456],
+    }
+    # a deeper rule overrides the rule in effect, and None keeps numbers
+    policy = {"a": 1, "c": None}
+    assert r.round_by_policy(obj, policy, 0, use_copy=True) == {
+        "a": {"b": {"c": 1.23456}},
+        "ab": 1,
+        "b": [1],
+    }
+
+
+def test_round_by_policy_types():
+    import dataclasses
+    from collections import deque, namedtuple
+
+    Point = namedtuple("Point", "lat lon")
+
+    @dataclasses.dataclass(frozen=True)
+    class Reading:
+        value: float
+        error: float
+
+    class Sensor:
+        def __init__(self):
+            self.location = Point(52.2296756, 21.0122287)
+            self.readings = deque([Reading(1.23456, 0.0123456)])
+            self.last = Reading(2.34567, 0.0234567)
+
+    policy = {"lat": 1, "Sensor.*": 0, "error": r.Signif(2), "value": 3}
+    sensor = r.round_by_policy(
+        {"Sensor": Sensor(), 1.5: 2.5, "d": decimal.Decimal("1.2345")},
+        policy,
+        r.Signif(2),
+    )
+    assert sensor[1.5] == 2.5
+    assert sensor["d"] == decimal.Decimal("1.2")
+    sensor = sensor["Sensor"]
+    assert sensor.location == Point(52.2, 21)
+    # deques have no keys, so the rule in effect applies to all of them
+    assert sensor.readings == deque([Reading(1, 0)])
+    assert sensor.last == Reading(2.346, 0.023)
+
+
+def test_round_by_policy_cycles_and_shared_objects():
+    shared = {"x": 1.23456}
+    obj = {"a": shared, "b": shared, "c": [1.23456]}
+    obj["c"].append(obj)
+    obj_rounded = r.round_by_policy(obj, {"a": 1, "b": 2}, 3, use_copy=True)
+    assert obj_rounded["a"] == {"x": 1.2}
+    assert obj_rounded["b"] == {"x": 1.23}
+    assert obj_rounded["c"][0] == 1.235
+    assert obj_rounded["c"][1] is obj_rounded
+
+
+def test_rounding_policy_object():
+    policy = r.RoundingPolicy({"x": 1}, use_copy=True)
+    assert repr(policy) == "RoundingPolicy({'x': 1}, None, use_copy=True)"
+    obj = [{"x": 1.25, "y": 1.25}]
+    assert r.round_by_policy(obj, policy) == [{"x": 1.2, "y": 1.25}]
+    assert obj == [{"x": 1.25, "y": 1.25}]
+    r.round_by_policy(obj, {"x": 1})
+    info = r.rounder._get_policy.cache_info()
+    r.round_by_policy(obj, {"x": 1})
+    assert r.rounder._get_policy.cache_info().hits == info.hits + 1
+
+
+def test_round_by_policy_after_register_type(registry):
+    class Money:
+        def __init__(self, amount, currency):
+            self.amount = amount
+            self.currency = currency
+
+    policy = r.RoundingPolicy({"amount": 1}, use_copy=True)
+    x = r.round_by_policy(Money(1.2345, "EUR"), policy)
+    assert (x.amount, x.currency) == (1.2, "EUR")
+    x = r.round_by_policy(Money(1.2345, "EUR"), {"amount": 1}, 2)
+    assert (x.amount, x.currency) == (1.2, "EUR")
+
+    def round_money(obj, convert, use_copy):
+        return type(obj)(convert(obj.amount), "rounded")
+
+    r.register_type(Money, round_money)
+    # both the policy object and the cached one use the new handler, which
+    # rounds the whole object with the rule in effect
+    x = r.round_by_policy(Money(1.2345, "EUR"), policy)
+    assert (x.amount, x.currency) == (1.2345, "rounded")
+    x = r.round_by_policy(Money(1.2345, "EUR"), {"amount": 1}, 2)
+    assert (x.amount, x.currency) == (1.23, "rounded")
+
+
+def test_rounding_policy_errors():
+    with pytest.raises(TypeError, match="'x'"):
+        r.RoundingPolicy({"x": 1.5})
+    with pytest.raises(TypeError, match="'x'"):
+        r.round_by_policy({}, {"x": [1]})
+    with pytest.raises(TypeError, match="'x'"):
+        r.RoundingPolicy({"x": r.Signif(True)})
+    with pytest.raises(TypeError, match="default"):
+        r.RoundingPolicy({}, default="2")
+    with pytest.raises(TypeError, match="str"):
+        r.RoundingPolicy({1: 2})
+    with pytest.raises(ValueError, match="empty"):
+        r.RoundingPolicy({"a..b": 2})
+
+
+def make_record(i=0):
+    import dataclasses
+    from collections import namedtuple
+
+    Point = namedtuple("Point", "lat lon")
+
+    @dataclasses.dataclass
+    class Item:
+        name: str
+        price: float
+        tags: list
+
+    @dataclasses.dataclass(frozen=True)
+    class Stamp:
+        time: float
+        zone: str
+
+    return {
+        "id": i,
+        "name": "record",
+        "price": 9.87654 + i,
+        "geo": Point(52.2296756, 21.0122287),
+        "items": [Item("a", 1.2345, [1.555, 2.555]), Item("b", 2.345, [])],
+        "stamp": Stamp(1.23456, "UTC"),
+        "decimal": decimal.Decimal("1.2345"),
+        "nothing": None,
+        "flag": True,
+        "nested": {"x": 1.5, "y": [1.25, "s"]},
+    }
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda obj: obj,
+        lambda obj: obj.update(price=10),
+        lambda obj: obj.update(price="free"),
+        lambda obj: obj.update(extra=1.555),
+        lambda obj: obj.pop("nothing"),
+        lambda obj: obj.update(nothing=1.555),
+        lambda obj: obj.update(geo=(1.555, 2.555)),
+        lambda obj: obj["items"].append({"price": 1.555}),
+        lambda obj: obj["items"][0].__dict__.update(price=[1.555]),
+    ],
+)
+def test_compile_is_round_object(change, use_copy):
+    round_record = r.compile(make_record(), 2, use_copy)
+    obj = make_record(3)
+    change(obj)
+    obj_copy = deepcopy(obj)
+    obj_rounded = round_record(obj)
+    expected = r.round_object(obj_copy, 2, use_copy)
+    assert repr(obj_rounded) == repr(expected)
+    assert repr(obj) == repr(obj_copy)
+    assert (obj_rounded is obj) is (expected is obj_copy)
+
+
+def test_compile_keeps_the_order_of_keys():
+    round_record = r.compile({"a": 1.25, "b": 2.25}, 1, use_copy=True)
+    obj_rounded = round_record({"b": 2.25, "a": 1.25})
+    assert list(obj_rounded.items()) == [("b", 2.2), ("a", 1.2)]
+
+
+def test_compile_from_schema():
+    import dataclasses
+    import typing
+
+    class Point(typing.NamedTuple):
+        lat: float
+        lon: float
+
+    @dataclasses.dataclass(frozen=True)
+    class Item:
+        name: str
+        price: float
+
+    class Record(typing.TypedDict):
+        id: int
+        point: Point
+        items: typing.List[Item]
+        note: typing.Optional[str]
+
+    obj = {
+        "id": 1,
+        "point": Point(1.25, 2.35),
+        "items": [Item("a", 1.55), {"price": 1.55}],
+        "note": 1.55,
+    }
+    expected = r.round_object(deepcopy(obj), 1)
+    assert r.compile(Record, 1)(obj) == expected
+    assert r.compile(typing.List[Record], 1)([deepcopy(obj)]) == [expected]
+    assert r.compile(Item, None, func=floor)(Item("a", 1.5)) == Item("a", 1)
+
+
+def test_compile_other_objects():
+    # nothing to compile: the result is a Rounder
+    assert isinstance(r.compile(1.5, 1), r.Rounder)
+    assert isinstance(r.compile([1.5, 2.5], 1), r.Rounder)
+    assert isinstance(r.compile(dict, 1), r.Rounder)
+    obj = {"a": 1.5}
+    obj["self"] = obj
+    round_record = r.compile(obj, 0)
+    assert round_record(obj) is obj and obj["a"] == 2
+
+
+def test_compile_errors_fall_back():
+    def fail_on_negative(x):
+        if x < 0:
+            raise ValueError(x)
+        return x * 2
+
+    convert = r.compile({"a": 1.5, "b": [2.5]}, None, func=fail_on_negative)
+    assert convert({"a": 1.5, "b": [2.5]}) == {"a": 3.0, "b": [5.0]}
+    obj = {"a": -1.5, "b": [2.5]}
+    assert convert(obj) is obj and obj == {"a": -1.5, "b": [2.5]}
+
+
+def test_star_import_keeps_builtin_compile():
+    namespace = {}
+    exec("from rounder import *", namespace)
+    assert "compile" not in namespace
+    assert "round_object" in namespace and "round_records" in namespace
+
+
+def make_records(n):
+    return [
+        {
+            "id": i,
+            "name": f"record {i}",
+            "x": i / 7,
+            "y": [1.5, 2, None, 2.675][i % 4],
+            "values": [i / 3],
+            "big": 10**20 + i,
+            "flag": i % 2 == 0,
+            "decimal": decimal.Decimal("1.2345"),
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+@pytest.mark.parametrize("digits", [-1, 0, 2])
+@pytest.mark.parametrize(
+    "records",
+    [
+        make_records(5),
+        make_records(3) + [{"id": 1.5}],
+        make_records(2) + [{"id": 1.5, "other": 2.5}],
+        [{"a": 1.55}, OrderedDict(a=1.55)],
+        ({"a": 1.55}, {"a": 2.55}),
+        [],
+        [{}],
+    ],
+)
+def test_round_records_is_round_object(records, digits, use_copy):
+    records_copy = deepcopy(records)
+    records_rounded = r.round_records(records, digits, use_copy)
+    expected = r.round_object(records_copy, digits, use_copy)
+    assert repr(records_rounded) == repr(expected)
+    assert repr(records) == repr(records_copy)
+    assert (records_rounded is records) is (expected is records_copy)
+
+
+def test_round_records_keeps_shared_values():
+    shared = [1.55]
+    records = [{"a": shared, "b": 1.55}, {"a": shared, "b": 2.55}]
+    records_rounded = r.round_records(records, 1, use_copy=True)
+    assert records_rounded[0]["a"] is records_rounded[1]["a"]
+    assert records_rounded[0]["a"] == [1.6] and shared == [1.55]
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_round_records_keeps_repeated_records(use_copy):
+    record = {"a": 1.55, "b": 1}
+    records = [record, {"a": 2.55, "b": 2}, record]
+    records_rounded = r.round_records(records, 1, use_copy)
+    assert records_rounded == r.round_object(deepcopy(records), 1, use_copy)
+    assert records_rounded[0] is records_rounded[2]
+    assert (records_rounded[0] is record) is not use_copy
+    assert records_rounded[0] == {"a": 1.6, "b": 1}
+
+
+def test_round_records_nested_records_go_to_round_object(monkeypatch):
+    calls = []
+    round_object = r.round_object
+
+    def spy(obj, *args):
+        calls.append(obj)
+        return round_object(obj, *args)
+
+    monkeypatch.setattr(r.rounder, "round_object", spy)
+    flat = [{"a": 1.55, "b": True, "c": decimal.Decimal("1.55")}]
+    assert r.round_records(flat, 1) == [
+        {"a": 1.6, "b": True, "c": decimal.Decimal("1.6")}
+    ]
+    assert calls == []
+    nested = [{"a": 1.55, "b": {"c": 2.55}}]
+    assert r.round_records(nested, 1) == [{"a": 1.6, "b": {"c": 2.5}}]
+    assert calls == [nested]
+
+
+def test_round_records_as_lists():
+    records = [{"a": 1.55, "b": "x"}, {"a": 2, "c": (2.55,)}]
+    columns = r.round_records(records, 1, output="lists")
+    assert columns == {"a": [1.6, 2], "b": ["x", None], "c": [None, (2.5,)]}
+    assert records == [{"a": 1.55, "b": "x"}, {"a": 2, "c": (2.55,)}]
+    assert r.round_records(iter(records), 0, output="lists")["a"] == [2.0, 2]
+    with pytest.raises(TypeError, match="mappings"):
+        r.round_records([(1.5, 2.5)], output="lists")
+    with pytest.raises(ValueError, match="output"):
+        r.round_records(records, output="columns")
@@ -0,0 +1,158 @@
+import decimal
+import fractions
+import math
+from collections import OrderedDict, defaultdict, namedtuple
+from copy import deepcopy
+
+import pytest
+
+import rounder as r
+import rounder.rounder as rounder_module
+
+speedups = pytest.importorskip("rounder._speedups")
+
+Point = namedtuple("Point", "x y")
+
+
+class Scores(list):
+    pass
+
+
+def make_objects():
+    shared = [1.55, 2.55]
+    cycle = {"value": 3.55}
+    cycle["self"] = cycle
+    looped = [0.15]
+    looped.append((looped, {0.25}))
+    nested = []
+    for _ in range(50):
+        nested = [nested, 1.15, {"x": (2.25,)}]
+    return [
+        1.2345,
+        17,
+        [],
+        (),
+        [1.2345, -2.5, 3, True, None, "text"],
+        (1.2345, [2.3456, (3.4567,)]),
+        {1.2345, 2.3456, "a"},
+        frozenset({1.2345, (2.3456, 3)}),
+        {"a": 1.2345, "b": {"c": [2.3456, {"d": 3.4567}]}, 5: (6.789,)},
+        [decimal.Decimal("1.2345"), fractions.Fraction(1, 3), 1.5 - 2.5j],
+        {"shared": shared, "again": shared, "tuple": (shared, shared)},
+        cycle,
+        looped,
+        nested,
+        [Point(1.2345, [2.3456]), Scores([3.4567, 4.5678])],
+        OrderedDict(a=1.2345, b=defaultdict(list, c=[2.3456])),
+        [[x / 7 for x in range(100)], {"floats": [x / 3 for x in range(10)]}],
+        range(3),
+        [math.inf, -math.inf, 0.0, -0.0],
+    ]
+
+
+def convert(rounder_args, obj, compiled, monkeypatch):
+    if not compiled:
+        monkeypatch.setattr(rounder_module, "_speedups", None)
+    rounder = r.Rounder(*rounder_args)
+    monkeypatch.undo()
+    result = rounder(obj)
+    if isinstance(result, map):
+        result = list(result)
+    return result
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+@pytest.mark.parametrize(
+    "func, digits",
+    [
+        (round, 2),
+        (round, None),
+        (r.signif, 3),
+        (math.floor, None),
+        (math.ceil, None),
+        (lambda x: x * 2, None),
+    ],
+)
+def test_backends_give_the_same_results(func, digits, use_copy, monkeypatch):
+    for index in range(len(make_objects())):
+        obj_pure = make_objects()[index]
+        obj_compiled = make_objects()[index]
+        args = (func, digits, use_copy)
+        expected = convert(args, obj_pure, False, monkeypatch)
+        result = convert(args, obj_compiled, True, monkeypatch)
+        assert repr(result) == repr(expected)
+        assert type(result) is type(expected)
+        # the original objects are changed (or not) in the same way
+        assert repr(obj_compiled) == repr(obj_pure)
+        assert (result is obj_compiled) is (expected is obj_pure)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_backends_keep_shared_references_and_cycles(compiled, monkeypatch):
+    objects = make_objects()
+    result = convert((round, 1, True), objects[10], compiled, monkeypatch)
+    assert result["shared"] is result["again"] is result["tuple"][0]
+    assert result["shared"] == [1.6, 2.5]
+    result = convert((round, 1, True), objects[11], compiled, monkeypatch)
+    assert result["self"] is result
+    result = convert((round, 1, True), objects[12], compiled, monkeypatch)
+    assert result[1][0] is result
+
+
+def test_compiled_converter_is_used():
+    rounder = r.Rounder(round, 1)
+    assert isinstance(rounder._convert, speedups.Converter)
+    stats_rounder = r.Rounder(round, 1, stats=r.RoundingStats())
+    assert not isinstance(stats_rounder._convert, speedups.Converter)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_backends_with_registered_list_subclass(
+    compiled, monkeypatch, registry
+):
+    class Prices(list):
+        pass
+
+    r.register_type(
+        Prices, lambda obj, convert, use_copy: [convert(x) * 10 for x in obj]
+    )
+    obj = {"prices": Prices([1.234]), "plain": [1.234]}
+    result = convert((round, 1, True), obj, compiled, monkeypatch)
+    assert result == {"prices": [12.0], "plain": [1.2]}
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_backends_with_deep_nesting(compiled, monkeypatch):
+    obj = []
+    for _ in range(10_000):
+        obj = [obj, 1.25]
+    result = convert((round, 1, True), obj, compiled, monkeypatch)
+    for _ in range(10_000):
+        assert result[1] == 1.2
+        result = result[0]
+    assert result == []
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_backends_return_object_after_error(compiled, monkeypatch):
+    def fail_on_negative(x):
+        if x < 0:
+            raise ValueError(x)
+        return x * 2
+
+    obj = (1.5, {"a": -1.0})
+    result = convert((fail_on_negative,), obj, compiled, monkeypatch)
+    assert result is obj
+
+
+def test_converter_wrong_arguments():
+    rounder = r.Rounder(round, 1)
+    with pytest.raises(TypeError):
+        rounder._convert([1.25])
+    with pytest.raises(TypeError):
+        rounder._convert([1.25], [])
+    with pytest.raises(ValueError):
+        speedups.Converter(
+            round, (1, 2), False, None, {}, None, None, None, None
+        )
+    assert deepcopy(rounder._convert([1.25], {})) == [1.2]
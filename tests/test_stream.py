@@ -0,0 +1,137 @@
+import io
+import json
+import random
+
+import pytest
+import rounder as r
+from rounder.__main__ import main
+from rounder.stream import round_json, round_json_chunks, round_json_text
+
+
+def random_document(depth=3):
+    if depth == 0 or random.random() < 0.3:
+        return random.choice(
+            [
+                random.uniform(-1e6, 1e6),
+                random.uniform(-1, 1) * 10 ** random.randint(-10, 10),
+                random.randint(-100_000, 100_000),
+                "text with \"quotes\", \\ and numbers 1.2345",
+                None,
+            ]
+        )
+    if random.random() < 0.5:
+        return [random_document(depth - 1) for _ in range(5)]
+    return {
+        f"key {i}.5": random_document(depth - 1) for i in range(5)
+    }
+
+
+def split(text, size):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize(
+    "method, digits, rounding",
+    [
+        ("round", 2, lambda obj: r.round_object(obj, 2, True)),
+        ("round", 0, lambda obj: r.round_object(obj, 0, True)),
+        ("signif", 3, lambda obj: r.signif_object(obj, 3, True)),
+        ("floor", 0, lambda obj: r.floor_object(obj, True)),
+        ("ceil", 0, lambda obj: r.ceil_object(obj, True)),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, 10_000])
+def test_same_as_round_object(method, digits, rounding, chunk_size):
+    for _ in range(10):
+        document = random_document()
+        for indent in (None, 2):
+            text = json.dumps(document, indent=indent)
+            rounded = "".join(
+                round_json_chunks(split(text, chunk_size), digits, method)
+            )
+            assert rounded == json.dumps(rounding(document), indent=indent)
+
+
+def test_round_json_text():
+    text = '{"a": -0.0, "b": [1E2, 2.5e-3, -12], "c\\\\": "1.55"}'
+    assert round_json_text(text, 1) == (
+        '{"a": -0.0, "b": [100.0, 0.0, -12], "c\\\\": "1.55"}'
+    )
+    with pytest.raises(ValueError, match="method"):
+        round_json_text(text, 1, method="truncate")
+
+
+@pytest.mark.parametrize("method", ["round", "signif", "floor", "ceil"])
+def test_numbers_out_of_float_range(method):
+    # kept as they are, as rounding them would give inf or raise
+    text = f'[1e400, -1.5E999, {"9" * 400}.5, 2.5]'
+    rounded = round_json_text(text, 1, method)
+    assert rounded.startswith(text[:-4])
+    assert json.loads(rounded)[-1] in (2, 2.5, 3)
+
+    big = "1" + "0" * 400
+    assert round_json_text(f"[{big}]", 2, "signif") == f"[{big}]"
+
+
+def test_round_json_files(tmp_path):
+    src = tmp_path / "input.json"
+    dst = tmp_path / "output.json"
+    document = [{"value": i / 7, "name": f"item {i}"} for i in range(1000)]
+    src.write_text(json.dumps(document))
+
+    round_json(src, dst, 3, chunk_size=100)
+    assert json.loads(dst.read_text()) == r.round_object(document, 3, True)
+
+    output = io.StringIO()
+    with open(src) as f:
+        round_json(f, output, 1, method="signif")
+    assert json.loads(output.getvalue()) == r.signif_object(document, 1)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_round_ndjson(tmp_path, workers):
+    src = tmp_path / "input.ndjson"
+    dst = tmp_path / "output.ndjson"
+    documents = [{"i": i, "value": i / 7} for i in range(2500)]
+    src.write_text("".join(json.dumps(d) + "\n" for d in documents))
+
+    round_json(src, dst, 2, ndjson=True, workers=workers, batch_size=100)
+    lines = dst.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == r.round_object(
+        documents, 2
+    )
+
+
+def test_workers_only_for_ndjson(tmp_path):
+    with pytest.raises(ValueError, match="NDJSON"):
+        round_json(io.StringIO("1.5"), io.StringIO(), workers=2)
+
+
+def test_cli(tmp_path, capsys):
+    src = tmp_path / "input.json"
+    src.write_text('{"a": [1.2345, 123456]}')
+    main([str(src), "-d", "2"])
+    assert capsys.readouterr().out == '{"a": [1.23, 123456]}'
+
+    dst = tmp_path / "output.json"
+    main([str(src), str(dst), "-m", "signif", "-d", "2"])
+    assert dst.read_text() == '{"a": [1.2, 120000]}'
+
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "missing.json")])
+
+
+def test_default_digits(tmp_path, capsys):
+    document = [123.4, 567.8, 0.01234, 2.5]
+    text = json.dumps(document)
+    assert json.loads(round_json_text(text, method="signif")) == (
+        r.signif_object(document, use_copy=True)
+    )
+    assert json.loads(round_json_text(text)) == (
+        r.round_object(document, use_copy=True)
+    )
+
+    src = tmp_path / "input.json"
+    src.write_text(text)
+    main([str(src), "--method", "signif"])
+    assert capsys.readouterr().out == "[123.0, 568.0, 0.0123, 2.5]"